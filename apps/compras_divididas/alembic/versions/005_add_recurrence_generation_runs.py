@@ -0,0 +1,100 @@
+"""Add recurrence generation run ledger table.
+
+Revision ID: 005_add_recurrence_generation_runs
+Revises: 004_add_recurrence_rules
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "005_add_recurrence_generation_runs"
+down_revision: str | None = "004_add_recurrence_rules"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+recurrence_generation_trigger_enum = sa.Enum(
+    "api",
+    "auto_generate",
+    "scheduler",
+    name="recurrence_generation_trigger",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "recurrence_generation_runs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("competence_month", sa.Date(), nullable=False),
+        sa.Column("trigger", recurrence_generation_trigger_enum, nullable=False),
+        sa.Column(
+            "dry_run",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("false"),
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("duration_ms", sa.Float(), nullable=False),
+        sa.Column("processed_rules", sa.Integer(), nullable=False),
+        sa.Column("generated_count", sa.Integer(), nullable=False),
+        sa.Column("ignored_count", sa.Integer(), nullable=False),
+        sa.Column("blocked_count", sa.Integer(), nullable=False),
+        sa.Column("failed_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "phase_timings_ms",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+        ),
+        sa.Column(
+            "slowest_rules",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.CheckConstraint(
+            "duration_ms >= 0",
+            name="ck_recurrence_generation_runs_duration_non_negative",
+        ),
+        sa.CheckConstraint(
+            "processed_rules >= 0",
+            name="ck_recurrence_generation_runs_processed_rules_non_negative",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_index(
+        "ix_recurrence_generation_runs_started_at",
+        "recurrence_generation_runs",
+        ["started_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_recurrence_generation_runs_competence_started_at",
+        "recurrence_generation_runs",
+        ["competence_month", "started_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_recurrence_generation_runs_competence_started_at",
+        table_name="recurrence_generation_runs",
+    )
+    op.drop_index(
+        "ix_recurrence_generation_runs_started_at",
+        table_name="recurrence_generation_runs",
+    )
+    op.drop_table("recurrence_generation_runs")
+
+    recurrence_generation_trigger_enum.drop(op.get_bind(), checkfirst=True)
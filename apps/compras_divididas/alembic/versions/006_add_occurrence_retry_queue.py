@@ -0,0 +1,39 @@
+"""Add retry scheduling column for failed recurrence occurrences.
+
+Revision ID: 006_add_occurrence_retry_queue
+Revises: 005_add_recurrence_generation_runs
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_add_occurrence_retry_queue"
+down_revision: str | None = "005_add_recurrence_generation_runs"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "recurrence_occurrences",
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_recurrence_occurrences_failed_next_attempt_at",
+        "recurrence_occurrences",
+        ["next_attempt_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'failed' AND next_attempt_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_recurrence_occurrences_failed_next_attempt_at",
+        table_name="recurrence_occurrences",
+    )
+    op.drop_column("recurrence_occurrences", "next_attempt_at")
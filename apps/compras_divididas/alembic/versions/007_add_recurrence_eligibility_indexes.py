@@ -0,0 +1,45 @@
+"""Add index-backed recurrence eligibility lookups.
+
+Revision ID: 007_add_recurrence_eligibility_indexes
+Revises: 006_add_occurrence_retry_queue
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007_add_recurrence_eligibility_indexes"
+down_revision: str | None = "006_add_occurrence_retry_queue"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_recurrence_rules_active_period",
+        "recurrence_rules",
+        [sa.text("daterange(start_competence_month, end_competence_month, '[]')")],
+        unique=False,
+        postgresql_using="gist",
+    )
+    op.create_index(
+        "ix_recurrence_rules_active_next_competence_month",
+        "recurrence_rules",
+        ["next_competence_month", "id"],
+        unique=False,
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_recurrence_rules_active_next_competence_month",
+        table_name="recurrence_rules",
+    )
+    op.drop_index(
+        "ix_recurrence_rules_active_period",
+        table_name="recurrence_rules",
+    )
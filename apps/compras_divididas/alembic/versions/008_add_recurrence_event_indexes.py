@@ -0,0 +1,55 @@
+"""Add query and retention indexes for recurrence events.
+
+Revision ID: 008_add_recurrence_event_indexes
+Revises: 007_add_recurrence_eligibility_indexes
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008_add_recurrence_event_indexes"
+down_revision: str | None = "007_add_recurrence_eligibility_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_recurrence_events_occurrence_created_at",
+        "recurrence_events",
+        ["recurrence_occurrence_id", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("recurrence_occurrence_id IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_recurrence_events_type_created_at",
+        "recurrence_events",
+        ["event_type", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_recurrence_events_created_at_brin",
+        "recurrence_events",
+        ["created_at"],
+        unique=False,
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_recurrence_events_created_at_brin",
+        table_name="recurrence_events",
+    )
+    op.drop_index(
+        "ix_recurrence_events_type_created_at",
+        table_name="recurrence_events",
+    )
+    op.drop_index(
+        "ix_recurrence_events_occurrence_created_at",
+        table_name="recurrence_events",
+    )
@@ -2,7 +2,13 @@
 set -eu
 
 if [ "${RUN_DB_MIGRATIONS:-true}" = "true" ]; then
-  alembic -c /app/apps/compras_divididas/alembic.ini upgrade head
+  python -m compras_divididas.cli migrate \
+    --alembic-ini /app/apps/compras_divididas/alembic.ini
+fi
+
+if [ "${API_PREFORK:-false}" = "true" ]; then
+  exec gunicorn compras_divididas.api.app:app \
+    --config python:compras_divididas.api.gunicorn_conf
 fi
 
 exec uvicorn compras_divididas.api.app:app \
@@ -2,16 +2,80 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-from fastapi import Depends, FastAPI, HTTPException, status
+import anyio.to_thread
+from fastapi import FastAPI, HTTPException, Request, status
 from sqlalchemy import text
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
 
+from compras_divididas.api.cancellation import CancelOnDisconnectMiddleware
 from compras_divididas.api.error_handlers import register_error_handlers
+from compras_divididas.api.load_shedding import (
+    ConcurrencyLimits,
+    LoadShedder,
+    LoadSheddingMiddleware,
+)
+from compras_divididas.api.read_routing import RecentWriteMiddleware
+from compras_divididas.api.readiness import ReadinessMonitor
 from compras_divididas.api.routes import v1_router
-from compras_divididas.db.session import get_db_session
+from compras_divididas.api.warmup import session_opener, warm_up_app
+from compras_divididas.core.settings import get_settings
+from compras_divididas.db.pool import pool_usage, resolve_thread_limit
+from compras_divididas.db.session import (
+    dispose_databases,
+    get_database,
+    get_read_database,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the engines for this worker, apply its thread limit and warm up.
+
+    The server only accepts requests, readiness probes included, once this
+    startup phase returns. A background pinger then keeps the readiness state.
+    """
+
+    settings = get_settings()
+    thread_limit = resolve_thread_limit(settings)
+    if thread_limit is not None:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = thread_limit
+    get_database()
+    get_read_database()
+    app.state.load_shedder = (
+        LoadShedder(ConcurrencyLimits.from_settings(settings))
+        if settings.api_load_shedding
+        else None
+    )
+    app.state.warmup_timings = {}
+    if settings.api_warmup:
+        app.state.warmup_timings = await warm_up_app(
+            app,
+            connections=min(settings.api_warmup_connections, settings.db_pool_size),
+            timeout_seconds=settings.api_warmup_timeout_seconds,
+        )
+
+    open_session = session_opener(app)
+
+    async def ping_database() -> None:
+        async with open_session() as session:
+            await session.execute(text("SELECT 1"))
+
+    readiness = ReadinessMonitor(
+        ping_database,
+        interval_seconds=settings.health_ping_interval_seconds,
+        timeout_seconds=settings.health_ping_timeout_seconds,
+        max_age_seconds=settings.health_ready_max_age_seconds,
+    )
+    await readiness.check_once()
+    readiness.start()
+    app.state.readiness = readiness
+    try:
+        yield
+    finally:
+        await readiness.stop()
+        await dispose_databases()
 
 
 def create_app() -> FastAPI:
@@ -20,25 +84,55 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="Compras Divididas API",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
     @app.get("/health/live", include_in_schema=False)
-    def health_live() -> dict[str, str]:
+    async def health_live() -> dict[str, str]:
         return {"status": "alive"}
 
     @app.get("/health/ready", include_in_schema=False)
-    def health_ready(
-        db_session: Annotated[Session, Depends(get_db_session)],
-    ) -> dict[str, str]:
-        try:
-            db_session.execute(text("SELECT 1"))
-        except SQLAlchemyError as exc:
+    async def health_ready(request: Request) -> dict[str, object]:
+        readiness: ReadinessMonitor = request.app.state.readiness
+        if not readiness.is_ready():
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Database is unavailable",
-            ) from exc
-        return {"status": "ready"}
+            )
+        settings = get_settings()
+        return {
+            "status": "ready",
+            **readiness.snapshot(),
+            **pool_usage(
+                get_database().engine.sync_engine.pool,
+                settings.db_pool_size + settings.db_max_overflow,
+            ),
+        }
+
+    @app.get("/health/pool", include_in_schema=False)
+    async def health_pool() -> dict[str, object]:
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        database = get_database()
+        payload: dict[str, object] = {
+            **database.pool_metrics.snapshot(database.engine.sync_engine.pool),
+            "thread_limit": limiter.total_tokens,
+            "threads_busy": limiter.borrowed_tokens,
+            "warmup_ms": app.state.warmup_timings,
+        }
+        load_shedder: LoadShedder | None = app.state.load_shedder
+        if load_shedder is not None:
+            payload["load_shedding"] = load_shedder.snapshot()
+        read_database = get_read_database()
+        if read_database is not None:
+            payload["read_pool"] = read_database.pool_metrics.snapshot(
+                read_database.engine.sync_engine.pool
+            )
+        return payload
 
+    app.add_middleware(RecentWriteMiddleware)
+    app.add_middleware(CancelOnDisconnectMiddleware)
+    # Added last so it runs first: shed requests never reach the other layers.
+    app.add_middleware(LoadSheddingMiddleware)
     register_error_handlers(app)
     app.include_router(v1_router)
     return app
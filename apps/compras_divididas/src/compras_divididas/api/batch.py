@@ -0,0 +1,42 @@
+"""Helpers for endpoints that process many items per request."""
+
+from __future__ import annotations
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+
+from compras_divididas.api.error_handlers import translate_integrity_error
+from compras_divididas.domain.errors import (
+    DomainError,
+    InvalidRequestError,
+    compose_error_message,
+)
+
+MAX_BATCH_ITEMS = 100
+
+BATCH_ITEM_ERRORS = (DomainError, IntegrityError, ValidationError)
+
+
+def batch_item_error(
+    exc: DomainError | IntegrityError | ValidationError,
+) -> DomainError:
+    """Return the contract error reported for one rejected batch item.
+
+    Services commit or roll back each item on their own, so one rejected item
+    leaves the items before and after it untouched. Batch payloads carry raw
+    items that are validated one by one, so a malformed item fails on its own
+    as `INVALID_REQUEST` instead of rejecting the whole batch.
+    """
+
+    if isinstance(exc, IntegrityError):
+        return translate_integrity_error(exc)
+    if isinstance(exc, ValidationError):
+        return InvalidRequestError(
+            message=compose_error_message(
+                cause="Batch item validation failed.",
+                action="Fix the invalid fields and send the item again.",
+            ),
+            details={"errors": jsonable_encoder(exc.errors())},
+        )
+    return exc
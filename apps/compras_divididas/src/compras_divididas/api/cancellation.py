@@ -0,0 +1,78 @@
+"""Cancel request handlers whose HTTP client has gone away."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class CancelOnDisconnectMiddleware:
+    """Runs each HTTP request in a task that is cancelled on client disconnect.
+
+    Without it a handler keeps running, and keeps its pooled connection, until
+    its queries finish even though nobody will read the response. Cancelling
+    the task interrupts the database call being awaited: psycopg sends a
+    cancel request to the server and the session gives its connection back.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # The watcher owns `receive`; the handler reads the same messages
+        # through this queue, so its request body is unaffected.
+        messages: asyncio.Queue[Message] = asyncio.Queue()
+
+        async def watch_client() -> None:
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    return
+
+        response_complete = False
+
+        async def send_tracked(message: Message) -> None:
+            nonlocal response_complete
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                response_complete = True
+
+        async def run_handler() -> None:
+            await self.app(scope, messages.get, send_tracked)
+
+        handler = asyncio.create_task(run_handler())
+        watcher = asyncio.create_task(watch_client())
+        try:
+            await asyncio.wait({handler, watcher}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            handler.cancel()
+            watcher.cancel()
+            raise
+
+        watcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await watcher
+        # Servers also report a disconnect once the response is sent; the
+        # handler may still be finishing then (cleanup, background tasks).
+        if not handler.done() and not response_complete:
+            handler.cancel()
+            logger.info(
+                "request_cancelled_on_disconnect",
+                extra={"method": scope["method"], "path": scope["path"]},
+            )
+            with contextlib.suppress(asyncio.CancelledError):
+                await handler
+            return
+        await handler
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import Depends
-from sqlalchemy.orm import Session
+from fastapi import Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from compras_divididas.api.read_routing import get_read_db_session
+from compras_divididas.core.settings import get_settings
 from compras_divididas.db.session import get_db_session
+from compras_divididas.db.timeouts import QueryTimeouts, use_query_timeouts
 from compras_divididas.repositories.movement_query_repository import (
     MovementQueryRepository,
 )
@@ -23,8 +26,20 @@ from compras_divididas.services.recurrence_generation_service import (
 from compras_divididas.services.recurrence_service import RecurrenceService
 
 
-def get_movement_service(
-    session: Annotated[Session, Depends(get_db_session)],
+async def use_long_query_timeouts() -> None:
+    """Give aggregate and generation routes the longer statement timeout."""
+
+    settings = get_settings()
+    use_query_timeouts(
+        QueryTimeouts(
+            statement_ms=settings.db_long_statement_timeout_ms,
+            lock_ms=settings.db_lock_timeout_ms,
+        )
+    )
+
+
+async def get_movement_service(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> MovementService:
     """Build movement service with per-request session."""
 
@@ -37,65 +52,64 @@ def get_movement_service(
     )
 
 
-def get_movement_query_repository(
-    session: Annotated[Session, Depends(get_db_session)],
+async def get_movement_query_repository(
+    session: Annotated[AsyncSession, Depends(get_read_db_session)],
 ) -> MovementQueryRepository:
-    """Build movement query repository with per-request session."""
+    """Build movement query repository with per-request read session."""
 
     return MovementQueryRepository(session)
 
 
-def get_participant_repository(
-    session: Annotated[Session, Depends(get_db_session)],
+async def get_participant_repository(
+    session: Annotated[AsyncSession, Depends(get_read_db_session)],
 ) -> ParticipantRepository:
-    """Build participant repository with per-request session."""
+    """Build participant repository with per-request read session."""
 
     return ParticipantRepository(session)
 
 
-def get_monthly_summary_service(
-    session: Annotated[Session, Depends(get_db_session)],
+async def get_monthly_summary_service(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    read_session: Annotated[AsyncSession, Depends(get_read_db_session)],
+    auto_generate: Annotated[bool, Query()] = False,
 ) -> MonthlySummaryService:
-    """Build monthly summary service with query/participant repositories."""
+    """Build monthly summary service with query/participant repositories.
+
+    Auto-generation writes before aggregating, so it reads from the primary.
+    """
 
+    query_session = session if auto_generate else read_session
     recurrence_generation_service = RecurrenceGenerationService(
         recurrence_repository=RecurrenceRepository(session),
         session=session,
     )
     return MonthlySummaryService(
-        participant_repository=ParticipantRepository(session),
-        movement_query_repository=MovementQueryRepository(session),
+        participant_repository=ParticipantRepository(query_session),
+        movement_query_repository=MovementQueryRepository(query_session),
         recurrence_generation_service=recurrence_generation_service,
     )
 
 
-def get_monthly_report_service(
-    session: Annotated[Session, Depends(get_db_session)],
+async def get_monthly_report_service(
+    summary_service: Annotated[
+        MonthlySummaryService, Depends(get_monthly_summary_service)
+    ],
 ) -> MonthlyReportService:
     """Build monthly report service reusing summary aggregation service."""
 
-    recurrence_generation_service = RecurrenceGenerationService(
-        recurrence_repository=RecurrenceRepository(session),
-        session=session,
-    )
-    summary_service = MonthlySummaryService(
-        participant_repository=ParticipantRepository(session),
-        movement_query_repository=MovementQueryRepository(session),
-        recurrence_generation_service=recurrence_generation_service,
-    )
     return MonthlyReportService(monthly_summary_service=summary_service)
 
 
-def get_recurrence_repository(
-    session: Annotated[Session, Depends(get_db_session)],
+async def get_recurrence_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> RecurrenceRepository:
     """Build recurrence repository with per-request session."""
 
     return RecurrenceRepository(session)
 
 
-def get_recurrence_service(
-    session: Annotated[Session, Depends(get_db_session)],
+async def get_recurrence_service(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> RecurrenceService:
     """Build recurrence service with per-request session."""
 
@@ -106,8 +120,20 @@ def get_recurrence_service(
     )
 
 
-def get_recurrence_generation_service(
-    session: Annotated[Session, Depends(get_db_session)],
+async def get_recurrence_read_service(
+    session: Annotated[AsyncSession, Depends(get_read_db_session)],
+) -> RecurrenceService:
+    """Build recurrence service on the read session for list endpoints."""
+
+    return RecurrenceService(
+        recurrence_repository=RecurrenceRepository(session),
+        participant_repository=ParticipantRepository(session),
+        session=session,
+    )
+
+
+async def get_recurrence_generation_service(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> RecurrenceGenerationService:
     """Build recurrence generation service."""
 
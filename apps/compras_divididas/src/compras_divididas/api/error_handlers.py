@@ -9,16 +9,23 @@ from fastapi import FastAPI, Request
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, OperationalError
 
 from compras_divididas.domain.errors import (
     DomainError,
     DuplicateExternalIDError,
     DuplicateRecurrenceOccurrenceError,
+    QueryTimeoutError,
     RecurrenceMovementAlreadyLinkedError,
     compose_error_message,
 )
 
+# SQLSTATEs raised by PostgreSQL when statement_timeout or lock_timeout fires.
+QUERY_TIMEOUT_SQLSTATES = {
+    "57014": "statement_timeout",
+    "55P03": "lock_timeout",
+}
+
 
 def _error_payload(code: str, message: str, details: dict[str, Any]) -> dict[str, Any]:
     payload: dict[str, Any] = {
@@ -30,15 +37,24 @@ def _error_payload(code: str, message: str, details: dict[str, Any]) -> dict[str
     return payload
 
 
-async def handle_domain_error(_: Request, exc: DomainError) -> JSONResponse:
-    """Serialize domain error to contract-compliant response."""
+def domain_error_response(
+    exc: DomainError, headers: dict[str, str] | None = None
+) -> JSONResponse:
+    """Build the contract response for a domain error."""
 
     return JSONResponse(
         status_code=exc.status_code,
         content=_error_payload(exc.code, exc.message, exc.details),
+        headers=headers,
     )
 
 
+async def handle_domain_error(_: Request, exc: DomainError) -> JSONResponse:
+    """Serialize domain error to contract-compliant response."""
+
+    return domain_error_response(exc)
+
+
 async def handle_validation_error(
     _: Request, exc: RequestValidationError
 ) -> JSONResponse:
@@ -57,12 +73,12 @@ async def handle_validation_error(
     )
 
 
-async def handle_integrity_error(_: Request, exc: IntegrityError) -> JSONResponse:
-    """Translate persistence integrity errors to domain-compatible responses."""
+def translate_integrity_error(exc: IntegrityError) -> DomainError:
+    """Map a persistence integrity error to the matching domain error."""
 
     error_text = str(exc.orig)
     if "uq_financial_movements_competence_payer_external_id" in error_text:
-        duplicate_error = DuplicateExternalIDError(
+        return DuplicateExternalIDError(
             message=compose_error_message(
                 cause=(
                     "external_id is already used for this participant "
@@ -71,17 +87,9 @@ async def handle_integrity_error(_: Request, exc: IntegrityError) -> JSONRespons
                 action="Use a unique external_id or omit this field.",
             )
         )
-        return JSONResponse(
-            status_code=duplicate_error.status_code,
-            content=_error_payload(
-                duplicate_error.code,
-                duplicate_error.message,
-                duplicate_error.details,
-            ),
-        )
 
     if "uq_recurrence_occurrences_rule_competence" in error_text:
-        duplicate_occurrence_error = DuplicateRecurrenceOccurrenceError(
+        return DuplicateRecurrenceOccurrenceError(
             message=compose_error_message(
                 cause=(
                     "An occurrence already exists for this recurrence and competence."
@@ -92,17 +100,9 @@ async def handle_integrity_error(_: Request, exc: IntegrityError) -> JSONRespons
                 ),
             )
         )
-        return JSONResponse(
-            status_code=duplicate_occurrence_error.status_code,
-            content=_error_payload(
-                duplicate_occurrence_error.code,
-                duplicate_occurrence_error.message,
-                duplicate_occurrence_error.details,
-            ),
-        )
 
     if "uq_recurrence_occurrences_movement_id" in error_text:
-        movement_link_error = RecurrenceMovementAlreadyLinkedError(
+        return RecurrenceMovementAlreadyLinkedError(
             message=compose_error_message(
                 cause="Movement is already linked to another recurrence occurrence.",
                 action=(
@@ -110,28 +110,51 @@ async def handle_integrity_error(_: Request, exc: IntegrityError) -> JSONRespons
                 ),
             )
         )
-        return JSONResponse(
-            status_code=movement_link_error.status_code,
-            content=_error_payload(
-                movement_link_error.code,
-                movement_link_error.message,
-                movement_link_error.details,
-            ),
-        )
 
-    return JSONResponse(
+    return DomainError(
+        code="PERSISTENCE_ERROR",
+        message=compose_error_message(
+            cause="A persistence constraint was violated.",
+            action="Review request data consistency and retry.",
+        ),
         status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+    )
+
+
+async def handle_integrity_error(_: Request, exc: IntegrityError) -> JSONResponse:
+    """Translate persistence integrity errors to domain-compatible responses."""
+
+    domain_error = translate_integrity_error(exc)
+    return JSONResponse(
+        status_code=domain_error.status_code,
         content=_error_payload(
-            code="PERSISTENCE_ERROR",
-            message=compose_error_message(
-                cause="A persistence constraint was violated.",
-                action="Review request data consistency and retry.",
-            ),
-            details={},
+            domain_error.code,
+            domain_error.message,
+            domain_error.details,
         ),
     )
 
 
+def translate_operational_error(exc: OperationalError) -> DomainError | None:
+    """Map a database timeout to `QueryTimeoutError`, or None for other errors."""
+
+    timeout = QUERY_TIMEOUT_SQLSTATES.get(str(getattr(exc.orig, "sqlstate", "")))
+    if timeout is None:
+        return None
+    return QueryTimeoutError(details={"timeout": timeout})
+
+
+async def handle_operational_error(
+    request: Request, exc: OperationalError
+) -> JSONResponse:
+    """Answer database timeouts with 503; other failures stay internal errors."""
+
+    domain_error = translate_operational_error(exc)
+    if domain_error is None:
+        return await handle_unexpected_error(request, exc)
+    return await handle_domain_error(request, domain_error)
+
+
 async def handle_unexpected_error(_: Request, exc: Exception) -> JSONResponse:
     """Serialize unexpected failures with generic message."""
 
@@ -156,4 +179,5 @@ def register_error_handlers(app: FastAPI) -> None:
         RequestValidationError, cast(Any, handle_validation_error)
     )
     app.add_exception_handler(IntegrityError, cast(Any, handle_integrity_error))
+    app.add_exception_handler(OperationalError, cast(Any, handle_operational_error))
     app.add_exception_handler(Exception, handle_unexpected_error)
@@ -0,0 +1,42 @@
+"""Gunicorn settings for the pre-fork API server.
+
+The master imports and warms the app once (`preload_app`), then forks
+uvicorn workers that share those pages copy-on-write:
+
+    gunicorn -c python:compras_divididas.api.gunicorn_conf compras_divididas.api.app:app
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+from typing import Any
+
+bind = "0.0.0.0:8000"
+workers = int(os.environ.get("API_WORKERS", "2"))
+worker_class = "uvicorn_worker.UvicornWorker"
+loglevel = os.environ.get("API_LOG_LEVEL", "info")
+forwarded_allow_ips = os.environ.get("FORWARDED_ALLOW_IPS", "*")
+preload_app = True
+
+
+def when_ready(server: Any) -> None:
+    """Warm the preloaded app in the master before any worker is forked."""
+
+    from compras_divididas.api.app import app
+
+    # Build the OpenAPI schema once instead of on each worker's first /docs.
+    app.openapi()
+    # Move everything allocated so far out of the GC's reach so collections
+    # in the workers do not touch, and thereby copy, the shared pages.
+    gc.collect()
+    gc.freeze()
+    server.log.info("Preloaded app warmed; forking %s workers", workers)
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """Give each worker its own database pools."""
+
+    from compras_divididas.db.session import reset_databases_after_fork
+
+    reset_databases_after_fork()
@@ -0,0 +1,154 @@
+"""Per-route-class concurrency limits that shed excess requests with 503."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from compras_divididas.api.error_handlers import domain_error_response
+from compras_divididas.core.settings import Settings
+from compras_divididas.domain.errors import ServiceOverloadedError
+
+logger = logging.getLogger(__name__)
+
+MOVEMENT_WRITES = "movement_writes"
+WRITES = "writes"
+GENERATION = "generation"
+SUMMARIES = "summaries"
+LISTS = "lists"
+
+_MOVEMENT_WRITE_PATHS = frozenset({"/v1/movements", "/v1/movements/batch"})
+_GENERATION_PATHS = frozenset({"/v1/recurrences/failed-occurrences/retry"})
+
+
+def route_class(method: str, path: str) -> str | None:
+    """Classify a request by cost; None leaves it unlimited (health, docs)."""
+
+    if not path.startswith("/v1/"):
+        return None
+    path = path.rstrip("/")
+    if method == "GET":
+        if path.startswith("/v1/months/") and path.endswith(("/summary", "/report")):
+            return SUMMARIES
+        return LISTS
+    if method == "POST" and path in _MOVEMENT_WRITE_PATHS:
+        return MOVEMENT_WRITES
+    if path in _GENERATION_PATHS or path.endswith("/recurrences/generate"):
+        return GENERATION
+    return WRITES
+
+
+@dataclass(frozen=True, slots=True)
+class ConcurrencyLimits:
+    """In-flight request limits of one worker.
+
+    Movement writes are capped only by `max_in_flight`. Every other class
+    has its own cap and may only use `max_in_flight - priority_reserve`
+    slots in total, so the reserve stays free for movement writes.
+    """
+
+    max_in_flight: int
+    priority_reserve: int
+    per_class: dict[str, int]
+    retry_after_seconds: int
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> ConcurrencyLimits:
+        return cls(
+            max_in_flight=settings.api_max_in_flight
+            or settings.db_pool_size + settings.db_max_overflow,
+            priority_reserve=settings.api_priority_reserve,
+            per_class={
+                WRITES: settings.api_write_concurrency,
+                GENERATION: settings.api_generation_concurrency,
+                SUMMARIES: settings.api_summary_concurrency,
+                LISTS: settings.api_list_concurrency,
+            },
+            retry_after_seconds=settings.api_shed_retry_after_seconds,
+        )
+
+
+class LoadShedder:
+    """Admits or rejects requests against `ConcurrencyLimits`.
+
+    Counters are per worker and only touched from the event loop, so they
+    need no lock. Rejection is immediate: a shed request never queues.
+    """
+
+    def __init__(self, limits: ConcurrencyLimits) -> None:
+        self.limits = limits
+        self._in_flight_total = 0
+        self._in_flight: dict[str, int] = {}
+        self._shed: dict[str, int] = {}
+
+    def try_acquire(self, request_class: str) -> bool:
+        limits = self.limits
+        if request_class == MOVEMENT_WRITES:
+            capacity = class_limit = limits.max_in_flight
+        else:
+            capacity = limits.max_in_flight - limits.priority_reserve
+            class_limit = limits.per_class[request_class]
+        admitted = (
+            self._in_flight_total < capacity
+            and self._in_flight.get(request_class, 0) < class_limit
+        )
+        if not admitted:
+            self._shed[request_class] = self._shed.get(request_class, 0) + 1
+            return False
+        self._in_flight_total += 1
+        self._in_flight[request_class] = self._in_flight.get(request_class, 0) + 1
+        return True
+
+    def release(self, request_class: str) -> None:
+        self._in_flight_total -= 1
+        self._in_flight[request_class] -= 1
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "in_flight": self._in_flight_total,
+            "max_in_flight": self.limits.max_in_flight,
+            "in_flight_by_class": dict(self._in_flight),
+            "shed_by_class": dict(self._shed),
+        }
+
+
+class LoadSheddingMiddleware:
+    """Rejects requests over their class limit with 503 and `Retry-After`.
+
+    The shedder lives in `app.state.load_shedder`, built by the lifespan;
+    without one every request is admitted.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        shedder: LoadShedder | None = getattr(scope["app"].state, "load_shedder", None)
+        request_class = route_class(scope["method"], scope["path"])
+        if shedder is None or request_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not shedder.try_acquire(request_class):
+            logger.warning(
+                "request_shed",
+                extra={"route_class": request_class, "path": scope["path"]},
+            )
+            retry_after = shedder.limits.retry_after_seconds
+            response = domain_error_response(
+                ServiceOverloadedError(details={"route_class": request_class}),
+                headers={"Retry-After": str(retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            shedder.release(request_class)
@@ -0,0 +1,56 @@
+"""Sparse field projection for read endpoints (`?fields=a,b,c`)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from compras_divididas.domain.errors import InvalidRequestError, compose_error_message
+
+
+def parse_fields(raw: str | None, *, allowed: Iterable[str]) -> frozenset[str] | None:
+    """Parse a comma-separated field list, rejecting unknown names."""
+
+    if raw is None:
+        return None
+
+    requested = frozenset(name.strip() for name in raw.split(",") if name.strip())
+    allowed_names = frozenset(allowed)
+    unknown = sorted(requested - allowed_names)
+    if not requested or unknown:
+        raise InvalidRequestError(
+            message=compose_error_message(
+                cause="fields must list known response fields separated by commas.",
+                action="Remove unknown names or omit fields to get every field.",
+            ),
+            details={
+                "unknown_fields": unknown,
+                "allowed_fields": sorted(allowed_names),
+            },
+        )
+    return requested
+
+
+def project_response(
+    response: BaseModel,
+    fields: frozenset[str],
+    *,
+    items_key: str | None = None,
+) -> JSONResponse:
+    """Keep only selected fields, on each list item when `items_key` is set.
+
+    Pagination envelopes (`total`, `limit`, `offset`) are always kept.
+    """
+
+    content: dict[str, Any] = response.model_dump(mode="json")
+    if items_key is None:
+        content = {name: value for name, value in content.items() if name in fields}
+    else:
+        content[items_key] = [
+            {name: value for name, value in item.items() if name in fields}
+            for item in content[items_key]
+        ]
+    return JSONResponse(content=content)
@@ -0,0 +1,87 @@
+"""Routing of read-only endpoints to the optional read replica."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+from http.cookies import SimpleCookie
+from typing import Annotated
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from compras_divididas.core.settings import get_settings
+from compras_divididas.db.session import get_db_session, get_read_database
+
+READ_CONSISTENCY_HEADER = "x-read-consistency"
+RECENT_WRITE_COOKIE = "cd_recent_write"
+
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def prefers_primary(request: Request) -> bool:
+    """Tell whether a read must see this client's latest writes.
+
+    Clients ask for it with `X-Read-Consistency: primary`, and the cookie set
+    by `RecentWriteMiddleware` does it for a short window after each write.
+    """
+
+    if request.headers.get(READ_CONSISTENCY_HEADER, "").lower() == "primary":
+        return True
+    return RECENT_WRITE_COOKIE in request.cookies
+
+
+async def get_read_db_session(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Yield a replica session, or the primary one when reads must be fresh.
+
+    The primary session comes from `get_db_session` so it opens no connection
+    unless it is the one used.
+    """
+
+    read_database = get_read_database()
+    if read_database is None or prefers_primary(request):
+        yield session
+        return
+
+    async with read_database.session_factory() as read_session:
+        yield read_session
+
+
+class RecentWriteMiddleware:
+    """Pin the client's reads to the primary for a while after a write."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        window_seconds = get_settings().db_read_your_writes_seconds
+        if (
+            scope["type"] != "http"
+            or window_seconds <= 0
+            or scope["method"] in _SAFE_METHODS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = MutableHeaders(scope=message)
+                headers.append("set-cookie", _recent_write_cookie(window_seconds))
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+def _recent_write_cookie(max_age: int) -> str:
+    cookie: SimpleCookie = SimpleCookie()
+    cookie[RECENT_WRITE_COOKIE] = "1"
+    morsel = cookie[RECENT_WRITE_COOKIE]
+    morsel["max-age"] = max_age
+    morsel["path"] = "/"
+    morsel["httponly"] = True
+    morsel["samesite"] = "lax"
+    return morsel.OutputString()
@@ -0,0 +1,90 @@
+"""Background database pinger backing the readiness probe."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessMonitor:
+    """Pings the database on a fixed interval and keeps the last outcome.
+
+    Readiness probes read this state instead of checking out a connection,
+    so they cost no database work and do not compete with requests for the
+    pool. The worker stays ready while the last successful ping is younger
+    than `max_age_seconds`, which absorbs a single slow or failed ping.
+    """
+
+    def __init__(
+        self,
+        ping: Callable[[], Awaitable[None]],
+        *,
+        interval_seconds: float,
+        timeout_seconds: float,
+        max_age_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ping = ping
+        self._interval_seconds = interval_seconds
+        self._timeout_seconds = timeout_seconds
+        self._max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._last_success_at: float | None = None
+        self._consecutive_failures = 0
+        self._last_error: str | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def check_once(self) -> None:
+        try:
+            await asyncio.wait_for(self._ping(), timeout=self._timeout_seconds)
+        except Exception as exc:
+            self._consecutive_failures += 1
+            self._last_error = type(exc).__name__
+            logger.warning(
+                "readiness_ping_failed",
+                extra={"consecutive_failures": self._consecutive_failures},
+                exc_info=True,
+            )
+        else:
+            self._last_success_at = self._clock()
+            self._consecutive_failures = 0
+            self._last_error = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def last_success_age(self) -> float | None:
+        if self._last_success_at is None:
+            return None
+        return self._clock() - self._last_success_at
+
+    def is_ready(self) -> bool:
+        age = self.last_success_age()
+        return age is not None and age <= self._max_age_seconds
+
+    def snapshot(self) -> dict[str, object]:
+        age = self.last_success_age()
+        return {
+            "last_success_age_seconds": round(age, 3) if age is not None else None,
+            "consecutive_failures": self._consecutive_failures,
+            "last_error": self._last_error,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval_seconds)
+            await self.check_once()
@@ -5,11 +5,14 @@ from __future__ import annotations
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Path, Query, Request
+from fastapi.responses import JSONResponse
 
 from compras_divididas.api.dependencies import (
     get_monthly_report_service,
     get_monthly_summary_service,
+    use_long_query_timeouts,
 )
+from compras_divididas.api.projection import parse_fields, project_response
 from compras_divididas.api.schemas.monthly_summary import MonthlySummaryResponse
 from compras_divididas.services.monthly_report_service import MonthlyReportService
 from compras_divididas.services.monthly_summary_service import MonthlySummaryService
@@ -17,33 +20,53 @@ from compras_divididas.services.monthly_summary_service import MonthlySummarySer
 router = APIRouter(prefix="/months", tags=["Monthly Reports"])
 
 
-@router.get("/{year}/{month}/summary", response_model=MonthlySummaryResponse)
-def get_monthly_summary(
+@router.get(
+    "/{year}/{month}/summary",
+    response_model=MonthlySummaryResponse,
+    dependencies=[Depends(use_long_query_timeouts)],
+)
+async def get_monthly_summary(
     year: Annotated[int, Path(ge=2000, le=2100)],
     month: Annotated[int, Path(ge=1, le=12)],
     service: Annotated[MonthlySummaryService, Depends(get_monthly_summary_service)],
     auto_generate: Annotated[bool, Query()] = False,
-) -> MonthlySummaryResponse:
+    fields: Annotated[str | None, Query(max_length=500)] = None,
+) -> MonthlySummaryResponse | JSONResponse:
     """Return consolidated monthly partial summary."""
 
-    summary = service.get_summary(year=year, month=month, auto_generate=auto_generate)
-    return MonthlySummaryResponse.from_projection(summary)
+    selected_fields = parse_fields(fields, allowed=MonthlySummaryResponse.model_fields)
+    summary = await service.get_summary(
+        year=year, month=month, auto_generate=auto_generate
+    )
+    response = MonthlySummaryResponse.from_projection(summary)
+    if selected_fields is None:
+        return response
+    return project_response(response, selected_fields)
 
 
-@router.get("/{year}/{month}/report", response_model=MonthlySummaryResponse)
-def get_monthly_report(
+@router.get(
+    "/{year}/{month}/report",
+    response_model=MonthlySummaryResponse,
+    dependencies=[Depends(use_long_query_timeouts)],
+)
+async def get_monthly_report(
     year: Annotated[int, Path(ge=2000, le=2100)],
     month: Annotated[int, Path(ge=1, le=12)],
     request: Request,
     service: Annotated[MonthlyReportService, Depends(get_monthly_report_service)],
     auto_generate: Annotated[bool, Query()] = False,
-) -> MonthlySummaryResponse:
+    fields: Annotated[str | None, Query(max_length=500)] = None,
+) -> MonthlySummaryResponse | JSONResponse:
     """Return consolidated monthly report generated on demand."""
 
-    summary = service.get_report(
+    selected_fields = parse_fields(fields, allowed=MonthlySummaryResponse.model_fields)
+    summary = await service.get_report(
         year=year,
         month=month,
         request_id=request.headers.get("x-request-id"),
         auto_generate=auto_generate,
     )
-    return MonthlySummaryResponse.from_projection(summary)
+    response = MonthlySummaryResponse.from_projection(summary)
+    if selected_fields is None:
+        return response
+    return project_response(response, selected_fields)
@@ -7,18 +7,26 @@ from decimal import Decimal
 from typing import Annotated, Literal
 
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import JSONResponse
 
+from compras_divididas.api.batch import BATCH_ITEM_ERRORS, batch_item_error
 from compras_divididas.api.dependencies import (
     get_movement_query_repository,
     get_movement_service,
 )
+from compras_divididas.api.projection import parse_fields, project_response
 from compras_divididas.api.schemas.movement_list import MovementListResponse
 from compras_divididas.api.schemas.movements import (
+    CreateMovementBatchRequest,
     CreateMovementRequest,
+    MovementBatchResponse,
     MovementResponse,
 )
 from compras_divididas.api.schemas.participants import PARTICIPANT_ID_ENUM
-from compras_divididas.db.models.financial_movement import MovementType
+from compras_divididas.db.models.financial_movement import (
+    MovementType,
+)
+from compras_divididas.domain.errors import DomainError
 from compras_divididas.repositories.movement_query_repository import (
     MovementQueryFilters,
     MovementQueryRepository,
@@ -38,7 +46,7 @@ router = APIRouter(prefix="/movements", tags=["Movements"])
         400: {"description": "Filtros invalidos"},
     },
 )
-def list_movements(
+async def list_movements(
     year: Annotated[int, Query(ge=2000, le=2100)],
     month: Annotated[int, Query(ge=1, le=12)],
     query_repository: Annotated[
@@ -55,9 +63,11 @@ def list_movements(
     external_id: Annotated[str | None, Query(max_length=120)] = None,
     limit: Annotated[int, Query(ge=1, le=200)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
-) -> MovementListResponse:
+    fields: Annotated[str | None, Query(max_length=500)] = None,
+) -> MovementListResponse | JSONResponse:
     """List monthly movements with optional filters and pagination."""
 
+    selected_fields = parse_fields(fields, allowed=MovementResponse.model_fields)
     filters = MovementQueryFilters(
         competence_month=date(year=year, month=month, day=1),
         movement_type=MovementType(type) if type else None,
@@ -68,13 +78,16 @@ def list_movements(
         limit=limit,
         offset=offset,
     )
-    items, total = query_repository.list_movements(filters)
-    return MovementListResponse.from_models(
+    items, total = await query_repository.list_movements(filters)
+    response = MovementListResponse.from_models(
         items=items,
         total=total,
         limit=limit,
         offset=offset,
     )
+    if selected_fields is None:
+        return response
+    return project_response(response, selected_fields, items_key="items")
 
 
 @router.post(
@@ -88,23 +101,54 @@ def list_movements(
         422: {"description": "Regra de negocio violada"},
     },
 )
-def create_movement(
+async def create_movement(
     payload: CreateMovementRequest,
     service: Annotated[MovementService, Depends(get_movement_service)],
 ) -> MovementResponse:
     """Register a purchase or refund movement in append-only mode."""
 
-    movement = service.create_movement(
-        CreateMovementInput(
-            movement_type=MovementType(payload.type),
-            amount=Decimal(payload.amount),
-            description=payload.description,
-            occurred_at=payload.occurred_at,
-            payer_participant_id=payload.payer_participant_id,
-            requested_by_participant_id=payload.requested_by_participant_id,
-            external_id=payload.external_id,
-            original_purchase_id=payload.original_purchase_id,
-            original_purchase_external_id=payload.original_purchase_external_id,
-        )
-    )
+    movement = await service.create_movement(_to_create_movement_input(payload))
     return MovementResponse.from_model(movement)
+
+
+@router.post(
+    "/batch",
+    response_model=MovementBatchResponse,
+    responses={
+        400: {"description": "Payload invalido"},
+    },
+)
+async def create_movements_batch(
+    payload: CreateMovementBatchRequest,
+    service: Annotated[MovementService, Depends(get_movement_service)],
+) -> MovementBatchResponse:
+    """Register several movements, reporting one outcome per item.
+
+    Items are committed one by one in request order, so a refund may reference a
+    purchase created earlier in the same batch.
+    """
+
+    outcomes: list[MovementResponse | DomainError] = []
+    for item in payload.items:
+        try:
+            request = CreateMovementRequest.model_validate(item)
+            movement = await service.create_movement(_to_create_movement_input(request))
+            # Serialized right away: a later item's rollback expires this instance.
+            outcomes.append(MovementResponse.from_model(movement))
+        except BATCH_ITEM_ERRORS as exc:
+            outcomes.append(batch_item_error(exc))
+    return MovementBatchResponse.from_outcomes(outcomes)
+
+
+def _to_create_movement_input(payload: CreateMovementRequest) -> CreateMovementInput:
+    return CreateMovementInput(
+        movement_type=MovementType(payload.type),
+        amount=Decimal(payload.amount),
+        description=payload.description,
+        occurred_at=payload.occurred_at,
+        payer_participant_id=payload.payer_participant_id,
+        requested_by_participant_id=payload.requested_by_participant_id,
+        external_id=payload.external_id,
+        original_purchase_id=payload.original_purchase_id,
+        original_purchase_external_id=payload.original_purchase_external_id,
+    )
@@ -14,10 +14,10 @@ router = APIRouter(prefix="/participants", tags=["Participants"])
 
 
 @router.get("", response_model=ParticipantsListResponse)
-def list_participants(
+async def list_participants(
     repository: Annotated[ParticipantRepository, Depends(get_participant_repository)],
 ) -> ParticipantsListResponse:
     """List active participants used by the reconciliation flow."""
 
-    participants = repository.list_active_exactly_two()
+    participants = await repository.list_active_exactly_two()
     return ParticipantsListResponse.from_models(participants)
@@ -2,30 +2,55 @@
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime
 from typing import Annotated, Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Body, Depends, Path, Query, status
+from fastapi.responses import JSONResponse
 
+from compras_divididas.api.batch import BATCH_ITEM_ERRORS, batch_item_error
 from compras_divididas.api.dependencies import (
     get_recurrence_generation_service,
+    get_recurrence_read_service,
+    get_recurrence_repository,
     get_recurrence_service,
+    use_long_query_timeouts,
 )
+from compras_divididas.api.projection import parse_fields, project_response
 from compras_divididas.api.schemas.recurrences import (
+    CreateRecurrenceBatchRequest,
     CreateRecurrenceRequest,
     EndRecurrenceRequest,
     GenerateRecurrencesRequest,
     GenerateRecurrencesResponse,
+    GenerationRunListResponse,
     PauseRecurrenceRequest,
     ReactivateRecurrenceRequest,
+    RecurrenceBatchResponse,
+    RecurrenceEventListResponse,
+    RecurrenceEventType,
     RecurrenceListResponse,
     RecurrenceResponse,
+    RetryFailedOccurrencesResponse,
     UpdateRecurrenceRequest,
     parse_competence_month,
 )
-from compras_divididas.db.models.recurrence_rule import RecurrenceStatus
-from compras_divididas.domain.errors import InvalidRequestError
+from compras_divididas.db.models.recurrence_event import (
+    RecurrenceEventType as RecurrenceEventTypeModel,
+)
+from compras_divididas.db.models.recurrence_generation_run import (
+    RecurrenceGenerationTrigger,
+)
+from compras_divididas.db.models.recurrence_rule import (
+    RecurrenceStatus,
+)
+from compras_divididas.domain.errors import DomainError, InvalidRequestError
+from compras_divididas.repositories.recurrence_repository import (
+    GenerationRunListFilters,
+    RecurrenceEventListFilters,
+    RecurrenceRepository,
+)
 from compras_divididas.services.recurrence_generation_service import (
     RecurrenceGenerationService,
 )
@@ -55,31 +80,60 @@ monthly_generation_router = APIRouter(
         422: {"description": "Business rule violation"},
     },
 )
-def create_recurrence(
+async def create_recurrence(
     payload: CreateRecurrenceRequest,
     service: Annotated[RecurrenceService, Depends(get_recurrence_service)],
 ) -> RecurrenceResponse:
     """Create one recurrence with active status."""
 
-    recurrence = service.create_recurrence(
-        CreateRecurrenceInput(
-            description=payload.description,
-            amount=payload.amount,
-            payer_participant_id=payload.payer_participant_id,
-            requested_by_participant_id=payload.requested_by_participant_id,
-            split_config=payload.split_config,
-            reference_day=payload.reference_day,
-            start_competence_month=parse_competence_month(
-                payload.start_competence_month
-            ),
-            end_competence_month=parse_competence_month(payload.end_competence_month)
-            if payload.end_competence_month
-            else None,
-        )
-    )
+    recurrence = await service.create_recurrence(_to_create_recurrence_input(payload))
     return RecurrenceResponse.from_model(recurrence)
 
 
+@router.post(
+    "/batch",
+    response_model=RecurrenceBatchResponse,
+    responses={
+        400: {"description": "Invalid payload"},
+    },
+)
+async def create_recurrences_batch(
+    payload: CreateRecurrenceBatchRequest,
+    service: Annotated[RecurrenceService, Depends(get_recurrence_service)],
+) -> RecurrenceBatchResponse:
+    """Create several recurrences, reporting one outcome per item."""
+
+    outcomes: list[RecurrenceResponse | DomainError] = []
+    for item in payload.items:
+        try:
+            request = CreateRecurrenceRequest.model_validate(item)
+            recurrence = await service.create_recurrence(
+                _to_create_recurrence_input(request)
+            )
+            # Serialized right away: a later item's rollback expires this instance.
+            outcomes.append(RecurrenceResponse.from_model(recurrence))
+        except BATCH_ITEM_ERRORS as exc:
+            outcomes.append(batch_item_error(exc))
+    return RecurrenceBatchResponse.from_outcomes(outcomes)
+
+
+def _to_create_recurrence_input(
+    payload: CreateRecurrenceRequest,
+) -> CreateRecurrenceInput:
+    return CreateRecurrenceInput(
+        description=payload.description,
+        amount=payload.amount,
+        payer_participant_id=payload.payer_participant_id,
+        requested_by_participant_id=payload.requested_by_participant_id,
+        split_config=payload.split_config,
+        reference_day=payload.reference_day,
+        start_competence_month=parse_competence_month(payload.start_competence_month),
+        end_competence_month=parse_competence_month(payload.end_competence_month)
+        if payload.end_competence_month
+        else None,
+    )
+
+
 @router.get(
     "",
     response_model=RecurrenceListResponse,
@@ -87,16 +141,18 @@ def create_recurrence(
         400: {"description": "Invalid query filters"},
     },
 )
-def list_recurrences(
-    service: Annotated[RecurrenceService, Depends(get_recurrence_service)],
+async def list_recurrences(
+    service: Annotated[RecurrenceService, Depends(get_recurrence_read_service)],
     status: Annotated[Literal["active", "paused", "ended"] | None, Query()] = None,
     year: Annotated[int | None, Query(ge=2000, le=2100)] = None,
     month: Annotated[int | None, Query(ge=1, le=12)] = None,
     limit: Annotated[int, Query(ge=1, le=200)] = 50,
     offset: Annotated[int, Query(ge=0)] = 0,
-) -> RecurrenceListResponse:
+    fields: Annotated[str | None, Query(max_length=500)] = None,
+) -> RecurrenceListResponse | JSONResponse:
     """List recurrences with optional status and competence filters."""
 
+    selected_fields = parse_fields(fields, allowed=RecurrenceResponse.model_fields)
     competence_month: date | None = None
     if (year is None) != (month is None):
         raise InvalidRequestError(
@@ -109,7 +165,7 @@ def list_recurrences(
         competence_month = date(year=year, month=month, day=1)
 
     status_filter = RecurrenceStatus(status) if status is not None else None
-    items, total = service.list_recurrences(
+    items, total = await service.list_recurrences(
         ListRecurrenceInput(
             status=status_filter,
             competence_month=competence_month,
@@ -117,12 +173,110 @@ def list_recurrences(
             offset=offset,
         )
     )
-    return RecurrenceListResponse.from_models(
+    response = RecurrenceListResponse.from_models(
         items=items,
         total=total,
         limit=limit,
         offset=offset,
     )
+    if selected_fields is None:
+        return response
+    return project_response(response, selected_fields, items_key="items")
+
+
+@router.get(
+    "/generation-runs",
+    response_model=GenerationRunListResponse,
+    responses={
+        400: {"description": "Invalid query filters"},
+    },
+)
+async def list_generation_runs(
+    repository: Annotated[RecurrenceRepository, Depends(get_recurrence_repository)],
+    year: Annotated[int | None, Query(ge=2000, le=2100)] = None,
+    month: Annotated[int | None, Query(ge=1, le=12)] = None,
+    trigger: Annotated[
+        Literal["api", "auto_generate", "scheduler"] | None, Query()
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+) -> GenerationRunListResponse:
+    """List most recent recurrence generation runs with phase timings."""
+
+    competence_month: date | None = None
+    if (year is None) != (month is None):
+        raise InvalidRequestError(
+            message=(
+                "Cause: year and month filters must be provided together. "
+                "Action: Send both year and month or omit both filters."
+            )
+        )
+    if year is not None and month is not None:
+        competence_month = date(year=year, month=month, day=1)
+
+    runs = await repository.list_generation_runs(
+        GenerationRunListFilters(
+            competence_month=competence_month,
+            trigger=RecurrenceGenerationTrigger(trigger) if trigger else None,
+            limit=limit,
+        )
+    )
+    return GenerationRunListResponse.from_models(items=runs, limit=limit)
+
+
+@router.get(
+    "/events",
+    response_model=RecurrenceEventListResponse,
+)
+async def list_recurrence_events(
+    repository: Annotated[RecurrenceRepository, Depends(get_recurrence_repository)],
+    recurrence_id: Annotated[UUID | None, Query()] = None,
+    occurrence_id: Annotated[UUID | None, Query()] = None,
+    event_type: Annotated[RecurrenceEventType | None, Query()] = None,
+    created_before: Annotated[datetime | None, Query()] = None,
+    before_id: Annotated[UUID | None, Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+) -> RecurrenceEventListResponse:
+    """List recurrence audit events newest first with keyset pagination."""
+
+    if before_id is not None and created_before is None:
+        raise InvalidRequestError(
+            message=(
+                "Cause: before_id requires created_before. "
+                "Action: Send the next_created_before and next_before_id pair."
+            )
+        )
+    events = await repository.list_events(
+        RecurrenceEventListFilters(
+            recurrence_rule_id=recurrence_id,
+            recurrence_occurrence_id=occurrence_id,
+            event_type=(RecurrenceEventTypeModel(event_type) if event_type else None),
+            created_before=created_before,
+            before_id=before_id,
+            limit=limit,
+        )
+    )
+    return RecurrenceEventListResponse.from_models(items=events, limit=limit)
+
+
+@router.post(
+    "/failed-occurrences/retry",
+    response_model=RetryFailedOccurrencesResponse,
+    dependencies=[Depends(use_long_query_timeouts)],
+)
+async def retry_failed_occurrences(
+    service: Annotated[
+        RecurrenceGenerationService,
+        Depends(get_recurrence_generation_service),
+    ],
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+) -> RetryFailedOccurrencesResponse:
+    """Reprocess failed recurrence occurrences whose retry is due."""
+
+    result = await service.retry_failed_occurrences(
+        limit=limit,
+        trigger=RecurrenceGenerationTrigger.API,
+    )
+    return RetryFailedOccurrencesResponse.from_result(result)
 
 
 @router.patch(
@@ -134,14 +288,14 @@ def list_recurrences(
         422: {"description": "Business rule violation"},
     },
 )
-def update_recurrence(
+async def update_recurrence(
     recurrence_id: UUID,
     payload: UpdateRecurrenceRequest,
     service: Annotated[RecurrenceService, Depends(get_recurrence_service)],
 ) -> RecurrenceResponse:
     """Update one recurrence using last-write-wins semantics."""
 
-    recurrence = service.update_recurrence(
+    recurrence = await service.update_recurrence(
         UpdateRecurrenceInput(
             recurrence_id=recurrence_id,
             requested_by_participant_id=payload.requested_by_participant_id,
@@ -175,14 +329,14 @@ def update_recurrence(
         422: {"description": "Invalid state transition"},
     },
 )
-def pause_recurrence(
+async def pause_recurrence(
     recurrence_id: UUID,
     payload: PauseRecurrenceRequest,
     service: Annotated[RecurrenceService, Depends(get_recurrence_service)],
 ) -> RecurrenceResponse:
     """Pause one active recurrence."""
 
-    recurrence = service.pause_recurrence(
+    recurrence = await service.pause_recurrence(
         PauseRecurrenceInput(
             recurrence_id=recurrence_id,
             requested_by_participant_id=payload.requested_by_participant_id,
@@ -200,14 +354,14 @@ def pause_recurrence(
         422: {"description": "Invalid state transition"},
     },
 )
-def reactivate_recurrence(
+async def reactivate_recurrence(
     recurrence_id: UUID,
     payload: ReactivateRecurrenceRequest,
     service: Annotated[RecurrenceService, Depends(get_recurrence_service)],
 ) -> RecurrenceResponse:
     """Reactivate one paused recurrence."""
 
-    recurrence = service.reactivate_recurrence(
+    recurrence = await service.reactivate_recurrence(
         ReactivateRecurrenceInput(
             recurrence_id=recurrence_id,
             requested_by_participant_id=payload.requested_by_participant_id,
@@ -224,14 +378,14 @@ def reactivate_recurrence(
         422: {"description": "Invalid state transition"},
     },
 )
-def end_recurrence(
+async def end_recurrence(
     recurrence_id: UUID,
     payload: EndRecurrenceRequest,
     service: Annotated[RecurrenceService, Depends(get_recurrence_service)],
 ) -> RecurrenceResponse:
     """End one recurrence permanently."""
 
-    recurrence = service.end_recurrence(
+    recurrence = await service.end_recurrence(
         EndRecurrenceInput(
             recurrence_id=recurrence_id,
             requested_by_participant_id=payload.requested_by_participant_id,
@@ -246,8 +400,9 @@ def end_recurrence(
 @monthly_generation_router.post(
     "/{year}/{month}/recurrences/generate",
     response_model=GenerateRecurrencesResponse,
+    dependencies=[Depends(use_long_query_timeouts)],
 )
-def generate_recurrences_for_month(
+async def generate_recurrences_for_month(
     year: Annotated[int, Path(ge=2000, le=2100)],
     month: Annotated[int, Path(ge=1, le=12)],
     service: Annotated[
@@ -262,7 +417,7 @@ def generate_recurrences_for_month(
     """Generate monthly recurrence movements idempotently."""
 
     competence_month = date(year=year, month=month, day=1)
-    result = service.generate_for_month(
+    result = await service.generate_for_month(
         competence_month=competence_month,
         requested_by_participant_id=payload.requested_by_participant_id,
         include_blocked_details=payload.include_blocked_details,
@@ -0,0 +1,27 @@
+"""Shared schemas for batch endpoints."""
+
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from compras_divididas.domain.errors import DomainError
+
+BatchItemStatus = Literal["created", "failed"]
+
+
+class BatchItemError(BaseModel):
+    """Contract-shaped error for one rejected batch item."""
+
+    code: str
+    message: str
+    details: dict[str, Any] | None = None
+
+    @classmethod
+    def from_domain_error(cls, error: DomainError) -> BatchItemError:
+        return cls(
+            code=error.code,
+            message=error.message,
+            details=error.details or None,
+        )
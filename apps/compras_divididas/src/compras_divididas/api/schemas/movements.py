@@ -4,13 +4,16 @@ from __future__ import annotations
 
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import Literal
+from typing import Any, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from compras_divididas.api.batch import MAX_BATCH_ITEMS
+from compras_divididas.api.schemas.batch import BatchItemError, BatchItemStatus
 from compras_divididas.api.schemas.participants import ParticipantId
 from compras_divididas.db.models.financial_movement import FinancialMovement
+from compras_divididas.domain.errors import DomainError
 from compras_divididas.domain.money import format_money
 
 MovementKind = Literal["purchase", "refund"]
@@ -103,3 +106,58 @@ class MovementResponse(BaseModel):
             original_purchase_id=movement.original_purchase_id,
             created_at=movement.created_at,
         )
+
+
+class CreateMovementBatchRequest(BaseModel):
+    """Payload for creating several movements in one request.
+
+    Items stay raw here and are validated one by one as `CreateMovementRequest`.
+    """
+
+    items: list[dict[str, Any]] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+    )
+
+
+class MovementBatchItemResult(BaseModel):
+    """Outcome of one item of a movement batch."""
+
+    index: int = Field(ge=0)
+    status: BatchItemStatus
+    movement: MovementResponse | None = None
+    error: BatchItemError | None = None
+
+
+class MovementBatchResponse(BaseModel):
+    """Per-item outcomes of a movement batch, in request order."""
+
+    items: list[MovementBatchItemResult]
+    created_count: int = Field(ge=0)
+    failed_count: int = Field(ge=0)
+
+    @classmethod
+    def from_outcomes(
+        cls,
+        outcomes: list[MovementResponse | DomainError],
+    ) -> MovementBatchResponse:
+        items = [
+            MovementBatchItemResult(
+                index=index,
+                status="failed",
+                error=BatchItemError.from_domain_error(outcome),
+            )
+            if isinstance(outcome, DomainError)
+            else MovementBatchItemResult(
+                index=index,
+                status="created",
+                movement=outcome,
+            )
+            for index, outcome in enumerate(outcomes)
+        ]
+        failed_count = sum(1 for item in items if item.status == "failed")
+        return cls(
+            items=items,
+            created_count=len(items) - failed_count,
+            failed_count=failed_count,
+        )
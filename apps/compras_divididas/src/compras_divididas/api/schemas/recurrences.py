@@ -9,16 +9,36 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from compras_divididas.api.batch import MAX_BATCH_ITEMS
+from compras_divididas.api.schemas.batch import BatchItemError, BatchItemStatus
 from compras_divididas.api.schemas.participants import ParticipantId
+from compras_divididas.db.models.recurrence_event import RecurrenceEvent
+from compras_divididas.db.models.recurrence_generation_run import (
+    RecurrenceGenerationRun,
+)
 from compras_divididas.db.models.recurrence_rule import RecurrenceRule
+from compras_divididas.domain.errors import DomainError
 from compras_divididas.domain.money import format_money
 from compras_divididas.services.recurrence_generation_service import (
     BlockedRecurrenceItem,
     GenerateRecurrencesResult,
+    RetryFailedOccurrencesResult,
 )
 
 RecurrencePeriodicity = Literal["monthly"]
 RecurrenceStatus = Literal["active", "paused", "ended"]
+RecurrenceGenerationTrigger = Literal["api", "auto_generate", "scheduler"]
+RecurrenceEventType = Literal[
+    "recurrence_created",
+    "recurrence_updated",
+    "recurrence_paused",
+    "recurrence_reactivated",
+    "recurrence_ended",
+    "recurrence_generated",
+    "recurrence_blocked",
+    "recurrence_failed",
+    "recurrence_ignored",
+]
 
 
 def parse_competence_month(value: str) -> date:
@@ -149,6 +169,61 @@ class RecurrenceResponse(BaseModel):
         )
 
 
+class CreateRecurrenceBatchRequest(BaseModel):
+    """Payload for creating several recurrences in one request.
+
+    Items stay raw here and are validated one by one as `CreateRecurrenceRequest`.
+    """
+
+    items: list[dict[str, Any]] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+    )
+
+
+class RecurrenceBatchItemResult(BaseModel):
+    """Outcome of one item of a recurrence batch."""
+
+    index: int = Field(ge=0)
+    status: BatchItemStatus
+    recurrence: RecurrenceResponse | None = None
+    error: BatchItemError | None = None
+
+
+class RecurrenceBatchResponse(BaseModel):
+    """Per-item outcomes of a recurrence batch, in request order."""
+
+    items: list[RecurrenceBatchItemResult]
+    created_count: int = Field(ge=0)
+    failed_count: int = Field(ge=0)
+
+    @classmethod
+    def from_outcomes(
+        cls,
+        outcomes: list[RecurrenceResponse | DomainError],
+    ) -> RecurrenceBatchResponse:
+        items = [
+            RecurrenceBatchItemResult(
+                index=index,
+                status="failed",
+                error=BatchItemError.from_domain_error(outcome),
+            )
+            if isinstance(outcome, DomainError)
+            else RecurrenceBatchItemResult(
+                index=index,
+                status="created",
+                recurrence=outcome,
+            )
+            for index, outcome in enumerate(outcomes)
+        ]
+        failed_count = sum(1 for item in items if item.status == "failed")
+        return cls(
+            items=items,
+            created_count=len(items) - failed_count,
+            failed_count=failed_count,
+        )
+
+
 class RecurrenceListResponse(BaseModel):
     """Paginated recurrence list response."""
 
@@ -307,3 +382,141 @@ class GenerateRecurrencesResponse(BaseModel):
             failed_count=result.failed_count,
             blocked_items=blocked_items,
         )
+
+
+class RetryFailedOccurrencesResponse(BaseModel):
+    """Response payload for one failed-occurrence retry pass."""
+
+    due_count: int = Field(ge=0)
+    generated_count: int = Field(ge=0)
+    ignored_count: int = Field(ge=0)
+    blocked_count: int = Field(ge=0)
+    failed_count: int = Field(ge=0)
+    abandoned_count: int = Field(ge=0)
+
+    @classmethod
+    def from_result(
+        cls,
+        result: RetryFailedOccurrencesResult,
+    ) -> RetryFailedOccurrencesResponse:
+        return cls(
+            due_count=result.due_count,
+            generated_count=result.generated_count,
+            ignored_count=result.ignored_count,
+            blocked_count=result.blocked_count,
+            failed_count=result.failed_count,
+            abandoned_count=result.abandoned_count,
+        )
+
+
+class SlowRecurrenceRuleResponse(BaseModel):
+    """Per-rule processing time recorded for one generation run."""
+
+    recurrence_id: UUID
+    duration_ms: float = Field(ge=0)
+
+
+class GenerationRunResponse(BaseModel):
+    """Serialized recurrence generation run ledger entry."""
+
+    id: UUID
+    competence_month: str = Field(pattern=r"^[0-9]{4}-(0[1-9]|1[0-2])$")
+    trigger: RecurrenceGenerationTrigger
+    dry_run: bool
+    started_at: datetime
+    duration_ms: float = Field(ge=0)
+    processed_rules: int = Field(ge=0)
+    generated_count: int = Field(ge=0)
+    ignored_count: int = Field(ge=0)
+    blocked_count: int = Field(ge=0)
+    failed_count: int = Field(ge=0)
+    phase_timings_ms: dict[str, float]
+    slowest_rules: list[SlowRecurrenceRuleResponse]
+
+    @classmethod
+    def from_model(cls, run: RecurrenceGenerationRun) -> GenerationRunResponse:
+        return cls(
+            id=run.id,
+            competence_month=format_competence_month(run.competence_month),
+            trigger=run.trigger.value,
+            dry_run=run.dry_run,
+            started_at=run.started_at,
+            duration_ms=run.duration_ms,
+            processed_rules=run.processed_rules,
+            generated_count=run.generated_count,
+            ignored_count=run.ignored_count,
+            blocked_count=run.blocked_count,
+            failed_count=run.failed_count,
+            phase_timings_ms=run.phase_timings_ms,
+            slowest_rules=[
+                SlowRecurrenceRuleResponse.model_validate(item)
+                for item in run.slowest_rules
+            ],
+        )
+
+
+class GenerationRunListResponse(BaseModel):
+    """Most recent recurrence generation runs."""
+
+    items: list[GenerationRunResponse]
+    limit: int = Field(ge=1)
+
+    @classmethod
+    def from_models(
+        cls,
+        *,
+        items: list[RecurrenceGenerationRun],
+        limit: int,
+    ) -> GenerationRunListResponse:
+        return cls(
+            items=[GenerationRunResponse.from_model(item) for item in items],
+            limit=limit,
+        )
+
+
+class RecurrenceEventResponse(BaseModel):
+    """Serialized recurrence audit event."""
+
+    id: UUID
+    recurrence_id: UUID
+    occurrence_id: UUID | None
+    event_type: RecurrenceEventType
+    actor_participant_id: str | None
+    payload: dict[str, Any]
+    created_at: datetime
+
+    @classmethod
+    def from_model(cls, event: RecurrenceEvent) -> RecurrenceEventResponse:
+        return cls(
+            id=event.id,
+            recurrence_id=event.recurrence_rule_id,
+            occurrence_id=event.recurrence_occurrence_id,
+            event_type=event.event_type.value,
+            actor_participant_id=event.actor_participant_id,
+            payload=event.payload,
+            created_at=event.created_at,
+        )
+
+
+class RecurrenceEventListResponse(BaseModel):
+    """Page of recurrence audit events, newest first."""
+
+    items: list[RecurrenceEventResponse]
+    limit: int = Field(ge=1)
+    next_created_before: datetime | None
+    next_before_id: UUID | None
+
+    @classmethod
+    def from_models(
+        cls,
+        *,
+        items: list[RecurrenceEvent],
+        limit: int,
+    ) -> RecurrenceEventListResponse:
+        last = items[-1] if len(items) == limit else None
+        return cls(
+            items=[RecurrenceEventResponse.from_model(item) for item in items],
+            limit=limit,
+            next_created_before=last.created_at if last else None,
+            next_before_id=last.id if last else None,
+        )
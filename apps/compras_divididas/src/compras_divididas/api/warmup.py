@@ -0,0 +1,139 @@
+"""Startup warm-up of the hot read paths before a worker takes traffic."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from time import perf_counter
+
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from compras_divididas.api.dependencies import (
+    get_monthly_summary_service,
+    get_movement_query_repository,
+    get_participant_repository,
+    get_recurrence_read_service,
+)
+from compras_divididas.api.schemas.monthly_summary import MonthlySummaryResponse
+from compras_divididas.api.schemas.movement_list import MovementListResponse
+from compras_divididas.api.schemas.participants import ParticipantsListResponse
+from compras_divididas.api.schemas.recurrences import RecurrenceListResponse
+from compras_divididas.db.session import get_db_session, get_read_database
+from compras_divididas.domain.competence import competence_month, resolve_occurred_at
+from compras_divididas.domain.errors import DomainError
+from compras_divididas.repositories.movement_query_repository import (
+    MovementQueryFilters,
+)
+from compras_divididas.services.recurrence_service import ListRecurrenceInput
+
+logger = logging.getLogger(__name__)
+
+SessionOpener = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+async def warm_up_app(
+    app: FastAPI,
+    *,
+    connections: int,
+    timeout_seconds: float,
+) -> dict[str, float]:
+    """Run each hot read path once and return the time spent per step in ms.
+
+    Executing the real queries compiles and caches their SQL, builds the
+    response serializers and leaves `connections` connections in the pool.
+    Warm-up is best effort: failures and timeouts are logged, never raised,
+    so a slow database does not keep the worker from starting.
+    """
+
+    timings: dict[str, float] = {}
+    try:
+        await asyncio.wait_for(
+            _warm_up(session_opener(app), connections, timings),
+            timeout=timeout_seconds,
+        )
+    except Exception:
+        logger.warning(
+            "api_warmup_incomplete", extra={"timings": timings}, exc_info=True
+        )
+    else:
+        logger.info("api_warmup_complete", extra={"timings": timings})
+    return timings
+
+
+def session_opener(app: FastAPI) -> SessionOpener:
+    # Warm the session source requests will use, including test overrides.
+    provider: Callable[[], AsyncGenerator[AsyncSession, None]] = (
+        app.dependency_overrides.get(get_db_session, get_db_session)
+    )
+    return asynccontextmanager(provider)
+
+
+async def _warm_up(
+    open_session: SessionOpener,
+    connections: int,
+    timings: dict[str, float],
+) -> None:
+    async with _timed(timings, "pool"):
+        await asyncio.gather(*(_ping(open_session) for _ in range(connections)))
+
+    read_database = get_read_database()
+    if read_database is not None:
+        async with _timed(timings, "read_pool"):
+            await asyncio.gather(
+                *(_ping(read_database.session_factory) for _ in range(connections))
+            )
+
+    month = competence_month(resolve_occurred_at(None))
+    async with open_session() as session:
+        async with _timed(timings, "participants"):
+            participant_repository = await get_participant_repository(session)
+            participants = await participant_repository.list_active_exactly_two()
+            ParticipantsListResponse.from_models(participants).model_dump_json()
+
+        async with _timed(timings, "summary"):
+            summary_service = await get_monthly_summary_service(
+                session, session, auto_generate=False
+            )
+            summary = await summary_service.get_summary(
+                year=month.year, month=month.month, auto_generate=False
+            )
+            MonthlySummaryResponse.from_projection(summary).model_dump_json()
+
+        async with _timed(timings, "movements"):
+            query_repository = await get_movement_query_repository(session)
+            items, total = await query_repository.list_movements(
+                MovementQueryFilters(competence_month=month)
+            )
+            MovementListResponse.from_models(
+                items=items, total=total, limit=50, offset=0
+            ).model_dump_json()
+
+        async with _timed(timings, "recurrences"):
+            recurrence_service = await get_recurrence_read_service(session)
+            rules, rule_total = await recurrence_service.list_recurrences(
+                ListRecurrenceInput(competence_month=month)
+            )
+            RecurrenceListResponse.from_models(
+                items=rules, total=rule_total, limit=50, offset=0
+            ).model_dump_json()
+
+
+async def _ping(open_session: SessionOpener) -> None:
+    async with open_session() as session:
+        await session.execute(text("SELECT 1"))
+
+
+@asynccontextmanager
+async def _timed(timings: dict[str, float], step: str) -> AsyncGenerator[None, None]:
+    started_at = perf_counter()
+    try:
+        yield
+    except DomainError:
+        # An empty or misconfigured database still compiled the statement.
+        pass
+    finally:
+        timings[step] = round((perf_counter() - started_at) * 1000, 3)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
 from typing import Annotated
 
 import typer
@@ -16,6 +18,143 @@ def healthcheck() -> None:
     typer.echo("compras-divididas is ready")
 
 
+@app.command("retry-recurrences")
+def retry_recurrences(
+    limit: Annotated[
+        int,
+        typer.Option(
+            "--limit",
+            min=1,
+            help="Maximum number of due failed occurrences to reprocess.",
+        ),
+    ] = 100,
+) -> None:
+    """Reprocess failed recurrence occurrences whose retry is due."""
+
+    from compras_divididas.db.session import dispose_databases, get_database
+    from compras_divididas.repositories.recurrence_repository import (
+        RecurrenceRepository,
+    )
+    from compras_divididas.services.recurrence_generation_service import (
+        RecurrenceGenerationService,
+        RetryFailedOccurrencesResult,
+    )
+
+    async def run() -> RetryFailedOccurrencesResult:
+        try:
+            async with get_database().session_factory() as session:
+                service = RecurrenceGenerationService(
+                    recurrence_repository=RecurrenceRepository(session),
+                    session=session,
+                )
+                return await service.retry_failed_occurrences(limit=limit)
+        finally:
+            await dispose_databases()
+
+    result = asyncio.run(run())
+
+    typer.echo(
+        f"due={result.due_count} generated={result.generated_count} "
+        f"ignored={result.ignored_count} blocked={result.blocked_count} "
+        f"failed={result.failed_count} abandoned={result.abandoned_count}"
+    )
+
+
+@app.command("archive-recurrence-events")
+def archive_recurrence_events(
+    older_than_days: Annotated[
+        int | None,
+        typer.Option(
+            "--older-than-days",
+            min=1,
+            help="Retention window in days. Defaults to the configured value.",
+        ),
+    ] = None,
+    archive_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--archive-dir",
+            help="Directory for gzip JSONL archives. Defaults to settings.",
+        ),
+    ] = None,
+    batch_size: Annotated[
+        int,
+        typer.Option(
+            "--batch-size",
+            min=1,
+            help="Number of events archived and deleted per transaction.",
+        ),
+    ] = 1000,
+) -> None:
+    """Archive recurrence events older than the retention window."""
+
+    from compras_divididas.core.settings import get_settings
+    from compras_divididas.db.session import dispose_databases, get_database
+    from compras_divididas.repositories.recurrence_repository import (
+        RecurrenceRepository,
+    )
+    from compras_divididas.services.recurrence_event_retention_service import (
+        ArchiveRecurrenceEventsResult,
+        RecurrenceEventRetentionService,
+    )
+
+    settings = get_settings()
+
+    async def run() -> ArchiveRecurrenceEventsResult:
+        try:
+            async with get_database().session_factory() as session:
+                service = RecurrenceEventRetentionService(
+                    recurrence_repository=RecurrenceRepository(session),
+                    session=session,
+                    archive_dir=archive_dir
+                    or Path(settings.recurrence_event_archive_dir),
+                )
+                return await service.archive_events_older_than(
+                    retention_days=(
+                        older_than_days or settings.recurrence_event_retention_days
+                    ),
+                    batch_size=batch_size,
+                )
+        finally:
+            await dispose_databases()
+
+    result = asyncio.run(run())
+
+    typer.echo(
+        f"cutoff={result.cutoff.isoformat()} archived={result.archived_count} "
+        f"batches={result.batch_count}"
+    )
+
+
+@app.command("migrate")
+def migrate(
+    alembic_ini: Annotated[
+        Path,
+        typer.Option(
+            "--alembic-ini",
+            help="Path to alembic.ini.",
+        ),
+    ] = Path("apps/compras_divididas/alembic.ini"),
+) -> None:
+    """Upgrade the database to head, skipping quickly when already current."""
+
+    from compras_divididas.core.settings import get_settings
+    from compras_divididas.db.migrations import run_migrations
+
+    result = run_migrations(
+        database_url=get_settings().database_url,
+        alembic_ini=alembic_ini,
+    )
+
+    typer.echo(
+        f"status={result.status} "
+        f"from={','.join(result.from_revisions) or '-'} "
+        f"to={','.join(result.to_revisions)} "
+        f"lock_wait_ms={result.lock_wait_seconds * 1000:.0f} "
+        f"duration_ms={result.duration_seconds * 1000:.0f}"
+    )
+
+
 @app.command("mcp")
 def run_mcp_server(
     api_base_url: Annotated[
@@ -33,6 +172,20 @@ def run_mcp_server(
             help="HTTP timeout in seconds for MCP tool calls.",
         ),
     ] = None,
+    in_process: Annotated[
+        bool | None,
+        typer.Option(
+            "--in-process/--http",
+            help="Serve tools from the API app in this process instead of over HTTP.",
+        ),
+    ] = None,
+    trace_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--trace-file",
+            help="Append one JSONL record per MCP tool call to this file.",
+        ),
+    ] = None,
 ) -> None:
     """Run MCP server over stdio transport."""
 
@@ -41,6 +194,8 @@ def run_mcp_server(
     mcp_server = create_mcp_server(
         api_base_url=api_base_url,
         timeout_seconds=timeout_seconds,
+        in_process=in_process,
+        trace_file=trace_file,
     )
     mcp_server.run()
 
@@ -0,0 +1,16 @@
+"""Latency summaries shared by the pool and MCP statistics."""
+
+from __future__ import annotations
+
+
+def percentile(sorted_values: list[float], quantile: float) -> float:
+    """Return the nearest-rank `quantile` of already sorted values, 0 if empty."""
+
+    if not sorted_values:
+        return 0.0
+    index = min(int(quantile * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def seconds_to_ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
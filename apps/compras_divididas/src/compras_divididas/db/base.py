@@ -18,6 +18,7 @@ def import_orm_models() -> None:
         "compras_divididas.db.models.recurrence_rule",
         "compras_divididas.db.models.recurrence_occurrence",
         "compras_divididas.db.models.recurrence_event",
+        "compras_divididas.db.models.recurrence_generation_run",
     )
     for module_name in modules:
         import_module(module_name)
@@ -0,0 +1,140 @@
+"""Container-start migration runner with an at-head fast path.
+
+The fast path is a single `SELECT` on `alembic_version` compared with
+`HEAD_REVISIONS`, so a restart with a current schema never builds the Alembic
+script directory, loads `alembic/env.py` or imports the ORM models. When an
+upgrade is needed, a PostgreSQL advisory lock lets one replica migrate while
+the others wait and then find the schema at head.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from sqlalchemy import Connection, create_engine, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.pool import NullPool
+
+# Arbitrary application-wide key for pg_advisory_lock ("cdmg" in ASCII).
+MIGRATION_LOCK_KEY = 0x63646D67
+
+# Head of `alembic/versions`; bump it with every new revision.
+# tests/unit/test_migrations.py checks it against the scripts.
+HEAD_REVISIONS: tuple[str, ...] = ("008_add_recurrence_event_indexes",)
+
+
+@dataclass(frozen=True, slots=True)
+class MigrationResult:
+    """Outcome of one migration run."""
+
+    status: str
+    from_revisions: tuple[str, ...]
+    to_revisions: tuple[str, ...]
+    lock_wait_seconds: float
+    duration_seconds: float
+
+
+def script_heads(alembic_ini: Path) -> tuple[str, ...]:
+    """Return the head revisions declared by the migration scripts."""
+
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory.from_config(Config(str(alembic_ini)))
+    return tuple(sorted(script.get_heads()))
+
+
+def current_revisions(connection: Connection) -> tuple[str, ...]:
+    """Return the revisions stored in `alembic_version`, empty when unset.
+
+    A missing table fails the query, which means the database needs an
+    upgrade like an empty one.
+    """
+
+    try:
+        rows = connection.execute(text("SELECT version_num FROM alembic_version"))
+        revisions = tuple(sorted(str(row[0]) for row in rows))
+    except (OperationalError, ProgrammingError):
+        revisions = ()
+    connection.rollback()
+    return revisions
+
+
+def run_migrations(
+    *,
+    database_url: str,
+    alembic_ini: Path,
+    upgrade: Callable[[Path], None] | None = None,
+    clock: Callable[[], float] = time.perf_counter,
+) -> MigrationResult:
+    """Upgrade the database to head unless it is already there."""
+
+    started_at = clock()
+    heads = HEAD_REVISIONS
+    engine = create_engine(database_url, poolclass=NullPool)
+    try:
+        with engine.connect() as connection:
+            current = current_revisions(connection)
+            if current == heads:
+                return MigrationResult(
+                    status="up_to_date",
+                    from_revisions=current,
+                    to_revisions=heads,
+                    lock_wait_seconds=0.0,
+                    duration_seconds=clock() - started_at,
+                )
+
+            lock_requested_at = clock()
+            with _migration_lock(connection):
+                lock_wait_seconds = clock() - lock_requested_at
+                # Another replica may have migrated while we waited.
+                current = current_revisions(connection)
+                if current == heads:
+                    return MigrationResult(
+                        status="migrated_elsewhere",
+                        from_revisions=current,
+                        to_revisions=heads,
+                        lock_wait_seconds=lock_wait_seconds,
+                        duration_seconds=clock() - started_at,
+                    )
+                (upgrade or _alembic_upgrade)(alembic_ini)
+    finally:
+        engine.dispose()
+
+    return MigrationResult(
+        status="upgraded",
+        from_revisions=current,
+        to_revisions=heads,
+        lock_wait_seconds=lock_wait_seconds,
+        duration_seconds=clock() - started_at,
+    )
+
+
+@contextmanager
+def _migration_lock(connection: Connection) -> Iterator[None]:
+    if connection.dialect.name != "postgresql":
+        yield
+        return
+
+    connection.execute(
+        text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY}
+    )
+    connection.commit()
+    try:
+        yield
+    finally:
+        connection.execute(
+            text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY}
+        )
+        connection.commit()
+
+
+def _alembic_upgrade(alembic_ini: Path) -> None:
+    from alembic import command
+    from alembic.config import Config
+
+    command.upgrade(Config(str(alembic_ini)), "head")
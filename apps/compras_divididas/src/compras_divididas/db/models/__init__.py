@@ -9,6 +9,10 @@ from compras_divididas.db.models.recurrence_event import (
     RecurrenceEvent,
     RecurrenceEventType,
 )
+from compras_divididas.db.models.recurrence_generation_run import (
+    RecurrenceGenerationRun,
+    RecurrenceGenerationTrigger,
+)
 from compras_divididas.db.models.recurrence_occurrence import (
     RecurrenceOccurrence,
     RecurrenceOccurrenceStatus,
@@ -25,6 +29,8 @@ __all__ = [
     "Participant",
     "RecurrenceEvent",
     "RecurrenceEventType",
+    "RecurrenceGenerationRun",
+    "RecurrenceGenerationTrigger",
     "RecurrenceOccurrence",
     "RecurrenceOccurrenceStatus",
     "RecurrencePeriodicity",
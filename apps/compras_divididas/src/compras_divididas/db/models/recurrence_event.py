@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, DateTime, Enum, ForeignKey, func
+from sqlalchemy import JSON, DateTime, Enum, ForeignKey, Index, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -32,6 +32,30 @@ class RecurrenceEvent(Base):
     """Append-only functional event linked to recurrence lifecycle."""
 
     __tablename__ = "recurrence_events"
+    __table_args__ = (
+        Index(
+            "ix_recurrence_events_rule_created_at",
+            "recurrence_rule_id",
+            "created_at",
+        ),
+        Index(
+            "ix_recurrence_events_occurrence_created_at",
+            "recurrence_occurrence_id",
+            "created_at",
+            postgresql_where=text("recurrence_occurrence_id IS NOT NULL"),
+            sqlite_where=text("recurrence_occurrence_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_recurrence_events_type_created_at",
+            "event_type",
+            "created_at",
+        ),
+        Index(
+            "ix_recurrence_events_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     recurrence_rule_id: Mapped[UUID] = mapped_column(
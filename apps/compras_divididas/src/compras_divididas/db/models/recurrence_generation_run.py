@@ -0,0 +1,98 @@
+"""Recurrence generation run ledger ORM model."""
+
+from __future__ import annotations
+
+import enum
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    CheckConstraint,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    Index,
+    Integer,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from compras_divididas.db.base import Base
+
+
+class RecurrenceGenerationTrigger(enum.StrEnum):
+    """Origins that can start one recurrence generation run."""
+
+    API = "api"
+    AUTO_GENERATE = "auto_generate"
+    SCHEDULER = "scheduler"
+
+
+class RecurrenceGenerationRun(Base):
+    """Append-only record of one monthly recurrence generation execution."""
+
+    __tablename__ = "recurrence_generation_runs"
+    __table_args__ = (
+        CheckConstraint(
+            "duration_ms >= 0",
+            name="ck_recurrence_generation_runs_duration_non_negative",
+        ),
+        CheckConstraint(
+            "processed_rules >= 0",
+            name="ck_recurrence_generation_runs_processed_rules_non_negative",
+        ),
+        Index(
+            "ix_recurrence_generation_runs_started_at",
+            "started_at",
+        ),
+        Index(
+            "ix_recurrence_generation_runs_competence_started_at",
+            "competence_month",
+            "started_at",
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    competence_month: Mapped[date] = mapped_column(Date, nullable=False)
+    trigger: Mapped[RecurrenceGenerationTrigger] = mapped_column(
+        Enum(
+            RecurrenceGenerationTrigger,
+            name="recurrence_generation_trigger",
+            values_callable=lambda enum_cls: [member.value for member in enum_cls],
+            validate_strings=True,
+        ),
+        nullable=False,
+    )
+    dry_run: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="false",
+    )
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    duration_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    processed_rules: Mapped[int] = mapped_column(Integer, nullable=False)
+    generated_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    ignored_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    blocked_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    failed_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    phase_timings_ms: Mapped[dict[str, Any]] = mapped_column(
+        JSON().with_variant(JSONB, "postgresql"),
+        nullable=False,
+    )
+    slowest_rules: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSON().with_variant(JSONB, "postgresql"),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -70,6 +70,12 @@ class RecurrenceOccurrence(Base):
             "competence_month",
             "status",
         ),
+        Index(
+            "ix_recurrence_occurrences_failed_next_attempt_at",
+            "next_attempt_at",
+            postgresql_where=text("status = 'failed' AND next_attempt_at IS NOT NULL"),
+            sqlite_where=text("status = 'failed' AND next_attempt_at IS NOT NULL"),
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
@@ -101,6 +107,9 @@ class RecurrenceOccurrence(Base):
     processed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    next_attempt_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -15,14 +15,18 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     SmallInteger,
     String,
     func,
+    literal_column,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql.elements import ColumnElement
 
 from compras_divididas.db.base import Base
 
@@ -57,6 +61,13 @@ class RecurrenceRule(Base):
             name="ck_recurrence_rules_end_competence_month_valid",
         ),
         CheckConstraint("version > 0", name="ck_recurrence_rules_version_positive"),
+        Index(
+            "ix_recurrence_rules_active_next_competence_month",
+            "next_competence_month",
+            "id",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
@@ -129,3 +140,24 @@ class RecurrenceRule(Base):
         back_populates="recurrence_rule",
         cascade="all, delete-orphan",
     )
+
+
+def active_period_expression() -> ColumnElement[Any]:
+    """Return the inclusive daterange covered by one recurrence rule.
+
+    An open end month yields an unbounded range. The bounds literal is
+    rendered inline so queries match the GiST expression index.
+    """
+
+    return func.daterange(
+        RecurrenceRule.start_competence_month,
+        RecurrenceRule.end_competence_month,
+        literal_column("'[]'"),
+    )
+
+
+Index(
+    "ix_recurrence_rules_active_period",
+    active_period_expression(),
+    postgresql_using="gist",
+).ddl_if(dialect="postgresql")
@@ -0,0 +1,134 @@
+"""Connection pool instrumentation for the application engine."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+from sqlalchemy import exc
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    Pool,
+    PoolProxiedConnection,
+    QueuePool,
+)
+
+from compras_divididas.core.latency import percentile, seconds_to_ms
+from compras_divididas.core.settings import Settings
+
+CHECKOUT_WAIT_WINDOW_SIZE = 512
+
+
+class PoolMetrics:
+    """Counts pool checkouts and how long callers waited for a connection.
+
+    Wait time covers the whole checkout: queueing behind other requests when
+    the pool and its overflow are exhausted, plus opening a new connection
+    when the pool has room to grow.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+        self._recent_waits: deque[float] = deque(maxlen=CHECKOUT_WAIT_WINDOW_SIZE)
+
+    def now(self) -> float:
+        return self._clock()
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        with self._lock:
+            self._checkouts += 1
+            self._wait_seconds_total += wait_seconds
+            self._wait_seconds_max = max(self._wait_seconds_max, wait_seconds)
+            self._recent_waits.append(wait_seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self, pool: Pool | None = None) -> dict[str, object]:
+        with self._lock:
+            recent = sorted(self._recent_waits)
+            checkouts = self._checkouts
+            payload: dict[str, object] = {
+                "checkouts": checkouts,
+                "checkout_timeouts": self._timeouts,
+                "checkout_wait_mean_ms": seconds_to_ms(
+                    self._wait_seconds_total / checkouts if checkouts else 0.0
+                ),
+                "checkout_wait_p95_ms": seconds_to_ms(percentile(recent, 0.95)),
+                "checkout_wait_max_ms": seconds_to_ms(self._wait_seconds_max),
+            }
+        if isinstance(pool, QueuePool):
+            payload.update(
+                {
+                    "pool_size": pool.size(),
+                    "checked_out": pool.checkedout(),
+                    "checked_in": pool.checkedin(),
+                    # Negative while the pool has not opened all of its slots yet.
+                    "overflow": pool.overflow(),
+                }
+            )
+        return payload
+
+
+def pool_usage(pool: Pool, capacity: int) -> dict[str, object]:
+    """Return checked-out connections against `capacity` (size plus overflow)."""
+
+    checked_out = pool.checkedout() if isinstance(pool, QueuePool) else 0
+    return {
+        "pool_checked_out": checked_out,
+        "pool_capacity": capacity,
+        "pool_saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+    }
+
+
+def timed_pool_class(metrics: PoolMetrics) -> type[AsyncAdaptedQueuePool]:
+    """Return an async queue pool class that reports checkouts to `metrics`.
+
+    The metrics object is bound to the class rather than passed as an argument
+    because `QueuePool.recreate` rebuilds the pool from its class and the
+    standard constructor arguments only.
+    """
+
+    class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+        def connect(self) -> PoolProxiedConnection:
+            started_at = metrics.now()
+            try:
+                connection = super().connect()
+            except exc.TimeoutError:
+                metrics.record_timeout()
+                raise
+            metrics.record_checkout(metrics.now() - started_at)
+            return connection
+
+    return TimedAsyncAdaptedQueuePool
+
+
+def engine_pool_options(settings: Settings) -> dict[str, object]:
+    """Translate pool settings into `create_async_engine` keyword arguments."""
+
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def resolve_thread_limit(settings: Settings) -> int | None:
+    """Return the AnyIO worker thread limit, None to keep AnyIO's default.
+
+    Routes, dependencies and sessions are async, so worker threads no longer
+    hold pooled connections and the pool does not bound them; only
+    `API_THREAD_LIMIT` changes the limiter used by the remaining sync work.
+    """
+
+    return settings.api_thread_limit
@@ -1,27 +1,118 @@
-"""SQLAlchemy engine and session factory definitions."""
+"""SQLAlchemy async engine and session factory definitions.
 
-from collections.abc import Generator
+Engines are built on first use rather than at import, so importing the app,
+the CLI or the MCP server does not resolve settings or load a database driver.
+"""
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from __future__ import annotations
 
-from compras_divididas.core.settings import get_settings
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from functools import lru_cache
 
-settings = get_settings()
-
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
-SessionFactory = sessionmaker(
-    bind=engine,
-    class_=Session,
-    autoflush=False,
-    autocommit=False,
-    expire_on_commit=False,
+from compras_divididas.core.settings import Settings, get_settings
+from compras_divididas.db.pool import PoolMetrics, engine_pool_options, timed_pool_class
+from compras_divididas.db.timeouts import (
+    QUERY_TIMEOUTS_INFO_KEY,
+    QueryTimeoutSession,
+    default_query_timeouts,
 )
 
 
-def get_db_session() -> Generator[Session, None, None]:
+@dataclass(slots=True, frozen=True)
+class Database:
+    """An engine with its session factory and pool metrics."""
+
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    pool_metrics: PoolMetrics
+
+
+def _build_database(database_url: str, settings: Settings) -> Database:
+    pool_metrics = PoolMetrics()
+    engine = create_async_engine(
+        database_url,
+        poolclass=timed_pool_class(pool_metrics),
+        **engine_pool_options(settings),
+    )
+    session_factory = async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        sync_session_class=QueryTimeoutSession,
+        info={QUERY_TIMEOUTS_INFO_KEY: default_query_timeouts(settings)},
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    return Database(
+        engine=engine,
+        session_factory=session_factory,
+        pool_metrics=pool_metrics,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_database() -> Database:
+    """Return the primary database, building its engine on first call."""
+
+    settings = get_settings()
+    return _build_database(settings.database_url, settings)
+
+
+@lru_cache(maxsize=1)
+def get_read_database() -> Database | None:
+    """Return the read replica, or None when `DATABASE_READ_URL` is unset."""
+
+    settings = get_settings()
+    if not settings.database_read_url:
+        return None
+    return _build_database(settings.database_read_url, settings)
+
+
+def built_databases() -> list[Database]:
+    """Return the databases whose engines exist, without building new ones."""
+
+    databases: list[Database] = []
+    if get_database.cache_info().currsize:
+        databases.append(get_database())
+    if get_read_database.cache_info().currsize:
+        read_database = get_read_database()
+        if read_database is not None:
+            databases.append(read_database)
+    return databases
+
+
+async def dispose_databases() -> None:
+    """Close pooled connections and forget the engines built so far."""
+
+    databases = built_databases()
+    get_database.cache_clear()
+    get_read_database.cache_clear()
+    for database in databases:
+        await database.engine.dispose()
+
+
+def reset_databases_after_fork() -> None:
+    """Drop engines inherited from a parent process in a forked child.
+
+    `close=False` leaves the parent's sockets alone; the child builds fresh
+    engines and pools on first use.
+    """
+
+    for database in built_databases():
+        database.engine.sync_engine.dispose(close=False)
+    get_database.cache_clear()
+    get_read_database.cache_clear()
+
+
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Yield a database session per request lifecycle."""
 
-    with SessionFactory() as session:
+    async with get_database().session_factory() as session:
         yield session
@@ -0,0 +1,83 @@
+"""Per-transaction statement and lock timeouts for application sessions.
+
+Every transaction opened by a `QueryTimeoutSession` on PostgreSQL starts with
+`set_config(..., true)`, the function form of `SET LOCAL`, so the limits end
+with the transaction and never leak to the next user of a pooled connection.
+Routes pick their own limits through `use_query_timeouts`; everything else
+gets the defaults stored in the session `info`.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Connection, event, text
+from sqlalchemy.orm import Session, SessionTransaction
+
+from compras_divididas.core.settings import Settings
+
+QUERY_TIMEOUTS_INFO_KEY = "query_timeouts"
+
+
+@dataclass(frozen=True, slots=True)
+class QueryTimeouts:
+    """Statement and lock wait limits in milliseconds; `0` disables a limit."""
+
+    statement_ms: int
+    lock_ms: int
+
+
+_route_query_timeouts: ContextVar[QueryTimeouts | None] = ContextVar(
+    "route_query_timeouts", default=None
+)
+
+
+def default_query_timeouts(settings: Settings) -> QueryTimeouts:
+    return QueryTimeouts(
+        statement_ms=settings.db_statement_timeout_ms,
+        lock_ms=settings.db_lock_timeout_ms,
+    )
+
+
+def use_query_timeouts(timeouts: QueryTimeouts) -> None:
+    """Apply `timeouts` to transactions begun later in the current context."""
+
+    _route_query_timeouts.set(timeouts)
+
+
+def resolve_query_timeouts(session: Session) -> QueryTimeouts | None:
+    route_timeouts = _route_query_timeouts.get()
+    if route_timeouts is not None:
+        return route_timeouts
+    defaults: QueryTimeouts | None = session.info.get(QUERY_TIMEOUTS_INFO_KEY)
+    return defaults
+
+
+class QueryTimeoutSession(Session):
+    """Session whose transactions carry statement and lock timeouts."""
+
+
+@event.listens_for(QueryTimeoutSession, "after_begin")
+def _apply_query_timeouts(
+    session: Session,
+    transaction: SessionTransaction,
+    connection: Connection,
+) -> None:
+    if connection.dialect.name != "postgresql":
+        return
+    timeouts = resolve_query_timeouts(session)
+    if timeouts is None:
+        return
+    parameters: dict[str, Any] = {
+        "statement_timeout": str(timeouts.statement_ms),
+        "lock_timeout": str(timeouts.lock_ms),
+    }
+    connection.execute(
+        text(
+            "SELECT set_config('statement_timeout', :statement_timeout, true), "
+            "set_config('lock_timeout', :lock_timeout, true)"
+        ),
+        parameters,
+    )
@@ -239,3 +239,43 @@ class RecurrenceMovementAlreadyLinkedError(DomainError):
             status_code=HTTPStatus.CONFLICT,
             details=details or {},
         )
+
+
+class QueryTimeoutError(DomainError):
+    """Raised when a query exceeds its statement or lock timeout."""
+
+    def __init__(
+        self,
+        message: str | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(
+            code="QUERY_TIMEOUT",
+            message=message
+            or compose_error_message(
+                cause="The database did not finish the operation in time.",
+                action="Retry the request in a few seconds.",
+            ),
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            details=details or {},
+        )
+
+
+class ServiceOverloadedError(DomainError):
+    """Raised when a worker sheds a request over its concurrency limit."""
+
+    def __init__(
+        self,
+        message: str | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(
+            code="SERVICE_OVERLOADED",
+            message=message
+            or compose_error_message(
+                cause="The server is handling too many requests of this kind.",
+                action="Retry the request after the Retry-After interval.",
+            ),
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            details=details or {},
+        )
@@ -0,0 +1,67 @@
+"""Exponential backoff policy shared by retried operations."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+
+@dataclass(slots=True, frozen=True)
+class RetryPolicy:
+    """Backoff schedule applied after each failed processing attempt."""
+
+    base_delay_seconds: float = 60.0
+    max_delay_seconds: float = 6 * 60 * 60
+    max_attempts: int = 8
+    jitter_ratio: float = 0.1
+
+    def __post_init__(self) -> None:
+        if self.base_delay_seconds <= 0:
+            msg = "base_delay_seconds must be greater than zero."
+            raise ValueError(msg)
+        if self.max_delay_seconds < self.base_delay_seconds:
+            msg = "max_delay_seconds must be greater than or equal to base delay."
+            raise ValueError(msg)
+        if self.max_attempts < 1:
+            msg = "max_attempts must be at least 1."
+            raise ValueError(msg)
+        if not 0 <= self.jitter_ratio < 1:
+            msg = "jitter_ratio must be in the [0, 1) interval."
+            raise ValueError(msg)
+
+    def delay_seconds(self, attempt_count: int) -> float:
+        """Return the un-jittered delay after `attempt_count` failed attempts."""
+
+        exponent = max(attempt_count - 1, 0)
+        return min(self.base_delay_seconds * 2.0**exponent, self.max_delay_seconds)
+
+    def next_attempt_at(
+        self,
+        *,
+        attempt_count: int,
+        now: datetime,
+        random_value: float | None = None,
+    ) -> datetime | None:
+        """Return when the next attempt is due, or None when retries are exhausted.
+
+        `random_value` in [0, 1) spreads retries of rules that failed together;
+        it defaults to a fresh random draw.
+        """
+
+        if attempt_count >= self.max_attempts:
+            return None
+        return now + timedelta(
+            seconds=self.jittered_delay_seconds(attempt_count, random_value)
+        )
+
+    def jittered_delay_seconds(
+        self,
+        attempt_count: int,
+        random_value: float | None = None,
+    ) -> float:
+        """Return the delay after `attempt_count` failures with jitter applied."""
+
+        jitter_draw = random.random() if random_value is None else random_value
+        jitter = 1 + self.jitter_ratio * (2 * jitter_draw - 1)
+        return self.delay_seconds(attempt_count) * jitter
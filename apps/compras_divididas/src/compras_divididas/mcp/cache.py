@@ -0,0 +1,147 @@
+"""TTL read-through cache shared by MCP read tools."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+
+ParamValue = str | int | float | bool | None
+CacheKey = tuple[str, tuple[tuple[str, ParamValue], ...]]
+
+PARTICIPANTS_TAG = "participants"
+RECURRENCES_TAG = "recurrences"
+MONTHS_TAG = "months"
+MONTH_TAG_PREFIX = "month:"
+
+
+def month_tag(year: int, month: int) -> str:
+    """Return the invalidation tag for one competence month."""
+
+    # Zero-padded so month tags sort chronologically as strings.
+    return f"{MONTH_TAG_PREFIX}{year:04d}-{month:02d}"
+
+
+def build_cache_key(path: str, params: Mapping[str, ParamValue] | None) -> CacheKey:
+    """Normalize a read request so equivalent calls share one cache entry."""
+
+    normalized = tuple(
+        sorted(
+            (name, value) for name, value in (params or {}).items() if value is not None
+        )
+    )
+    return path, normalized
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    value: object
+    expires_at: float
+    tags: frozenset[str]
+
+
+class ReadThroughCache:
+    """Keeps successful read responses for a short TTL, grouped by tags.
+
+    Writes issued through the same MCP server call `invalidate` with the tags
+    they affect, so later reads in the conversation never see stale data
+    produced by this server. Each tag has a generation counter bumped on
+    invalidation; a load that overlapped an invalidation of one of its tags
+    returns its result but does not store it.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl_seconds < 0:
+            raise ValueError("Cache TTL must be greater than or equal to zero.")
+        if max_entries < 1:
+            raise ValueError("Cache max_entries must be at least 1.")
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[CacheKey, _CacheEntry] = {}
+        self._generations: dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def has_fresh(self, key: CacheKey) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.expires_at > self._clock()
+
+    async def get_or_load(
+        self,
+        key: CacheKey,
+        *,
+        tags: frozenset[str],
+        loader: Callable[[], Awaitable[object]],
+    ) -> object:
+        """Return a fresh cached value or load, store and return a new one."""
+
+        if not self.enabled:
+            return await loader()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > self._clock():
+            return entry.value
+
+        generations = self._generations_of(tags)
+        value = await loader()
+        if self._generations_of(tags) == generations:
+            self._store(
+                key, _CacheEntry(value, self._clock() + self._ttl_seconds, tags)
+            )
+        return value
+
+    def invalidate(self, *tags: str) -> int:
+        """Drop every entry carrying one of the tags and return how many."""
+
+        targets = set(tags)
+        for tag in targets:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+        stale_keys = [
+            key for key, entry in self._entries.items() if entry.tags & targets
+        ]
+        for key in stale_keys:
+            del self._entries[key]
+        return len(stale_keys)
+
+    def invalidate_months_from(self, year: int, month: int) -> int:
+        """Invalidate every month tag from `year`-`month` onwards."""
+
+        first = month_tag(year, month)
+        return self.invalidate(
+            *(
+                tag
+                for tag in self._generations
+                if tag.startswith(MONTH_TAG_PREFIX) and tag >= first
+            )
+        )
+
+    def _generations_of(self, tags: frozenset[str]) -> tuple[int, ...]:
+        # Registering the tags here lets a range invalidation reach loads
+        # that are still in flight.
+        return tuple(self._generations.setdefault(tag, 0) for tag in sorted(tags))
+
+    def _store(self, key: CacheKey, entry: _CacheEntry) -> None:
+        self._entries.pop(key, None)
+        if len(self._entries) >= self._max_entries:
+            now = self._clock()
+            for expired_key in [
+                item_key
+                for item_key, item in self._entries.items()
+                if item.expires_at <= now
+            ]:
+                del self._entries[expired_key]
+        while len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = entry
@@ -0,0 +1,323 @@
+"""Pooled HTTP client used by MCP tools to reach the compras_divididas API.
+
+Kept apart from `server.py` so `httpx` is imported only once a requester is
+built, off the MCP startup path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine, Mapping
+from datetime import date
+from typing import Any
+
+import httpx
+
+from compras_divididas.domain.retry_policy import RetryPolicy
+from compras_divididas.mcp.cache import ParamValue
+from compras_divididas.mcp.resilience import CircuitBreaker
+from compras_divididas.mcp.stats import record_retry
+
+ParamsMapping = Mapping[str, ParamValue]
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+# Failures raised before the request reached the API, so a write can be resent.
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class HTTPAPIRequester:
+    """HTTP client wrapper for compras_divididas API.
+
+    A single pooled `httpx.AsyncClient` is opened on the first request and
+    reused by every tool call, so chained calls share keep-alive connections.
+    Call `aclose` when the MCP server shuts down.
+
+    Idempotent calls (GET, or POST carrying an `external_id`) are retried on
+    502/503/504 with `retry_policy` backoff. GETs are also retried on any
+    transport error, writes only when the connection failed before the request
+    was sent. When a resent movement hits its own `external_id`, the movement
+    created by the earlier attempt is returned. GETs can be hedged with a
+    second request after `hedge_delay_seconds`, and an optional circuit
+    breaker fails fast while the API keeps failing.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        timeout_seconds: float,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge_delay_seconds: float | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self.base_url = base_url
+        self.timeout_seconds = timeout_seconds
+        self._limits = limits or httpx.Limits()
+        self._http2 = http2
+        self._transport = transport
+        self._retry_policy = retry_policy or RetryPolicy(max_attempts=1)
+        self._hedge_delay_seconds = hedge_delay_seconds
+        self._circuit_breaker = circuit_breaker
+        self._client: httpx.AsyncClient | None = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: ParamsMapping | None = None,
+        json_body: Mapping[str, object] | None = None,
+    ) -> object:
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.before_request()
+
+        try:
+            response = await self._send_with_retries(
+                method,
+                path,
+                params=params,
+                json_body=json_body,
+            )
+        except httpx.TransportError as exc:
+            self._record_outcome(failed=True)
+            raise RuntimeError(f"API request failed: {exc!r}") from exc
+        except BaseException:
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.release()
+            raise
+
+        self._record_outcome(failed=response.status_code >= 500)
+        if response.is_success:
+            return _parse_json_response(response)
+        raise RuntimeError(_build_api_error(response))
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: ParamsMapping | None,
+        json_body: Mapping[str, object] | None,
+    ) -> httpx.Response:
+        is_write = method != "GET"
+        retryable = not is_write or bool(json_body and json_body.get("external_id"))
+        attempt = 0
+        while True:
+            attempt += 1
+            can_retry = retryable and attempt < self._retry_policy.max_attempts
+            try:
+                response = await self._send(
+                    method,
+                    path,
+                    params=params,
+                    json_body=json_body,
+                )
+            except httpx.TransportError as exc:
+                # A read timeout may hide a committed write: never resend it.
+                if not can_retry or (is_write and not isinstance(exc, NOT_SENT_ERRORS)):
+                    raise
+                record_retry()
+                await asyncio.sleep(self._retry_policy.jittered_delay_seconds(attempt))
+                continue
+
+            if is_write and attempt > 1 and json_body is not None:
+                existing = await self._existing_movement(path, json_body, response)
+                if existing is not None:
+                    return existing
+            if not can_retry or response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+            record_retry()
+            await asyncio.sleep(self._retry_delay(attempt, response))
+
+    async def _existing_movement(
+        self,
+        path: str,
+        json_body: Mapping[str, object],
+        response: httpx.Response,
+    ) -> httpx.Response | None:
+        """Return the movement an earlier attempt created, if `response` says so.
+
+        A 502/503/504 can hide a movement that was committed; resending it then
+        fails with DUPLICATE_EXTERNAL_ID, whose details locate the original.
+        """
+
+        if path != "/v1/movements" or response.status_code != 409:
+            return None
+        try:
+            payload = response.json()
+        except ValueError:
+            return None
+        if not isinstance(payload, Mapping):
+            return None
+        details = payload.get("details")
+        if payload.get("code") != "DUPLICATE_EXTERNAL_ID" or not isinstance(
+            details, Mapping
+        ):
+            return None
+
+        competence_month = details.get("competence_month")
+        payer_participant_id = details.get("payer_participant_id")
+        if competence_month is None or payer_participant_id is None:
+            return None
+        try:
+            month = date.fromisoformat(str(competence_month))
+        except ValueError:
+            return None
+        lookup = await self._send(
+            "GET",
+            "/v1/movements",
+            params={
+                "year": month.year,
+                "month": month.month,
+                "participant_id": str(payer_participant_id),
+                "external_id": str(json_body["external_id"]),
+            },
+            json_body=None,
+            # The replica may not have the movement yet.
+            headers={"X-Read-Consistency": "primary"},
+        )
+        if not lookup.is_success:
+            return None
+        try:
+            listing = lookup.json()
+        except ValueError:
+            return None
+        if not isinstance(listing, Mapping):
+            return None
+        items = listing.get("items")
+        if not isinstance(items, list) or len(items) != 1:
+            return None
+        return httpx.Response(201, json=items[0], request=response.request)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: ParamsMapping | None,
+        json_body: Mapping[str, object] | None,
+        headers: Mapping[str, str] | None = None,
+    ) -> httpx.Response:
+        client = self._get_client()
+
+        async def send_once() -> httpx.Response:
+            return await client.request(
+                method=method,
+                url=path,
+                params=params,
+                json=dict(json_body) if json_body else None,
+                headers=headers,
+            )
+
+        if method != "GET" or self._hedge_delay_seconds is None:
+            return await send_once()
+        return await _hedged(send_once, delay_seconds=self._hedge_delay_seconds)
+
+    def _retry_delay(self, attempt: int, response: httpx.Response) -> float:
+        retry_after = response.headers.get("retry-after", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), self._retry_policy.max_delay_seconds)
+        return self._retry_policy.jittered_delay_seconds(attempt)
+
+    def _record_outcome(self, *, failed: bool) -> None:
+        if self._circuit_breaker is None:
+            return
+        if failed:
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
+
+    async def aclose(self) -> None:
+        """Close pooled connections; a later request opens a new client."""
+
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            try:
+                self._client = httpx.AsyncClient(
+                    base_url=self.base_url,
+                    timeout=self.timeout_seconds,
+                    limits=self._limits,
+                    http2=self._http2,
+                    transport=self._transport,
+                )
+            except ImportError as exc:
+                raise RuntimeError(
+                    "MCP HTTP/2 support requires the 'h2' package. "
+                    "Install compras-divididas[http2] or disable MCP_API_HTTP2."
+                ) from exc
+        return self._client
+
+
+async def _hedged(
+    send: Callable[[], Coroutine[Any, Any, httpx.Response]],
+    *,
+    delay_seconds: float,
+) -> httpx.Response:
+    """Start a backup request when the first one is slower than the delay.
+
+    The first request to finish successfully wins and the other is cancelled
+    and awaited.
+    """
+
+    primary = asyncio.create_task(send())
+    done, _ = await asyncio.wait({primary}, timeout=delay_seconds)
+    if done:
+        return primary.result()
+
+    pending = {primary, asyncio.create_task(send())}
+    last_error: BaseException | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    return task.result()
+                last_error = error
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            # Let the loser unwind so its connection goes back to the pool.
+            await asyncio.wait(pending)
+    if last_error is None:
+        raise RuntimeError("Hedged request finished without a response.")
+    raise last_error
+
+
+def _parse_json_response(response: httpx.Response) -> object:
+    try:
+        return response.json()
+    except ValueError as exc:
+        raise RuntimeError(
+            f"API returned a non-JSON response with status {response.status_code}."
+        ) from exc
+
+
+def _build_api_error(response: httpx.Response) -> str:
+    try:
+        payload = response.json()
+    except ValueError:
+        text = response.text.strip()
+        if text:
+            return f"API request failed with status {response.status_code}: {text}"
+        return f"API request failed with status {response.status_code}."
+
+    if isinstance(payload, Mapping):
+        error_code = payload.get("code")
+        error_message = payload.get("message")
+        details = payload.get("details")
+        if isinstance(error_code, str) and isinstance(error_message, str):
+            if details is None:
+                return f"API error {error_code}: {error_message}"
+            return f"API error {error_code}: {error_message} | details={details}"
+
+    return f"API request failed with status {response.status_code}: {payload}"
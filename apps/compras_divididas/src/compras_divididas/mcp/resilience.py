@@ -0,0 +1,86 @@
+"""Failure isolation helpers for MCP calls to the HTTP API."""
+
+from __future__ import annotations
+
+import enum
+import time
+from collections.abc import Callable
+
+
+class CircuitState(enum.StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the API while the circuit is open."""
+
+
+class CircuitBreaker:
+    """Fails fast after consecutive API failures until a cool-down elapses.
+
+    After `reset_timeout_seconds` one trial request is let through
+    (half-open); its outcome closes or reopens the circuit.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("Circuit failure_threshold must be at least 1.")
+        if reset_timeout_seconds <= 0:
+            raise ValueError("Circuit reset_timeout_seconds must be greater than zero.")
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._clock() - self._opened_at >= self._reset_timeout_seconds:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def before_request(self) -> None:
+        """Raise `CircuitOpenError` when the request must not reach the API."""
+
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        if state is CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+        raise CircuitOpenError(
+            "API is unavailable after repeated failures; "
+            f"retry in up to {self._reset_timeout_seconds:g}s."
+        )
+
+    def release(self) -> None:
+        """Forget an admitted request that ended without an outcome."""
+
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._trial_in_flight = False
+        self._consecutive_failures += 1
+        if (
+            self._opened_at is not None
+            or self._consecutive_failures >= self._failure_threshold
+        ):
+            self._opened_at = self._clock()
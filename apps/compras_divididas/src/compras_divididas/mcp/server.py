@@ -2,20 +2,60 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from dataclasses import dataclass
-from typing import Any, Literal, Protocol
+import asyncio
+import re
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Literal, Protocol
 
-import httpx
 from fastmcp import FastMCP
 
-from compras_divididas.core.settings import get_settings
+from compras_divididas.core.settings import Settings, get_settings
+from compras_divididas.domain.retry_policy import RetryPolicy
+from compras_divididas.mcp.cache import (
+    MONTHS_TAG,
+    PARTICIPANTS_TAG,
+    RECURRENCES_TAG,
+    ParamValue,
+    ReadThroughCache,
+    build_cache_key,
+    month_tag,
+)
+from compras_divididas.mcp.resilience import CircuitBreaker
+from compras_divididas.mcp.stats import (
+    ServerStats,
+    ServerStatsMiddleware,
+    record_api_call,
+    record_cache_lookup,
+)
+
+if TYPE_CHECKING:
+    from compras_divididas.mcp.http_requester import HTTPAPIRequester
 
 MovementKind = Literal["purchase", "refund"]
 MovementFilterKind = Literal["purchase", "refund"]
 RecurrenceStatusFilter = Literal["active", "paused", "ended"]
-ParamValue = str | int | float | bool | None
+MonthProjection = Literal["summary", "report"]
 ParamsMapping = Mapping[str, ParamValue]
+IN_PROCESS_BASE_URL = "http://compras-divididas.in-process"
+MAX_FANOUT_MONTHS = 24
+LIST_PAGE_SIZE = 200
+# Fields used by the skill response templates; `compact=True` requests only these.
+COMPACT_MOVEMENT_FIELDS = (
+    "id,type,amount,description,competence_month,payer_participant_id,"
+    "external_id,original_purchase_id"
+)
+COMPACT_RECURRENCE_FIELDS = (
+    "id,status,amount,reference_day,description,"
+    "start_competence_month,end_competence_month"
+)
+COMPACT_REPORT_FIELDS = "competence_month,total_gross,total_refunds,total_net,transfer"
+DEFAULT_MAX_ITEMS = 1000
+MAX_ITEMS_LIMIT = 5000
+_COMPETENCE_MONTH_PATTERN = re.compile(r"^([0-9]{4})-(0[1-9]|1[0-2])$")
 
 
 class APIRequester(Protocol):
@@ -31,12 +71,110 @@ class APIRequester(Protocol):
     ) -> object: ...
 
 
-@dataclass(slots=True, frozen=True)
-class HTTPAPIRequester:
-    """HTTP client wrapper for compras_divididas API."""
+def _normalize_base_url(value: str) -> str:
+    return value.rstrip("/")
+
+
+def _recurrence_first_months(result: object) -> list[date] | None:
+    """Return the first month each written recurrence can still generate into.
+
+    Months before a rule's `next_competence_month` are already generated, so
+    a recurrence write cannot change what they show. Returns None when the
+    response does not say, e.g. a projected or unexpected payload.
+    """
+
+    if not isinstance(result, Mapping):
+        return None
+    items = result.get("items")
+    if isinstance(items, list):
+        recurrences = [
+            item.get("recurrence")
+            for item in items
+            if isinstance(item, Mapping) and item.get("recurrence") is not None
+        ]
+    else:
+        recurrences = [result]
+
+    months: list[date] = []
+    for recurrence in recurrences:
+        next_month = (
+            recurrence.get("next_competence_month")
+            if isinstance(recurrence, Mapping)
+            else None
+        )
+        if not isinstance(next_month, str):
+            return None
+        try:
+            months.append(date.fromisoformat(f"{next_month}-01"))
+        except ValueError:
+            return None
+    return months
+
+
+def _movement_month_tags(occurred_at: str | None) -> tuple[str, ...]:
+    """Return cache tags of the months a new movement can land in."""
 
-    base_url: str
-    timeout_seconds: float
+    if occurred_at is None:
+        return (MONTHS_TAG,)
+    try:
+        occurred_on = date.fromisoformat(occurred_at[:10])
+    except ValueError:
+        return (MONTHS_TAG,)
+
+    tags = [month_tag(occurred_on.year, occurred_on.month)]
+    # Timestamps near a month boundary may fall in the neighbouring month once
+    # converted to the app timezone.
+    if occurred_on.day == 1:
+        previous_day = occurred_on - timedelta(days=1)
+        tags.append(month_tag(previous_day.year, previous_day.month))
+    elif (occurred_on + timedelta(days=1)).day == 1:
+        next_day = occurred_on + timedelta(days=1)
+        tags.append(month_tag(next_day.year, next_day.month))
+    return tuple(tags)
+
+
+def _parse_fanout_months(months: list[str]) -> list[tuple[int, int]]:
+    if not months:
+        raise ValueError("months must contain at least one YYYY-MM value.")
+    if len(months) > MAX_FANOUT_MONTHS:
+        raise ValueError(f"months accepts at most {MAX_FANOUT_MONTHS} values.")
+
+    parsed: list[tuple[int, int]] = []
+    for value in months:
+        match = _COMPETENCE_MONTH_PATTERN.match(value)
+        if match is None:
+            raise ValueError(f"Invalid competence month '{value}'; use YYYY-MM.")
+        year_month = (int(match.group(1)), int(match.group(2)))
+        if year_month not in parsed:
+            parsed.append(year_month)
+    return parsed
+
+
+def _as_list_page(payload: object) -> tuple[list[Mapping[str, object]], int]:
+    if not isinstance(payload, Mapping):
+        raise RuntimeError("API returned an unexpected list payload.")
+    items = payload.get("items")
+    total = payload.get("total")
+    if not isinstance(items, list) or not isinstance(total, int):
+        raise RuntimeError("API returned an unexpected list payload.")
+    return [item for item in items if isinstance(item, Mapping)], total
+
+
+class _DeferredRequester:
+    """Builds the HTTP requester in a worker thread on first use.
+
+    The MCP lifespan calls `start`, so `httpx` and, in-process, the FastAPI
+    app are imported while the client handshake runs instead of before the
+    server can answer it.
+    """
+
+    def __init__(self, build: Callable[[], HTTPAPIRequester]) -> None:
+        self._build = build
+        self._task: asyncio.Task[HTTPAPIRequester] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(asyncio.to_thread(self._build))
 
     async def request(
         self,
@@ -46,54 +184,99 @@ class HTTPAPIRequester:
         params: ParamsMapping | None = None,
         json_body: Mapping[str, object] | None = None,
     ) -> object:
-        async with httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout_seconds,
-        ) as client:
-            response = await client.request(
-                method=method,
-                url=path,
-                params=params,
-                json=dict(json_body) if json_body else None,
-            )
+        self.start()
+        if self._task is None:
+            raise RuntimeError("MCP API requester was not started.")
+        # Shielded so a cancelled tool call does not abort the shared build.
+        requester = await asyncio.shield(self._task)
+        return await requester.request(
+            method,
+            path,
+            params=params,
+            json_body=json_body,
+        )
 
-        if response.is_success:
-            return _parse_json_response(response)
-        raise RuntimeError(_build_api_error(response))
+    async def aclose(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        try:
+            requester = await task
+        except Exception:
+            return
+        await requester.aclose()
 
 
-def _parse_json_response(response: httpx.Response) -> object:
-    try:
-        return response.json()
-    except ValueError as exc:
-        raise RuntimeError(
-            f"API returned a non-JSON response with status {response.status_code}."
-        ) from exc
+class _TimedRequester:
+    """Adds the time spent waiting on the API to the running tool call trace."""
 
+    def __init__(self, requester: APIRequester) -> None:
+        self._requester = requester
 
-def _build_api_error(response: httpx.Response) -> str:
-    try:
-        payload = response.json()
-    except ValueError:
-        text = response.text.strip()
-        if text:
-            return f"API request failed with status {response.status_code}: {text}"
-        return f"API request failed with status {response.status_code}."
-
-    if isinstance(payload, Mapping):
-        error_code = payload.get("code")
-        error_message = payload.get("message")
-        details = payload.get("details")
-        if isinstance(error_code, str) and isinstance(error_message, str):
-            if details is None:
-                return f"API error {error_code}: {error_message}"
-            return f"API error {error_code}: {error_message} | details={details}"
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: ParamsMapping | None = None,
+        json_body: Mapping[str, object] | None = None,
+    ) -> object:
+        started_at = perf_counter()
+        try:
+            return await self._requester.request(
+                method,
+                path,
+                params=params,
+                json_body=json_body,
+            )
+        finally:
+            record_api_call(perf_counter() - started_at)
 
-    return f"API request failed with status {response.status_code}: {payload}"
 
+def _build_http_requester(
+    *,
+    settings: Settings,
+    base_url: str,
+    timeout_seconds: float,
+    in_process: bool,
+) -> HTTPAPIRequester:
+    import httpx
+
+    from compras_divididas.mcp.http_requester import HTTPAPIRequester
+
+    if in_process:
+        from compras_divididas.api.app import create_app
+
+        return HTTPAPIRequester(
+            base_url=IN_PROCESS_BASE_URL,
+            timeout_seconds=timeout_seconds,
+            transport=httpx.ASGITransport(app=create_app()),
+        )
 
-def _normalize_base_url(value: str) -> str:
-    return value.rstrip("/")
+    return HTTPAPIRequester(
+        base_url=base_url,
+        timeout_seconds=timeout_seconds,
+        limits=httpx.Limits(
+            max_connections=settings.mcp_api_max_connections,
+            max_keepalive_connections=settings.mcp_api_max_keepalive_connections,
+            keepalive_expiry=settings.mcp_api_keepalive_expiry_seconds,
+        ),
+        http2=settings.mcp_api_http2,
+        retry_policy=RetryPolicy(
+            base_delay_seconds=settings.mcp_api_retry_base_delay_seconds,
+            max_delay_seconds=settings.mcp_api_retry_max_delay_seconds,
+            max_attempts=settings.mcp_api_retry_attempts,
+        ),
+        hedge_delay_seconds=settings.mcp_api_hedge_delay_seconds,
+        circuit_breaker=(
+            CircuitBreaker(
+                failure_threshold=settings.mcp_api_circuit_failure_threshold,
+                reset_timeout_seconds=settings.mcp_api_circuit_reset_seconds,
+            )
+            if settings.mcp_api_circuit_failure_threshold > 0
+            else None
+        ),
+    )
 
 
 def create_mcp_server(
@@ -101,8 +284,18 @@ def create_mcp_server(
     api_base_url: str | None = None,
     timeout_seconds: float | None = None,
     requester: APIRequester | None = None,
+    in_process: bool | None = None,
+    cache_ttl_seconds: float | None = None,
+    trace_file: Path | None = None,
 ) -> FastMCP:
-    """Create MCP server with curated tools mapped to REST endpoints."""
+    """Create MCP server with curated tools mapped to REST endpoints.
+
+    With `in_process`, tools call the FastAPI app through an ASGI transport in
+    this process instead of reaching a separate API server over the network.
+    Read tools are served from a TTL cache that write tools invalidate.
+    Every tool call is timed for `get_server_stats` and, with `trace_file`,
+    appended to a JSONL trace.
+    """
 
     settings = get_settings()
     resolved_base_url = _normalize_base_url(api_base_url or settings.mcp_api_base_url)
@@ -112,17 +305,176 @@ def create_mcp_server(
     if resolved_timeout <= 0:
         raise ValueError("MCP API timeout must be greater than zero.")
 
-    mcp = FastMCP(name="Compras Divididas")
-    api_requester: APIRequester = requester or HTTPAPIRequester(
-        base_url=resolved_base_url,
-        timeout_seconds=resolved_timeout,
+    read_cache = ReadThroughCache(
+        ttl_seconds=(
+            settings.mcp_cache_ttl_seconds
+            if cache_ttl_seconds is None
+            else cache_ttl_seconds
+        )
     )
 
+    if trace_file is None and settings.mcp_trace_file:
+        trace_file = Path(settings.mcp_trace_file)
+    server_stats = ServerStats(trace_path=trace_file)
+    stats_middleware = [ServerStatsMiddleware(server_stats)]
+
+    def invalidate_recurrence_write(result: object) -> None:
+        read_cache.invalidate(RECURRENCES_TAG)
+        first_months = _recurrence_first_months(result)
+        if first_months is None:
+            read_cache.invalidate(MONTHS_TAG)
+        elif first_months:
+            earliest = min(first_months)
+            read_cache.invalidate_months_from(earliest.year, earliest.month)
+
+    async def cached_get(
+        path: str,
+        *,
+        tags: frozenset[str],
+        params: dict[str, ParamValue] | None = None,
+    ) -> object:
+        loaded = False
+
+        async def load() -> object:
+            nonlocal loaded
+            loaded = True
+            return await api_requester.request("GET", path, params=params)
+
+        value = await read_cache.get_or_load(
+            build_cache_key(path, params),
+            tags=tags,
+            loader=load,
+        )
+        record_cache_lookup(hit=not loaded)
+        return value
+
+    fanout_semaphore = asyncio.Semaphore(settings.mcp_fanout_concurrency)
+
+    async def fetch_all_pages(
+        path: str,
+        *,
+        tags: frozenset[str],
+        params: dict[str, ParamValue],
+        max_items: int,
+    ) -> dict[str, object]:
+        """Fetch every page of an offset-paginated list, merged by item id."""
+
+        if not 1 <= max_items <= MAX_ITEMS_LIMIT:
+            raise ValueError(f"max_items must be between 1 and {MAX_ITEMS_LIMIT}.")
+
+        page_size = min(LIST_PAGE_SIZE, max_items)
+
+        async def fetch_page(offset: int) -> list[Mapping[str, object]]:
+            async with fanout_semaphore:
+                payload = await cached_get(
+                    path,
+                    tags=tags,
+                    params={**params, "limit": page_size, "offset": offset},
+                )
+            items, _ = _as_list_page(payload)
+            return items
+
+        async with fanout_semaphore:
+            first_payload = await cached_get(
+                path,
+                tags=tags,
+                params={**params, "limit": page_size, "offset": 0},
+            )
+        first_items, total = _as_list_page(first_payload)
+        remaining_pages = await asyncio.gather(
+            *(
+                fetch_page(offset)
+                for offset in range(page_size, min(total, max_items), page_size)
+            )
+        )
+
+        merged: list[Mapping[str, object]] = []
+        seen_ids: set[object] = set()
+        for page in (first_items, *remaining_pages):
+            for item in page:
+                item_id = item.get("id")
+                if item_id in seen_ids:
+                    continue
+                seen_ids.add(item_id)
+                merged.append(item)
+        merged = merged[:max_items]
+        return {
+            "items": merged,
+            "total": total,
+            "returned_count": len(merged),
+            "truncated": len(merged) < total,
+        }
+
+    async def get_month_projection(
+        year: int,
+        month: int,
+        projection: MonthProjection,
+        auto_generate: bool,
+        compact: bool = False,
+    ) -> object:
+        path = f"/v1/months/{year}/{month}/{projection}"
+        params: dict[str, ParamValue] = {}
+        if compact and projection == "report":
+            params["fields"] = COMPACT_REPORT_FIELDS
+        if auto_generate:
+            params["auto_generate"] = True
+            key = build_cache_key(path, params)
+            if not read_cache.has_fresh(key):
+                # Generation may add movements, so month reads cached before it
+                # are refreshed together with this projection.
+                read_cache.invalidate(month_tag(year, month))
+        return await cached_get(
+            path,
+            tags=frozenset({MONTHS_TAG, month_tag(year, month)}),
+            params=params or None,
+        )
+
+    api_requester: APIRequester
+    if requester is None:
+        resolved_in_process = (
+            settings.mcp_in_process if in_process is None else in_process
+        )
+        http_requester = _DeferredRequester(
+            lambda: _build_http_requester(
+                settings=settings,
+                base_url=resolved_base_url,
+                timeout_seconds=resolved_timeout,
+                in_process=resolved_in_process,
+            )
+        )
+
+        @asynccontextmanager
+        async def http_requester_lifespan(_: FastMCP) -> AsyncIterator[None]:
+            http_requester.start()
+            try:
+                yield
+            finally:
+                await http_requester.aclose()
+                if resolved_in_process:
+                    # The in-process app runs without its own lifespan, so
+                    # the engines it built are disposed here, as the CLI does.
+                    from compras_divididas.db.session import dispose_databases
+
+                    await dispose_databases()
+
+        mcp = FastMCP(
+            name="Compras Divididas",
+            lifespan=http_requester_lifespan,
+            middleware=stats_middleware,
+        )
+        api_requester = _TimedRequester(http_requester)
+    else:
+        mcp = FastMCP(name="Compras Divididas", middleware=stats_middleware)
+        api_requester = _TimedRequester(requester)
+
     @mcp.tool
     async def list_participants() -> object:
         """List active participants used by reconciliation."""
 
-        return await api_requester.request("GET", "/v1/participants")
+        return await cached_get(
+            "/v1/participants",
+            tags=frozenset({PARTICIPANTS_TAG}),
+        )
 
     @mcp.tool
     async def list_movements(
@@ -135,15 +487,20 @@ def create_mcp_server(
         external_id: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        all_pages: bool = False,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        compact: bool = False,
     ) -> object:
-        """List movements for a month with optional filters."""
+        """List movements for a month with optional filters.
 
-        params: dict[str, ParamValue] = {
-            "year": year,
-            "month": month,
-            "limit": limit,
-            "offset": offset,
-        }
+        With `all_pages`, `limit`/`offset` are ignored and up to `max_items`
+        movements are fetched across pages and merged into one list.
+        With `compact`, each movement carries only the fields used in replies.
+        """
+
+        params: dict[str, ParamValue] = {"year": year, "month": month}
+        if compact:
+            params["fields"] = COMPACT_MOVEMENT_FIELDS
         if type is not None:
             params["type"] = type
         if description is not None:
@@ -155,7 +512,19 @@ def create_mcp_server(
         if external_id is not None:
             params["external_id"] = external_id
 
-        return await api_requester.request("GET", "/v1/movements", params=params)
+        tags = frozenset({MONTHS_TAG, month_tag(year, month)})
+        if all_pages:
+            return await fetch_all_pages(
+                "/v1/movements",
+                tags=tags,
+                params=params,
+                max_items=max_items,
+            )
+        return await cached_get(
+            "/v1/movements",
+            tags=tags,
+            params={**params, "limit": limit, "offset": offset},
+        )
 
     @mcp.tool
     async def create_recurrence(
@@ -182,11 +551,13 @@ def create_mcp_server(
         if end_competence_month is not None:
             payload["end_competence_month"] = end_competence_month
 
-        return await api_requester.request(
+        result = await api_requester.request(
             "POST",
             "/v1/recurrences",
             json_body=payload,
         )
+        invalidate_recurrence_write(result)
+        return result
 
     @mcp.tool
     async def list_recurrences(
@@ -195,23 +566,42 @@ def create_mcp_server(
         month: int | None = None,
         limit: int = 50,
         offset: int = 0,
+        all_pages: bool = False,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        compact: bool = False,
     ) -> object:
-        """List recurrences with optional status/month filters."""
+        """List recurrences with optional status/month filters.
+
+        With `all_pages`, `limit`/`offset` are ignored and up to `max_items`
+        recurrences are fetched across pages and merged into one list.
+        With `compact`, each recurrence carries only the fields used in replies.
+        """
 
         if (year is None) != (month is None):
             raise ValueError("year and month filters must be provided together.")
 
-        params: dict[str, ParamValue] = {
-            "limit": limit,
-            "offset": offset,
-        }
+        params: dict[str, ParamValue] = {}
+        if compact:
+            params["fields"] = COMPACT_RECURRENCE_FIELDS
         if status is not None:
             params["status"] = status
         if year is not None:
             params["year"] = year
             params["month"] = month
 
-        return await api_requester.request("GET", "/v1/recurrences", params=params)
+        tags = frozenset({RECURRENCES_TAG})
+        if all_pages:
+            return await fetch_all_pages(
+                "/v1/recurrences",
+                tags=tags,
+                params=params,
+                max_items=max_items,
+            )
+        return await cached_get(
+            "/v1/recurrences",
+            tags=tags,
+            params={**params, "limit": limit, "offset": offset},
+        )
 
     @mcp.tool
     async def edit_recurrence(
@@ -254,11 +644,13 @@ def create_mcp_server(
         if clear_end_competence_month:
             payload["end_competence_month"] = None
 
-        return await api_requester.request(
+        result = await api_requester.request(
             "PATCH",
             f"/v1/recurrences/{recurrence_id}",
             json_body=payload,
         )
+        invalidate_recurrence_write(result)
+        return result
 
     @mcp.tool
     async def end_recurrence(
@@ -274,11 +666,13 @@ def create_mcp_server(
         if end_competence_month is not None:
             payload["end_competence_month"] = end_competence_month
 
-        return await api_requester.request(
+        result = await api_requester.request(
             "POST",
             f"/v1/recurrences/{recurrence_id}/end",
             json_body=payload,
         )
+        invalidate_recurrence_write(result)
+        return result
 
     @mcp.tool
     async def create_movement(
@@ -311,11 +705,52 @@ def create_mcp_server(
         if original_purchase_external_id is not None:
             payload["original_purchase_external_id"] = original_purchase_external_id
 
-        return await api_requester.request(
+        result = await api_requester.request(
             "POST",
             "/v1/movements",
             json_body=payload,
         )
+        read_cache.invalidate(*_movement_month_tags(occurred_at))
+        return result
+
+    @mcp.tool
+    async def create_movements_batch(items: list[dict[str, Any]]) -> object:
+        """Create up to 100 movements in one call with one outcome per item.
+
+        Each item takes the same fields as `create_movement`. Items are saved in
+        order and independently: a rejected item does not undo the others.
+        """
+
+        result = await api_requester.request(
+            "POST",
+            "/v1/movements/batch",
+            json_body={"items": items},
+        )
+        tags: set[str] = set()
+        for item in items:
+            occurred_at = item.get("occurred_at")
+            tags.update(
+                _movement_month_tags(
+                    occurred_at if isinstance(occurred_at, str) else None
+                )
+            )
+        read_cache.invalidate(*tags)
+        return result
+
+    @mcp.tool
+    async def create_recurrences_batch(items: list[dict[str, Any]]) -> object:
+        """Create up to 100 recurrences in one call with one outcome per item.
+
+        Each item takes the same fields as `create_recurrence`.
+        """
+
+        result = await api_requester.request(
+            "POST",
+            "/v1/recurrences/batch",
+            json_body={"items": items},
+        )
+        invalidate_recurrence_write(result)
+        return result
 
     @mcp.tool
     async def get_monthly_summary(
@@ -325,30 +760,59 @@ def create_mcp_server(
     ) -> object:
         """Return monthly summary projection for a competence month."""
 
-        params: dict[str, ParamValue] = {}
-        if auto_generate:
-            params["auto_generate"] = True
-        return await api_requester.request(
-            "GET",
-            f"/v1/months/{year}/{month}/summary",
-            params=params if params else None,
-        )
+        return await get_month_projection(year, month, "summary", auto_generate)
 
     @mcp.tool
     async def get_monthly_report(
         year: int,
         month: int,
         auto_generate: bool = False,
+        compact: bool = False,
     ) -> object:
-        """Return monthly report projection for a competence month."""
+        """Return monthly report projection for a competence month.
 
-        params: dict[str, ParamValue] = {}
-        if auto_generate:
-            params["auto_generate"] = True
-        return await api_requester.request(
-            "GET",
-            f"/v1/months/{year}/{month}/report",
-            params=params if params else None,
+        With `compact`, per-participant balances are omitted.
+        """
+
+        return await get_month_projection(
+            year, month, "report", auto_generate, compact=compact
         )
 
+    @mcp.tool
+    async def get_monthly_projections(
+        months: list[str],
+        projection: MonthProjection = "summary",
+        auto_generate: bool = False,
+        compact: bool = False,
+    ) -> object:
+        """Return summaries or reports for several YYYY-MM months in one call.
+
+        Months are fetched concurrently. A month that fails carries an `error`
+        instead of `data` without failing the other months.
+        """
+
+        year_months = _parse_fanout_months(months)
+
+        async def fetch(year: int, month: int) -> dict[str, object]:
+            competence_month = f"{year:04d}-{month:02d}"
+            async with fanout_semaphore:
+                try:
+                    data = await get_month_projection(
+                        year, month, projection, auto_generate, compact=compact
+                    )
+                except RuntimeError as exc:
+                    return {"competence_month": competence_month, "error": str(exc)}
+            return {"competence_month": competence_month, "data": data}
+
+        items = await asyncio.gather(
+            *(fetch(year, month) for year, month in year_months)
+        )
+        return {"projection": projection, "items": list(items)}
+
+    @mcp.tool
+    async def get_server_stats() -> object:
+        """Report per-tool latency, API time, retries and cache use since startup."""
+
+        return {**server_stats.snapshot(), "cache_entries": len(read_cache)}
+
     return mcp
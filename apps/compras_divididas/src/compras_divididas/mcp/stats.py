@@ -0,0 +1,240 @@
+"""Per-tool latency statistics collected by the MCP server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import mcp.types as mt
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools import ToolResult
+
+from compras_divididas.core.latency import percentile, seconds_to_ms
+
+logger = logging.getLogger(__name__)
+
+LATENCY_WINDOW_SIZE = 256
+
+_current_trace: ContextVar[ToolCallTrace | None] = ContextVar(
+    "mcp_tool_call_trace",
+    default=None,
+)
+
+
+@dataclass(slots=True)
+class ToolCallTrace:
+    """Measurements gathered while a single tool call runs."""
+
+    tool: str
+    api_calls: int = 0
+    api_seconds: float = 0.0
+    retries: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+def record_api_call(seconds: float) -> None:
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.api_calls += 1
+        trace.api_seconds += seconds
+
+
+def record_retry() -> None:
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.retries += 1
+
+
+def record_cache_lookup(*, hit: bool) -> None:
+    trace = _current_trace.get()
+    if trace is None:
+        return
+    if hit:
+        trace.cache_hits += 1
+    else:
+        trace.cache_misses += 1
+
+
+@dataclass(slots=True)
+class _ToolStats:
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    api_calls: int = 0
+    api_seconds: float = 0.0
+    overhead_seconds: float = 0.0
+    retries: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    payload_bytes_total: int = 0
+    payload_bytes_max: int = 0
+    recent_seconds: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_WINDOW_SIZE)
+    )
+
+    def as_dict(self) -> dict[str, object]:
+        recent = sorted(self.recent_seconds)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "mean_ms": seconds_to_ms(
+                self.total_seconds / self.calls if self.calls else 0.0
+            ),
+            "p50_ms": seconds_to_ms(percentile(recent, 0.50)),
+            "p95_ms": seconds_to_ms(percentile(recent, 0.95)),
+            "max_ms": seconds_to_ms(self.max_seconds),
+            "api_calls": self.api_calls,
+            "api_ms_total": seconds_to_ms(self.api_seconds),
+            "mcp_overhead_ms_total": seconds_to_ms(self.overhead_seconds),
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "payload_bytes_total": self.payload_bytes_total,
+            "payload_bytes_max": self.payload_bytes_max,
+        }
+
+
+class ServerStats:
+    """Aggregates tool call measurements and optionally appends a JSONL trace.
+
+    MCP overhead is the part of a call not spent waiting on the API: argument
+    validation, caching, merging pages and serializing the result.
+    """
+
+    def __init__(
+        self,
+        *,
+        trace_path: Path | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._trace_path = trace_path
+        self._clock = clock
+        self._started_at = clock()
+        self._tools: dict[str, _ToolStats] = {}
+
+    def start_call(self, tool: str) -> tuple[ToolCallTrace, float]:
+        trace = ToolCallTrace(tool=tool)
+        return trace, self._clock()
+
+    async def finish_call(
+        self,
+        trace: ToolCallTrace,
+        *,
+        started_at: float,
+        ok: bool,
+        payload_bytes: int,
+    ) -> None:
+        duration = self._clock() - started_at
+        # Concurrent API calls of one tool can add up to more than its duration.
+        overhead = max(duration - trace.api_seconds, 0.0)
+
+        stats = self._tools.setdefault(trace.tool, _ToolStats())
+        stats.calls += 1
+        stats.errors += 0 if ok else 1
+        stats.total_seconds += duration
+        stats.max_seconds = max(stats.max_seconds, duration)
+        stats.api_calls += trace.api_calls
+        stats.api_seconds += trace.api_seconds
+        stats.overhead_seconds += overhead
+        stats.retries += trace.retries
+        stats.cache_hits += trace.cache_hits
+        stats.cache_misses += trace.cache_misses
+        stats.payload_bytes_total += payload_bytes
+        stats.payload_bytes_max = max(stats.payload_bytes_max, payload_bytes)
+        stats.recent_seconds.append(duration)
+
+        if self._trace_path is None:
+            return
+        record: dict[str, object] = {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "tool": trace.tool,
+            "status": "ok" if ok else "error",
+            "duration_ms": seconds_to_ms(duration),
+            "api_ms": seconds_to_ms(trace.api_seconds),
+            "mcp_overhead_ms": seconds_to_ms(overhead),
+            "api_calls": trace.api_calls,
+            "retries": trace.retries,
+            "cache_hits": trace.cache_hits,
+            "cache_misses": trace.cache_misses,
+            "payload_bytes": payload_bytes,
+        }
+        # File I/O runs in a worker thread so tracing never blocks the loop,
+        # and a failed write never changes what the tool call returns.
+        try:
+            await asyncio.to_thread(_append_trace, self._trace_path, record)
+        except OSError:
+            logger.warning(
+                "mcp_trace_write_failed",
+                extra={"trace_path": str(self._trace_path), "tool": trace.tool},
+                exc_info=True,
+            )
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "uptime_seconds": round(self._clock() - self._started_at, 3),
+            "tools": {
+                name: stats.as_dict() for name, stats in sorted(self._tools.items())
+            },
+        }
+
+
+class ServerStatsMiddleware(Middleware):
+    """Times every tool call and exposes its trace to the code it runs."""
+
+    def __init__(self, stats: ServerStats) -> None:
+        self._stats = stats
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        trace, started_at = self._stats.start_call(context.message.name)
+        token = _current_trace.set(trace)
+        try:
+            result = await call_next(context)
+        except Exception:
+            await self._stats.finish_call(
+                trace,
+                started_at=started_at,
+                ok=False,
+                payload_bytes=0,
+            )
+            raise
+        finally:
+            _current_trace.reset(token)
+
+        await self._stats.finish_call(
+            trace,
+            started_at=started_at,
+            ok=not result.is_error,
+            payload_bytes=_payload_bytes(result),
+        )
+        return result
+
+
+def _append_trace(trace_path: Path, record: dict[str, object]) -> None:
+    trace_path.parent.mkdir(parents=True, exist_ok=True)
+    # One write per record in append mode keeps concurrent lines whole.
+    with trace_path.open("a", encoding="utf-8") as trace_file:
+        trace_file.write(json.dumps(record) + "\n")
+
+
+def _payload_bytes(result: ToolResult) -> int:
+    size = 0
+    for block in result.content:
+        text: Any = getattr(block, "text", None)
+        if isinstance(text, str):
+            size += len(text.encode("utf-8"))
+    return size
@@ -7,7 +7,7 @@ from datetime import date
 from decimal import Decimal
 
 from sqlalchemy import Select, case, func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from compras_divididas.db.models.financial_movement import (
     FinancialMovement,
@@ -33,17 +33,17 @@ class MovementQueryFilters:
 class MovementQueryRepository:
     """Repository focused on read use cases for US2."""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    def list_movements(
+    async def list_movements(
         self,
         filters: MovementQueryFilters,
     ) -> tuple[list[FinancialMovement], int]:
         statement = self._apply_filters(select(FinancialMovement), filters)
 
         total_statement = select(func.count()).select_from(statement.subquery())
-        total = int(self._session.scalar(total_statement) or 0)
+        total = int(await self._session.scalar(total_statement) or 0)
 
         page_statement = (
             statement.order_by(
@@ -53,10 +53,10 @@ class MovementQueryRepository:
             .limit(filters.limit)
             .offset(filters.offset)
         )
-        items = list(self._session.scalars(page_statement).all())
+        items = list((await self._session.scalars(page_statement)).all())
         return items, total
 
-    def get_monthly_totals(
+    async def get_monthly_totals(
         self, competence_month: date
     ) -> tuple[Decimal, Decimal, Decimal]:
         """Return gross, refunds and net totals for the month."""
@@ -75,14 +75,14 @@ class MovementQueryRepository:
         )
 
         gross = quantize_money(
-            Decimal(self._session.scalar(gross_statement) or Decimal("0"))
+            Decimal(await self._session.scalar(gross_statement) or Decimal("0"))
         )
         refunds = quantize_money(
-            Decimal(self._session.scalar(refunds_statement) or Decimal("0"))
+            Decimal(await self._session.scalar(refunds_statement) or Decimal("0"))
         )
         return gross, refunds, quantize_money(gross - refunds)
 
-    def get_paid_totals_by_participant(
+    async def get_paid_totals_by_participant(
         self, competence_month: date
     ) -> dict[str, Decimal]:
         """Aggregate paid total by participant, subtracting refunds."""
@@ -108,7 +108,7 @@ class MovementQueryRepository:
             .group_by(FinancialMovement.payer_participant_id)
         )
 
-        rows = self._session.execute(statement).all()
+        rows = (await self._session.execute(statement)).all()
         return {
             str(participant_id): quantize_money(Decimal(total))
             for participant_id, total in rows
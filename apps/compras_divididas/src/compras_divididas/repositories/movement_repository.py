@@ -7,7 +7,7 @@ from decimal import Decimal
 from uuid import UUID
 
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from compras_divididas.db.models.financial_movement import (
     FinancialMovement,
@@ -18,10 +18,10 @@ from compras_divididas.db.models.financial_movement import (
 class MovementRepository:
     """Repository for append-only movement persistence and lookup."""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    def has_duplicate_external_id(
+    async def has_duplicate_external_id(
         self,
         *,
         competence_month: date,
@@ -33,9 +33,11 @@ class MovementRepository:
             FinancialMovement.payer_participant_id == payer_participant_id,
             FinancialMovement.external_id == external_id,
         )
-        return self._session.scalar(statement) is not None
+        return await self._session.scalar(statement) is not None
 
-    def get_purchase_for_update(self, purchase_id: UUID) -> FinancialMovement | None:
+    async def get_purchase_for_update(
+        self, purchase_id: UUID
+    ) -> FinancialMovement | None:
         statement = (
             select(FinancialMovement)
             .where(
@@ -44,9 +46,9 @@ class MovementRepository:
             )
             .with_for_update()
         )
-        return self._session.scalar(statement)
+        return await self._session.scalar(statement)
 
-    def get_purchase_by_external_id_for_update(
+    async def get_purchase_by_external_id_for_update(
         self,
         *,
         competence_month: date,
@@ -63,21 +65,21 @@ class MovementRepository:
             )
             .with_for_update()
         )
-        return self._session.scalar(statement)
+        return await self._session.scalar(statement)
 
-    def get_total_refunded_amount(self, original_purchase_id: UUID) -> Decimal:
+    async def get_total_refunded_amount(self, original_purchase_id: UUID) -> Decimal:
         statement = select(
             func.coalesce(func.sum(FinancialMovement.amount), Decimal("0.00"))
         ).where(
             FinancialMovement.movement_type == MovementType.REFUND,
             FinancialMovement.original_purchase_id == original_purchase_id,
         )
-        refunded_amount = self._session.scalar(statement)
+        refunded_amount = await self._session.scalar(statement)
         if refunded_amount is None:
             return Decimal("0.00")
         return Decimal(refunded_amount)
 
-    def add(self, movement: FinancialMovement) -> FinancialMovement:
+    async def add(self, movement: FinancialMovement) -> FinancialMovement:
         self._session.add(movement)
-        self._session.flush()
+        await self._session.flush()
         return movement
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from compras_divididas.db.models.participant import Participant
 from compras_divididas.domain.errors import DomainInvariantError, compose_error_message
@@ -12,16 +12,16 @@ from compras_divididas.domain.errors import DomainInvariantError, compose_error_
 class ParticipantRepository:
     """Repository for active participants used by financial flows."""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    def list_active_exactly_two(self) -> list[Participant]:
+    async def list_active_exactly_two(self) -> list[Participant]:
         statement = (
             select(Participant)
             .where(Participant.is_active.is_(True))
             .order_by(Participant.id.asc())
         )
-        participants = list(self._session.scalars(statement).all())
+        participants = list((await self._session.scalars(statement)).all())
         if len(participants) != 2:
             raise DomainInvariantError(
                 message=compose_error_message(
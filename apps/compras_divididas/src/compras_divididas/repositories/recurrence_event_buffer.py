@@ -0,0 +1,84 @@
+"""Unit-of-work buffer for append-only recurrence events."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session, SessionTransaction
+
+from compras_divididas.db.models.recurrence_event import RecurrenceEvent
+
+_SESSION_INFO_KEY = "recurrence_event_buffer"
+
+
+class RecurrenceEventBuffer:
+    """Collects recurrence events and writes them as one multi-row insert.
+
+    The buffer is bound to one session and flushed right before the session
+    commits, after pending ORM changes, so events keep their append order and
+    their foreign keys are already persisted. Rolling back the outermost
+    transaction discards buffered events.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        self._pending: list[RecurrenceEvent] = []
+        event.listen(session, "before_commit", self._on_before_commit)
+        event.listen(session, "after_transaction_end", self._on_transaction_end)
+
+    @classmethod
+    def for_session(cls, session: Session) -> RecurrenceEventBuffer:
+        """Return the buffer bound to a session, creating it on first use."""
+
+        buffer: RecurrenceEventBuffer | None = session.info.get(_SESSION_INFO_KEY)
+        if buffer is None:
+            buffer = cls(session)
+            session.info[_SESSION_INFO_KEY] = buffer
+        return buffer
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def append(self, recurrence_event: RecurrenceEvent) -> None:
+        """Queue one event to be written with the current unit of work."""
+
+        if not self._session.in_transaction():
+            self._session.begin()
+        self._pending.append(recurrence_event)
+
+    def flush(self) -> int:
+        """Write all pending events and return how many rows were inserted."""
+
+        if not self._pending:
+            return 0
+
+        rows = [self._to_row(item) for item in self._pending]
+        self._pending = []
+        self._session.flush()
+        self._session.execute(insert(RecurrenceEvent), rows)
+        return len(rows)
+
+    def discard(self) -> None:
+        """Drop pending events without writing them."""
+
+        self._pending = []
+
+    def _on_before_commit(self, _: Session) -> None:
+        self.flush()
+
+    def _on_transaction_end(self, _: Session, transaction: SessionTransaction) -> None:
+        if transaction.parent is None:
+            self.discard()
+
+    @staticmethod
+    def _to_row(recurrence_event: RecurrenceEvent) -> dict[str, Any]:
+        return {
+            "id": recurrence_event.id,
+            "recurrence_rule_id": recurrence_event.recurrence_rule_id,
+            "recurrence_occurrence_id": recurrence_event.recurrence_occurrence_id,
+            "event_type": recurrence_event.event_type,
+            "actor_participant_id": recurrence_event.actor_participant_id,
+            "payload": recurrence_event.payload,
+            "created_at": recurrence_event.created_at,
+        }
@@ -6,11 +6,23 @@ from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from typing import Any
-from uuid import UUID
-
-from sqlalchemy import Select, func, or_, select
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    Boolean,
+    Date,
+    Select,
+    and_,
+    cast,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+)
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
 from compras_divididas.db.models.financial_movement import (
     FinancialMovement,
@@ -20,6 +32,10 @@ from compras_divididas.db.models.recurrence_event import (
     RecurrenceEvent,
     RecurrenceEventType,
 )
+from compras_divididas.db.models.recurrence_generation_run import (
+    RecurrenceGenerationRun,
+    RecurrenceGenerationTrigger,
+)
 from compras_divididas.db.models.recurrence_occurrence import (
     RecurrenceOccurrence,
     RecurrenceOccurrenceStatus,
@@ -28,6 +44,10 @@ from compras_divididas.db.models.recurrence_rule import (
     RecurrencePeriodicity,
     RecurrenceRule,
     RecurrenceStatus,
+    active_period_expression,
+)
+from compras_divididas.repositories.recurrence_event_buffer import (
+    RecurrenceEventBuffer,
 )
 
 
@@ -49,19 +69,41 @@ class RecurrenceListFilters:
     offset: int = 0
 
 
+@dataclass(slots=True, frozen=True)
+class GenerationRunListFilters:
+    """Filters for listing recurrence generation runs."""
+
+    competence_month: date | None = None
+    trigger: RecurrenceGenerationTrigger | None = None
+    limit: int = 20
+
+
+@dataclass(slots=True, frozen=True)
+class RecurrenceEventListFilters:
+    """Filters for the recurrence event audit query."""
+
+    recurrence_rule_id: UUID | None = None
+    recurrence_occurrence_id: UUID | None = None
+    event_type: RecurrenceEventType | None = None
+    created_before: datetime | None = None
+    before_id: UUID | None = None
+    limit: int = 50
+
+
 class RecurrenceRepository:
     """Repository for recurrence rules, occurrences and events."""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self._event_buffer = RecurrenceEventBuffer.for_session(session.sync_session)
 
-    def get_rule(self, recurrence_id: UUID) -> RecurrenceRule | None:
+    async def get_rule(self, recurrence_id: UUID) -> RecurrenceRule | None:
         """Fetch recurrence rule by id."""
 
         statement = select(RecurrenceRule).where(RecurrenceRule.id == recurrence_id)
-        return self._session.scalar(statement)
+        return await self._session.scalar(statement)
 
-    def get_rule_for_update(self, recurrence_id: UUID) -> RecurrenceRule | None:
+    async def get_rule_for_update(self, recurrence_id: UUID) -> RecurrenceRule | None:
         """Fetch and lock one recurrence rule by id."""
 
         statement = (
@@ -69,9 +111,9 @@ class RecurrenceRepository:
             .where(RecurrenceRule.id == recurrence_id)
             .with_for_update()
         )
-        return self._session.scalar(statement)
+        return await self._session.scalar(statement)
 
-    def add_rule(
+    async def add_rule(
         self,
         *,
         description: str,
@@ -106,18 +148,22 @@ class RecurrenceRepository:
             updated_at=now,
         )
         self._session.add(rule)
-        self._session.flush()
+        await self._session.flush()
         return rule
 
-    def list_rules(
+    async def list_rules(
         self,
         filters: RecurrenceListFilters,
     ) -> tuple[list[RecurrenceRule], int]:
         """List recurrence rules with optional status and month eligibility."""
 
-        statement = self._apply_list_filters(select(RecurrenceRule), filters)
+        statement = self._apply_list_filters(
+            select(RecurrenceRule),
+            filters,
+            dialect_name=self._dialect_name(),
+        )
         total_statement = select(func.count()).select_from(statement.subquery())
-        total = int(self._session.scalar(total_statement) or 0)
+        total = int(await self._session.scalar(total_statement) or 0)
 
         page_statement = (
             statement.order_by(
@@ -126,34 +172,38 @@ class RecurrenceRepository:
             .limit(filters.limit)
             .offset(filters.offset)
         )
-        items = list(self._session.scalars(page_statement).all())
+        items = list((await self._session.scalars(page_statement)).all())
         return items, total
 
-    def list_eligible_rules_for_generation(
+    async def list_eligible_rules_for_generation(
         self,
         filters: EligibleRecurrenceRuleFilters,
     ) -> list[RecurrenceRule]:
-        """Fetch and lock eligible active rules for one competence month."""
+        """Fetch and lock eligible active rules for one competence month.
+
+        The status and cursor predicates match the partial
+        `ix_recurrence_rules_active_next_competence_month` index, which also
+        provides the claim ordering.
+        """
 
         competence_month = filters.competence_month
         statement = (
             select(RecurrenceRule)
             .where(
                 RecurrenceRule.status == RecurrenceStatus.ACTIVE,
-                RecurrenceRule.start_competence_month <= competence_month,
-                or_(
-                    RecurrenceRule.end_competence_month.is_(None),
-                    RecurrenceRule.end_competence_month >= competence_month,
-                ),
                 RecurrenceRule.next_competence_month <= competence_month,
+                self._active_in_month(
+                    competence_month,
+                    dialect_name=self._dialect_name(),
+                ),
             )
             .order_by(RecurrenceRule.next_competence_month, RecurrenceRule.id)
             .limit(filters.limit)
             .with_for_update(skip_locked=True)
         )
-        return list(self._session.scalars(statement))
+        return list(await self._session.scalars(statement))
 
-    def get_occurrence(
+    async def get_occurrence(
         self,
         *,
         recurrence_rule_id: UUID,
@@ -165,9 +215,9 @@ class RecurrenceRepository:
             RecurrenceOccurrence.recurrence_rule_id == recurrence_rule_id,
             RecurrenceOccurrence.competence_month == competence_month,
         )
-        return self._session.scalar(statement)
+        return await self._session.scalar(statement)
 
-    def get_occurrence_for_update(
+    async def get_occurrence_for_update(
         self,
         *,
         recurrence_rule_id: UUID,
@@ -183,9 +233,9 @@ class RecurrenceRepository:
             )
             .with_for_update()
         )
-        return self._session.scalar(statement)
+        return await self._session.scalar(statement)
 
-    def create_pending_occurrence_if_missing(
+    async def create_pending_occurrence_if_missing(
         self,
         *,
         recurrence_rule_id: UUID,
@@ -195,7 +245,7 @@ class RecurrenceRepository:
         """Create pending occurrence idempotently for recurrence + month."""
 
         duplicate_error: IntegrityError | None = None
-        with self._session.begin_nested():
+        async with self._session.begin_nested():
             occurrence = RecurrenceOccurrence(
                 recurrence_rule_id=recurrence_rule_id,
                 competence_month=competence_month,
@@ -207,17 +257,18 @@ class RecurrenceRepository:
                 failure_reason=None,
                 attempt_count=0,
                 processed_at=None,
+                next_attempt_at=None,
                 created_at=datetime.now(tz=UTC),
                 updated_at=datetime.now(tz=UTC),
             )
             self._session.add(occurrence)
             try:
-                self._session.flush()
+                await self._session.flush()
                 return occurrence, True
             except IntegrityError as exc:
                 duplicate_error = exc
 
-        existing = self.get_occurrence(
+        existing = await self.get_occurrence(
             recurrence_rule_id=recurrence_rule_id,
             competence_month=competence_month,
         )
@@ -228,7 +279,55 @@ class RecurrenceRepository:
             raise RuntimeError(msg)
         return existing, False
 
-    def get_generated_movement_by_external_id(
+    async def list_due_failed_occurrence_ids(
+        self,
+        *,
+        due_at: datetime,
+        limit: int,
+    ) -> list[UUID]:
+        """List failed occurrences whose retry is due, without locking them."""
+
+        statement = (
+            select(RecurrenceOccurrence.id)
+            .where(*self._due_failed_occurrence_criteria(due_at))
+            .order_by(RecurrenceOccurrence.next_attempt_at, RecurrenceOccurrence.id)
+            .limit(limit)
+        )
+        return list(await self._session.scalars(statement))
+
+    async def claim_due_failed_occurrence(
+        self,
+        *,
+        occurrence_id: UUID,
+        due_at: datetime,
+    ) -> RecurrenceOccurrence | None:
+        """Lock one failed occurrence if it is still due and unclaimed.
+
+        Returns None when another runner holds the row or already retried it.
+        """
+
+        statement = (
+            select(RecurrenceOccurrence)
+            .where(
+                RecurrenceOccurrence.id == occurrence_id,
+                *self._due_failed_occurrence_criteria(due_at),
+            )
+            .with_for_update(skip_locked=True)
+            .execution_options(populate_existing=True)
+        )
+        return await self._session.scalar(statement)
+
+    @staticmethod
+    def _due_failed_occurrence_criteria(
+        due_at: datetime,
+    ) -> tuple[ColumnElement[bool], ...]:
+        return (
+            RecurrenceOccurrence.status == RecurrenceOccurrenceStatus.FAILED,
+            RecurrenceOccurrence.next_attempt_at.is_not(None),
+            RecurrenceOccurrence.next_attempt_at <= due_at,
+        )
+
+    async def get_generated_movement_by_external_id(
         self,
         *,
         competence_month: date,
@@ -243,9 +342,9 @@ class RecurrenceRepository:
             FinancialMovement.external_id == external_id,
             FinancialMovement.movement_type == MovementType.PURCHASE,
         )
-        return self._session.scalar(statement)
+        return await self._session.scalar(statement)
 
-    def add_generated_movement(
+    async def add_generated_movement(
         self,
         *,
         amount: Decimal,
@@ -275,7 +374,7 @@ class RecurrenceRepository:
             original_purchase_id=None,
         )
         self._session.add(movement)
-        self._session.flush()
+        await self._session.flush()
         return movement
 
     def add_event(
@@ -287,9 +386,10 @@ class RecurrenceRepository:
         actor_participant_id: str | None = None,
         recurrence_occurrence_id: UUID | None = None,
     ) -> RecurrenceEvent:
-        """Append one recurrence functional event."""
+        """Buffer one recurrence functional event until the session commits."""
 
         event = RecurrenceEvent(
+            id=uuid4(),
             recurrence_rule_id=recurrence_rule_id,
             recurrence_occurrence_id=recurrence_occurrence_id,
             event_type=event_type,
@@ -297,30 +397,168 @@ class RecurrenceRepository:
             payload=payload,
             created_at=datetime.now(tz=UTC),
         )
-        self._session.add(event)
-        self._session.flush()
+        self._event_buffer.append(event)
         return event
 
-    def update_rule_generation_cursor(
+    def add_generation_run(
+        self,
+        *,
+        competence_month: date,
+        trigger: RecurrenceGenerationTrigger,
+        dry_run: bool,
+        started_at: datetime,
+        duration_ms: float,
+        processed_rules: int,
+        generated_count: int,
+        ignored_count: int,
+        blocked_count: int,
+        failed_count: int,
+        phase_timings_ms: dict[str, float],
+        slowest_rules: list[dict[str, Any]],
+    ) -> RecurrenceGenerationRun:
+        """Append one generation run to the ledger."""
+
+        run = RecurrenceGenerationRun(
+            competence_month=competence_month,
+            trigger=trigger,
+            dry_run=dry_run,
+            started_at=started_at,
+            duration_ms=duration_ms,
+            processed_rules=processed_rules,
+            generated_count=generated_count,
+            ignored_count=ignored_count,
+            blocked_count=blocked_count,
+            failed_count=failed_count,
+            phase_timings_ms=phase_timings_ms,
+            slowest_rules=slowest_rules,
+            created_at=datetime.now(tz=UTC),
+        )
+        self._session.add(run)
+        return run
+
+    async def list_generation_runs(
+        self,
+        filters: GenerationRunListFilters,
+    ) -> list[RecurrenceGenerationRun]:
+        """List most recent generation runs first."""
+
+        statement = select(RecurrenceGenerationRun)
+        if filters.competence_month is not None:
+            statement = statement.where(
+                RecurrenceGenerationRun.competence_month == filters.competence_month
+            )
+        if filters.trigger is not None:
+            statement = statement.where(
+                RecurrenceGenerationRun.trigger == filters.trigger
+            )
+        statement = statement.order_by(
+            RecurrenceGenerationRun.started_at.desc(),
+            RecurrenceGenerationRun.id.desc(),
+        ).limit(filters.limit)
+        return list(await self._session.scalars(statement))
+
+    async def list_events(
+        self,
+        filters: RecurrenceEventListFilters,
+    ) -> list[RecurrenceEvent]:
+        """List recurrence events newest first using keyset pagination."""
+
+        statement = select(RecurrenceEvent)
+        if filters.recurrence_rule_id is not None:
+            statement = statement.where(
+                RecurrenceEvent.recurrence_rule_id == filters.recurrence_rule_id
+            )
+        if filters.recurrence_occurrence_id is not None:
+            statement = statement.where(
+                RecurrenceEvent.recurrence_occurrence_id
+                == filters.recurrence_occurrence_id
+            )
+        if filters.event_type is not None:
+            statement = statement.where(
+                RecurrenceEvent.event_type == filters.event_type
+            )
+        if filters.created_before is not None and filters.before_id is not None:
+            statement = statement.where(
+                or_(
+                    RecurrenceEvent.created_at < filters.created_before,
+                    and_(
+                        RecurrenceEvent.created_at == filters.created_before,
+                        RecurrenceEvent.id < filters.before_id,
+                    ),
+                )
+            )
+        elif filters.created_before is not None:
+            statement = statement.where(
+                RecurrenceEvent.created_at < filters.created_before
+            )
+        statement = statement.order_by(
+            RecurrenceEvent.created_at.desc(),
+            RecurrenceEvent.id.desc(),
+        ).limit(filters.limit)
+        return list(await self._session.scalars(statement))
+
+    async def list_events_created_before(
+        self,
+        *,
+        cutoff: datetime,
+        limit: int,
+    ) -> list[RecurrenceEvent]:
+        """Fetch the oldest events created before a retention cutoff."""
+
+        statement = (
+            select(RecurrenceEvent)
+            .where(RecurrenceEvent.created_at < cutoff)
+            .order_by(RecurrenceEvent.created_at.asc(), RecurrenceEvent.id.asc())
+            .limit(limit)
+        )
+        return list(await self._session.scalars(statement))
+
+    async def delete_events(self, event_ids: list[UUID]) -> int:
+        """Delete one batch of events by primary key."""
+
+        if not event_ids:
+            return 0
+        result = await self._session.execute(
+            delete(RecurrenceEvent)
+            .where(RecurrenceEvent.id.in_(event_ids))
+            .execution_options(synchronize_session=False)
+        )
+        return int(getattr(result, "rowcount", 0) or 0)
+
+    async def update_rule_generation_cursor(
         self,
         *,
         recurrence_rule_id: UUID,
         processed_competence_month: date,
         next_competence_month: date,
     ) -> None:
-        """Persist recurrence generation cursor updates."""
+        """Persist recurrence generation cursor updates.
+
+        The cursor only moves forward, so retrying an older failed month does
+        not rewind a rule that already generated later months.
+        """
 
-        rule = self.get_rule_for_update(recurrence_rule_id)
+        rule = await self.get_rule_for_update(recurrence_rule_id)
         if rule is None:
             return
 
-        if rule.first_generated_competence_month is None:
+        if (
+            rule.first_generated_competence_month is None
+            or processed_competence_month < rule.first_generated_competence_month
+        ):
             rule.first_generated_competence_month = processed_competence_month
-        rule.last_generated_competence_month = processed_competence_month
-        rule.next_competence_month = next_competence_month
+        if (
+            rule.last_generated_competence_month is None
+            or processed_competence_month > rule.last_generated_competence_month
+        ):
+            rule.last_generated_competence_month = processed_competence_month
+        rule.next_competence_month = max(
+            rule.next_competence_month,
+            next_competence_month,
+        )
         rule.version += 1
 
-    def update_rule(
+    async def update_rule(
         self,
         *,
         rule: RecurrenceRule,
@@ -356,10 +594,10 @@ class RecurrenceRepository:
         rule.requested_by_participant_id = requested_by_participant_id
         rule.version += 1
         rule.updated_at = datetime.now(tz=UTC)
-        self._session.flush()
+        await self._session.flush()
         return rule
 
-    def pause_rule(
+    async def pause_rule(
         self,
         *,
         rule: RecurrenceRule,
@@ -369,10 +607,10 @@ class RecurrenceRepository:
         rule.status = RecurrenceStatus.PAUSED
         rule.version += 1
         rule.updated_at = datetime.now(tz=UTC)
-        self._session.flush()
+        await self._session.flush()
         return rule
 
-    def reactivate_rule(
+    async def reactivate_rule(
         self,
         *,
         rule: RecurrenceRule,
@@ -382,10 +620,10 @@ class RecurrenceRepository:
         rule.status = RecurrenceStatus.ACTIVE
         rule.version += 1
         rule.updated_at = datetime.now(tz=UTC)
-        self._session.flush()
+        await self._session.flush()
         return rule
 
-    def end_rule(
+    async def end_rule(
         self,
         *,
         rule: RecurrenceRule,
@@ -398,13 +636,43 @@ class RecurrenceRepository:
         rule.status = RecurrenceStatus.ENDED
         rule.version += 1
         rule.updated_at = datetime.now(tz=UTC)
-        self._session.flush()
+        await self._session.flush()
         return rule
 
+    def _dialect_name(self) -> str:
+        return self._session.get_bind().dialect.name
+
     @staticmethod
+    def _active_in_month(
+        competence_month: date,
+        *,
+        dialect_name: str,
+    ) -> ColumnElement[bool]:
+        """Return the predicate for rules whose active period covers a month.
+
+        PostgreSQL uses daterange containment backed by the GiST expression
+        index; other dialects fall back to plain bound comparisons.
+        """
+
+        if dialect_name == "postgresql":
+            return active_period_expression().op("@>", return_type=Boolean)(
+                cast(literal(competence_month), Date)
+            )
+        return and_(
+            RecurrenceRule.start_competence_month <= competence_month,
+            or_(
+                RecurrenceRule.end_competence_month.is_(None),
+                RecurrenceRule.end_competence_month >= competence_month,
+            ),
+        )
+
+    @classmethod
     def _apply_list_filters(
+        cls,
         statement: Select[tuple[RecurrenceRule]],
         filters: RecurrenceListFilters,
+        *,
+        dialect_name: str,
     ) -> Select[tuple[RecurrenceRule]]:
         typed_statement = statement
 
@@ -415,11 +683,10 @@ class RecurrenceRepository:
 
         if filters.competence_month is not None:
             typed_statement = typed_statement.where(
-                RecurrenceRule.start_competence_month <= filters.competence_month,
-                or_(
-                    RecurrenceRule.end_competence_month.is_(None),
-                    RecurrenceRule.end_competence_month >= filters.competence_month,
-                ),
+                cls._active_in_month(
+                    filters.competence_month,
+                    dialect_name=dialect_name,
+                )
             )
 
         return typed_statement
@@ -19,7 +19,7 @@ class MonthlyReportService:
 
     monthly_summary_service: MonthlySummaryService
 
-    def get_report(
+    async def get_report(
         self,
         *,
         year: int,
@@ -27,7 +27,7 @@ class MonthlyReportService:
         request_id: str | None,
         auto_generate: bool = False,
     ) -> MonthlySummaryProjection:
-        projection = self.monthly_summary_service.get_summary(
+        projection = await self.monthly_summary_service.get_summary(
             year=year,
             month=month,
             auto_generate=auto_generate,
@@ -8,23 +8,26 @@ from decimal import Decimal
 from typing import Protocol
 
 from compras_divididas.db.models.participant import Participant
+from compras_divididas.db.models.recurrence_generation_run import (
+    RecurrenceGenerationTrigger,
+)
 from compras_divididas.domain.money import quantize_money
 
 
 class ParticipantRepositoryProtocol(Protocol):
     """Participant repository contract used by summary service."""
 
-    def list_active_exactly_two(self) -> list[Participant]: ...
+    async def list_active_exactly_two(self) -> list[Participant]: ...
 
 
 class MovementQueryRepositoryProtocol(Protocol):
     """Read repository contract used by summary service."""
 
-    def get_monthly_totals(
+    async def get_monthly_totals(
         self, competence_month: date
     ) -> tuple[Decimal, Decimal, Decimal]: ...
 
-    def get_paid_totals_by_participant(
+    async def get_paid_totals_by_participant(
         self, competence_month: date
     ) -> dict[str, Decimal]: ...
 
@@ -32,13 +35,14 @@ class MovementQueryRepositoryProtocol(Protocol):
 class RecurrenceGenerationServiceProtocol(Protocol):
     """Recurrence generation contract consumed by summary service."""
 
-    def generate_for_month(
+    async def generate_for_month(
         self,
         *,
         competence_month: date,
         requested_by_participant_id: str | None,
         include_blocked_details: bool,
         dry_run: bool,
+        trigger: RecurrenceGenerationTrigger,
     ) -> object: ...
 
 
@@ -124,7 +128,7 @@ class MonthlySummaryService:
         self._movement_query_repository = movement_query_repository
         self._recurrence_generation_service = recurrence_generation_service
 
-    def get_summary(
+    async def get_summary(
         self,
         *,
         year: int,
@@ -133,19 +137,22 @@ class MonthlySummaryService:
     ) -> MonthlySummaryProjection:
         competence_month = date(year=year, month=month, day=1)
         if auto_generate and self._recurrence_generation_service is not None:
-            self._recurrence_generation_service.generate_for_month(
+            await self._recurrence_generation_service.generate_for_month(
                 competence_month=competence_month,
                 requested_by_participant_id=None,
                 include_blocked_details=False,
                 dry_run=False,
+                trigger=RecurrenceGenerationTrigger.AUTO_GENERATE,
             )
 
-        participants = self._participant_repository.list_active_exactly_two()
-        gross, refunds, net = self._movement_query_repository.get_monthly_totals(
+        participants = await self._participant_repository.list_active_exactly_two()
+        gross, refunds, net = await self._movement_query_repository.get_monthly_totals(
             competence_month
         )
-        paid_totals = self._movement_query_repository.get_paid_totals_by_participant(
-            competence_month
+        paid_totals = (
+            await self._movement_query_repository.get_paid_totals_by_participant(
+                competence_month
+            )
         )
 
         share_due = quantize_money(net / Decimal("2"))
@@ -30,15 +30,15 @@ logger = logging.getLogger(__name__)
 class SessionProtocol(Protocol):
     """Subset of SQLAlchemy session APIs used by this service."""
 
-    def commit(self) -> None: ...
-    def rollback(self) -> None: ...
-    def refresh(self, instance: object) -> None: ...
+    async def commit(self) -> None: ...
+    async def rollback(self) -> None: ...
+    async def refresh(self, instance: object) -> None: ...
 
 
 class MovementRepositoryProtocol(Protocol):
     """Movement repository contract consumed by service."""
 
-    def has_duplicate_external_id(
+    async def has_duplicate_external_id(
         self,
         *,
         competence_month: date,
@@ -46,11 +46,11 @@ class MovementRepositoryProtocol(Protocol):
         external_id: str,
     ) -> bool: ...
 
-    def get_purchase_for_update(
+    async def get_purchase_for_update(
         self, purchase_id: UUID
     ) -> FinancialMovement | None: ...
 
-    def get_purchase_by_external_id_for_update(
+    async def get_purchase_by_external_id_for_update(
         self,
         *,
         competence_month: date,
@@ -58,15 +58,17 @@ class MovementRepositoryProtocol(Protocol):
         external_id: str,
     ) -> FinancialMovement | None: ...
 
-    def get_total_refunded_amount(self, original_purchase_id: UUID) -> Decimal: ...
+    async def get_total_refunded_amount(
+        self, original_purchase_id: UUID
+    ) -> Decimal: ...
 
-    def add(self, movement: FinancialMovement) -> FinancialMovement: ...
+    async def add(self, movement: FinancialMovement) -> FinancialMovement: ...
 
 
 class ParticipantRepositoryProtocol(Protocol):
     """Participant repository contract consumed by service."""
 
-    def list_active_exactly_two(self) -> list[Participant]: ...
+    async def list_active_exactly_two(self) -> list[Participant]: ...
 
 
 @dataclass(slots=True, frozen=True)
@@ -98,8 +100,8 @@ class MovementService:
         self._participant_repository = participant_repository
         self._session = session
 
-    def create_movement(self, payload: CreateMovementInput) -> FinancialMovement:
-        participants = self._participant_repository.list_active_exactly_two()
+    async def create_movement(self, payload: CreateMovementInput) -> FinancialMovement:
+        participants = await self._participant_repository.list_active_exactly_two()
         participant_ids = {str(participant.id) for participant in participants}
         requested_by_participant_id = payload.requested_by_participant_id.strip()
         if requested_by_participant_id not in participant_ids:
@@ -143,7 +145,7 @@ class MovementService:
             )
 
         external_id = payload.external_id.strip() if payload.external_id else None
-        if external_id and self._movement_repository.has_duplicate_external_id(
+        if external_id and await self._movement_repository.has_duplicate_external_id(
             competence_month=month,
             payer_participant_id=payer_participant_id,
             external_id=external_id,
@@ -155,11 +157,16 @@ class MovementService:
                         "in this competence month."
                     ),
                     action="Send a unique external_id or omit this field.",
-                )
+                ),
+                # Lets an idempotent client look up the movement it created.
+                details={
+                    "competence_month": month.isoformat(),
+                    "payer_participant_id": payer_participant_id,
+                },
             )
 
         try:
-            original_purchase = self._resolve_original_purchase(
+            original_purchase = await self._resolve_original_purchase(
                 payload=payload,
                 competence_month_value=month,
                 payer_participant_id=payer_participant_id,
@@ -179,9 +186,9 @@ class MovementService:
                 else None,
             )
 
-            created_movement = self._movement_repository.add(movement)
-            self._session.commit()
-            self._session.refresh(created_movement)
+            created_movement = await self._movement_repository.add(movement)
+            await self._session.commit()
+            await self._session.refresh(created_movement)
             logger.info(
                 "movement_created",
                 extra={
@@ -193,10 +200,10 @@ class MovementService:
             )
             return created_movement
         except Exception:
-            self._session.rollback()
+            await self._session.rollback()
             raise
 
-    def _resolve_original_purchase(
+    async def _resolve_original_purchase(
         self,
         *,
         payload: CreateMovementInput,
@@ -207,12 +214,12 @@ class MovementService:
             return None
 
         if payload.original_purchase_id:
-            original_purchase = self._movement_repository.get_purchase_for_update(
+            original_purchase = await self._movement_repository.get_purchase_for_update(
                 payload.original_purchase_id
             )
         elif payload.original_purchase_external_id:
             original_purchase = (
-                self._movement_repository.get_purchase_by_external_id_for_update(
+                await self._movement_repository.get_purchase_by_external_id_for_update(
                     competence_month=competence_month_value,
                     payer_participant_id=payer_participant_id,
                     external_id=payload.original_purchase_external_id.strip(),
@@ -238,7 +245,7 @@ class MovementService:
                 )
             )
 
-        refunded_total = self._movement_repository.get_total_refunded_amount(
+        refunded_total = await self._movement_repository.get_total_refunded_amount(
             original_purchase.id
         )
         candidate_total = refunded_total + quantize_money(payload.amount)
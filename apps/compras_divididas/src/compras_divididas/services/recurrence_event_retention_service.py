@@ -0,0 +1,131 @@
+"""Recurrence event retention and archival."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Protocol
+
+from compras_divididas.db.models.recurrence_event import RecurrenceEvent
+from compras_divididas.repositories.recurrence_repository import RecurrenceRepository
+
+DEFAULT_ARCHIVE_BATCH_SIZE = 1000
+
+
+@dataclass(slots=True, frozen=True)
+class ArchiveRecurrenceEventsResult:
+    """Result counters for one event archival pass."""
+
+    cutoff: datetime
+    archived_count: int
+    batch_count: int
+    archive_files: list[Path]
+
+
+class SessionProtocol(Protocol):
+    """Subset of SQLAlchemy session APIs used by the retention service."""
+
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+
+class RecurrenceEventRetentionService:
+    """Moves recurrence events past retention into gzip JSONL archives."""
+
+    def __init__(
+        self,
+        *,
+        recurrence_repository: RecurrenceRepository,
+        session: SessionProtocol,
+        archive_dir: Path,
+    ) -> None:
+        self._recurrence_repository = recurrence_repository
+        self._session = session
+        self._archive_dir = archive_dir
+
+    async def archive_events_older_than(
+        self,
+        *,
+        retention_days: int,
+        batch_size: int = DEFAULT_ARCHIVE_BATCH_SIZE,
+        now: datetime | None = None,
+    ) -> ArchiveRecurrenceEventsResult:
+        """Archive and delete events created before `now - retention_days`.
+
+        Each batch is written to its own file before the matching rows are
+        deleted and committed, so an interrupted run never loses events.
+        """
+
+        if retention_days <= 0:
+            msg = "retention_days must be greater than zero."
+            raise ValueError(msg)
+        if batch_size <= 0:
+            msg = "batch_size must be greater than zero."
+            raise ValueError(msg)
+
+        reference = now or datetime.now(UTC)
+        cutoff = reference - timedelta(days=retention_days)
+        run_stamp = reference.strftime("%Y%m%dT%H%M%SZ")
+        self._archive_dir.mkdir(parents=True, exist_ok=True)
+
+        archived_count = 0
+        archive_files: list[Path] = []
+        while True:
+            events = await self._recurrence_repository.list_events_created_before(
+                cutoff=cutoff,
+                limit=batch_size,
+            )
+            if not events:
+                break
+
+            archive_path = (
+                self._archive_dir
+                / f"recurrence_events_{run_stamp}_{len(archive_files) + 1:04d}.jsonl.gz"
+            )
+            self._write_archive(archive_path, events)
+            try:
+                archived_count += await self._recurrence_repository.delete_events(
+                    [event.id for event in events]
+                )
+                await self._session.commit()
+            except Exception:
+                await self._session.rollback()
+                archive_path.unlink(missing_ok=True)
+                raise
+            archive_files.append(archive_path)
+
+            if len(events) < batch_size:
+                break
+
+        return ArchiveRecurrenceEventsResult(
+            cutoff=cutoff,
+            archived_count=archived_count,
+            batch_count=len(archive_files),
+            archive_files=archive_files,
+        )
+
+    @staticmethod
+    def _write_archive(path: Path, events: list[RecurrenceEvent]) -> None:
+        with gzip.open(path, "wt", encoding="utf-8") as archive:
+            for event in events:
+                archive.write(json.dumps(_serialize_event(event)) + "\n")
+
+
+def _serialize_event(event: RecurrenceEvent) -> dict[str, Any]:
+    return {
+        "id": str(event.id),
+        "recurrence_rule_id": str(event.recurrence_rule_id),
+        "recurrence_occurrence_id": (
+            str(event.recurrence_occurrence_id)
+            if event.recurrence_occurrence_id is not None
+            else None
+        ),
+        "event_type": event.event_type.value,
+        "actor_participant_id": event.actor_participant_id,
+        "payload": event.payload,
+        "created_at": event.created_at.isoformat(),
+    }
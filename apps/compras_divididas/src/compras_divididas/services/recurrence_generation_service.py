@@ -2,26 +2,49 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import heapq
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
+from time import perf_counter
 from typing import Protocol
 from uuid import UUID
 
+from sqlalchemy.orm.attributes import instance_state
+
 from compras_divididas.db.models.recurrence_event import RecurrenceEventType
+from compras_divididas.db.models.recurrence_generation_run import (
+    RecurrenceGenerationTrigger,
+)
 from compras_divididas.db.models.recurrence_occurrence import (
     RecurrenceOccurrence,
     RecurrenceOccurrenceStatus,
 )
-from compras_divididas.db.models.recurrence_rule import RecurrenceRule
+from compras_divididas.db.models.recurrence_rule import (
+    RecurrenceRule,
+    RecurrenceStatus,
+)
 from compras_divididas.domain.recurrence_schedule import (
     add_months,
+    can_transition_occurrence_status,
     scheduled_date_for_month,
 )
+from compras_divididas.domain.retry_policy import RetryPolicy
 from compras_divididas.repositories.recurrence_repository import (
     EligibleRecurrenceRuleFilters,
     RecurrenceRepository,
 )
 
+GENERATION_PHASES = (
+    "claim",
+    "occurrence_insert",
+    "movement_insert",
+    "cursor_update",
+    "event",
+)
+SLOWEST_RULES_LIMIT = 5
+
 
 @dataclass(slots=True, frozen=True)
 class BlockedRecurrenceItem:
@@ -45,12 +68,83 @@ class GenerateRecurrencesResult:
     blocked_items: list[BlockedRecurrenceItem]
 
 
+@dataclass(slots=True, frozen=True)
+class RetryFailedOccurrencesResult:
+    """Result counters for one failed-occurrence retry pass."""
+
+    due_count: int
+    generated_count: int
+    ignored_count: int
+    blocked_count: int
+    failed_count: int
+    abandoned_count: int
+
+
+@dataclass(slots=True)
+class GenerationTimings:
+    """Accumulated wall-clock time per generation phase and per rule."""
+
+    phases_ms: dict[str, float] = field(
+        default_factory=lambda: dict.fromkeys(GENERATION_PHASES, 0.0)
+    )
+    rule_durations_ms: list[tuple[float, UUID]] = field(default_factory=list)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure one block and add its duration to a phase total."""
+
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases_ms[name] += (perf_counter() - start) * 1000
+
+    def record_rule(self, recurrence_id: UUID, duration_ms: float) -> None:
+        self.rule_durations_ms.append((duration_ms, recurrence_id))
+
+    def rounded_phases(self) -> dict[str, float]:
+        return {name: round(value, 3) for name, value in self.phases_ms.items()}
+
+    def slowest_rules(self) -> list[dict[str, object]]:
+        slowest = heapq.nlargest(
+            SLOWEST_RULES_LIMIT,
+            self.rule_durations_ms,
+            key=lambda item: item[0],
+        )
+        return [
+            {"recurrence_id": str(recurrence_id), "duration_ms": round(duration, 3)}
+            for duration, recurrence_id in slowest
+        ]
+
+
+@dataclass(slots=True)
+class _RetryMonthRun:
+    """Ledger counters of one competence month reprocessed by a retry pass."""
+
+    started_at: datetime
+    duration_ms: float = 0.0
+    timings: GenerationTimings = field(default_factory=GenerationTimings)
+    counters: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(
+            ("generated", "ignored", "blocked", "failed"), 0
+        )
+    )
+
+    def record(self, outcome: str, duration_ms: float) -> None:
+        # The ledger has no abandoned counter: dropping an inactive rule's
+        # occurrence from the queue is an ignored outcome there.
+        self.counters["ignored" if outcome == "abandoned" else outcome] += 1
+        self.duration_ms += duration_ms
+
+
 class SessionProtocol(Protocol):
     """Subset of SQLAlchemy session APIs used by generation service."""
 
-    def commit(self) -> None: ...
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
 
-    def rollback(self) -> None: ...
+    async def refresh(self, instance: object) -> None: ...
 
 
 class RecurrenceGenerationService:
@@ -61,19 +155,26 @@ class RecurrenceGenerationService:
         *,
         recurrence_repository: RecurrenceRepository,
         session: SessionProtocol,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         self._recurrence_repository = recurrence_repository
         self._session = session
+        self._retry_policy = retry_policy or RetryPolicy()
 
-    def generate_for_month(
+    async def generate_for_month(
         self,
         *,
         competence_month: date,
         requested_by_participant_id: str | None,
         include_blocked_details: bool,
         dry_run: bool,
+        trigger: RecurrenceGenerationTrigger = RecurrenceGenerationTrigger.API,
     ) -> GenerateRecurrencesResult:
-        """Generate recurrence occurrences idempotently for one month."""
+        """Generate recurrence occurrences idempotently for one month.
+
+        Every call is recorded in the generation run ledger with its
+        counters, per-phase timings and slowest rules.
+        """
 
         generated_count = 0
         ignored_count = 0
@@ -81,23 +182,46 @@ class RecurrenceGenerationService:
         failed_count = 0
         blocked_items: list[BlockedRecurrenceItem] = []
         processed_rules = 0
-
-        rules = self._recurrence_repository.list_eligible_rules_for_generation(
-            EligibleRecurrenceRuleFilters(competence_month=competence_month)
-        )
+        timings = GenerationTimings()
+        started_at = datetime.now(tz=UTC)
+        run_start = perf_counter()
+
+        with timings.phase("claim"):
+            rules = (
+                await self._recurrence_repository.list_eligible_rules_for_generation(
+                    EligibleRecurrenceRuleFilters(competence_month=competence_month)
+                )
+            )
         for rule in rules:
             processed_rules += 1
+            await self._reload_if_expired(rule)
+            rule_id = rule.id
+            scheduled_date = scheduled_date_for_month(
+                competence_month=competence_month,
+                reference_day=rule.reference_day,
+            )
+            rule_start = perf_counter()
             try:
-                status, blocked = self._process_rule(
+                status, blocked = await self._process_rule(
                     rule=rule,
                     competence_month=competence_month,
                     requested_by_participant_id=requested_by_participant_id,
                     dry_run=dry_run,
+                    timings=timings,
                 )
-            except Exception:
+            except Exception as exc:
                 failed_count += 1
-                self._session.rollback()
+                await self._session.rollback()
+                await self._record_failure(
+                    recurrence_rule_id=rule_id,
+                    competence_month=competence_month,
+                    scheduled_date=scheduled_date,
+                    requested_by_participant_id=requested_by_participant_id,
+                    error=exc,
+                )
                 continue
+            finally:
+                timings.record_rule(rule_id, (perf_counter() - rule_start) * 1000)
 
             if status == "generated":
                 generated_count += 1
@@ -110,6 +234,22 @@ class RecurrenceGenerationService:
             elif status == "failed":
                 failed_count += 1
 
+        self._recurrence_repository.add_generation_run(
+            competence_month=competence_month,
+            trigger=trigger,
+            dry_run=dry_run,
+            started_at=started_at,
+            duration_ms=round((perf_counter() - run_start) * 1000, 3),
+            processed_rules=processed_rules,
+            generated_count=generated_count,
+            ignored_count=ignored_count,
+            blocked_count=blocked_count,
+            failed_count=failed_count,
+            phase_timings_ms=timings.rounded_phases(),
+            slowest_rules=timings.slowest_rules(),
+        )
+        await self._session.commit()
+
         return GenerateRecurrencesResult(
             competence_month=competence_month,
             processed_rules=processed_rules,
@@ -120,89 +260,271 @@ class RecurrenceGenerationService:
             blocked_items=blocked_items,
         )
 
-    def _process_rule(
+    async def retry_failed_occurrences(
+        self,
+        *,
+        limit: int = 100,
+        now: datetime | None = None,
+        trigger: RecurrenceGenerationTrigger = RecurrenceGenerationTrigger.SCHEDULER,
+    ) -> RetryFailedOccurrencesResult:
+        """Reprocess failed occurrences whose backoff delay has elapsed.
+
+        Only due entries of the retry queue are touched, so the pass does not
+        rescan eligible rules. Occurrences whose rule is no longer active are
+        removed from the queue. Each competence month the pass reprocessed is
+        recorded in the generation run ledger.
+        """
+
+        due_at = now or datetime.now(tz=UTC)
+        counters = dict.fromkeys(
+            ("generated", "ignored", "blocked", "failed", "abandoned"), 0
+        )
+        occurrence_ids = (
+            await self._recurrence_repository.list_due_failed_occurrence_ids(
+                due_at=due_at,
+                limit=limit,
+            )
+        )
+        month_runs: dict[date, _RetryMonthRun] = {}
+        for occurrence_id in occurrence_ids:
+            # Claim each row in its own transaction: a batch-wide lock would be
+            # released by the first commit below, exposing the remaining rows
+            # to a concurrent runner.
+            occurrence = await self._recurrence_repository.claim_due_failed_occurrence(
+                occurrence_id=occurrence_id,
+                due_at=due_at,
+            )
+            if occurrence is None:
+                await self._session.rollback()
+                counters["ignored"] += 1
+                continue
+            competence_month = occurrence.competence_month
+            month_run = month_runs.get(competence_month)
+            if month_run is None:
+                month_run = _RetryMonthRun(started_at=datetime.now(tz=UTC))
+                month_runs[competence_month] = month_run
+            occurrence_start = perf_counter()
+            outcome = await self._retry_occurrence(occurrence, month_run.timings)
+            month_run.record(outcome, (perf_counter() - occurrence_start) * 1000)
+            counters[outcome] += 1
+
+        for competence_month, month_run in sorted(month_runs.items()):
+            self._recurrence_repository.add_generation_run(
+                competence_month=competence_month,
+                trigger=trigger,
+                dry_run=False,
+                started_at=month_run.started_at,
+                duration_ms=round(month_run.duration_ms, 3),
+                processed_rules=sum(month_run.counters.values()),
+                generated_count=month_run.counters["generated"],
+                ignored_count=month_run.counters["ignored"],
+                blocked_count=month_run.counters["blocked"],
+                failed_count=month_run.counters["failed"],
+                phase_timings_ms=month_run.timings.rounded_phases(),
+                slowest_rules=month_run.timings.slowest_rules(),
+            )
+        if month_runs:
+            await self._session.commit()
+
+        return RetryFailedOccurrencesResult(
+            due_count=len(occurrence_ids),
+            generated_count=counters["generated"],
+            ignored_count=counters["ignored"],
+            blocked_count=counters["blocked"],
+            failed_count=counters["failed"],
+            abandoned_count=counters["abandoned"],
+        )
+
+    async def _retry_occurrence(
+        self,
+        occurrence: RecurrenceOccurrence,
+        timings: GenerationTimings,
+    ) -> str:
+        """Reprocess one claimed occurrence and return its outcome."""
+
+        rule_id = occurrence.recurrence_rule_id
+        competence_month = occurrence.competence_month
+        rule = await self._recurrence_repository.get_rule(rule_id)
+        if rule is None or rule.status != RecurrenceStatus.ACTIVE:
+            occurrence.next_attempt_at = None
+            await self._session.commit()
+            return "abandoned"
+
+        if not can_transition_occurrence_status(
+            current=occurrence.status.value,
+            target=RecurrenceOccurrenceStatus.PENDING.value,
+        ):
+            await self._session.rollback()
+            return "ignored"
+        occurrence.status = RecurrenceOccurrenceStatus.PENDING
+        occurrence.next_attempt_at = None
+
+        scheduled_date = occurrence.scheduled_date
+        rule_start = perf_counter()
+        try:
+            status, _ = await self._process_rule(
+                rule=rule,
+                competence_month=competence_month,
+                requested_by_participant_id=None,
+                dry_run=False,
+                timings=timings,
+            )
+        except Exception as exc:
+            await self._session.rollback()
+            await self._record_failure(
+                recurrence_rule_id=rule_id,
+                competence_month=competence_month,
+                scheduled_date=scheduled_date,
+                requested_by_participant_id=None,
+                error=exc,
+            )
+            return "failed"
+        finally:
+            timings.record_rule(rule_id, (perf_counter() - rule_start) * 1000)
+        return status
+
+    async def _record_failure(
+        self,
+        *,
+        recurrence_rule_id: UUID,
+        competence_month: date,
+        scheduled_date: date,
+        requested_by_participant_id: str | None,
+        error: Exception,
+    ) -> None:
+        """Persist a failed attempt so the retry queue can pick it up later.
+
+        Runs after the failed unit of work was rolled back. If the database is
+        still unavailable the failure is left unrecorded and the rule stays
+        eligible for the next regular generation run.
+        """
+
+        reason = f"{type(error).__name__}: {error}"[:1000]
+        try:
+            (
+                occurrence,
+                _,
+            ) = await self._recurrence_repository.create_pending_occurrence_if_missing(
+                recurrence_rule_id=recurrence_rule_id,
+                competence_month=competence_month,
+                scheduled_date=scheduled_date,
+            )
+            if occurrence.status == RecurrenceOccurrenceStatus.GENERATED:
+                await self._session.rollback()
+                return
+            self._mark_occurrence_failed(occurrence=occurrence, reason=reason)
+            self._recurrence_repository.add_event(
+                recurrence_rule_id=recurrence_rule_id,
+                recurrence_occurrence_id=occurrence.id,
+                event_type=RecurrenceEventType.RECURRENCE_FAILED,
+                actor_participant_id=requested_by_participant_id,
+                payload={
+                    "reason": reason,
+                    "attempt_count": occurrence.attempt_count,
+                    "next_attempt_at": occurrence.next_attempt_at.isoformat()
+                    if occurrence.next_attempt_at
+                    else None,
+                    "competence_month": competence_month.isoformat(),
+                },
+            )
+            await self._session.commit()
+        except Exception:
+            await self._session.rollback()
+
+    async def _process_rule(
         self,
         *,
         rule: RecurrenceRule,
         competence_month: date,
         requested_by_participant_id: str | None,
         dry_run: bool,
+        timings: GenerationTimings,
     ) -> tuple[str, BlockedRecurrenceItem | None]:
         scheduled_date = scheduled_date_for_month(
             competence_month=competence_month,
             reference_day=rule.reference_day,
         )
-        occurrence, created = (
-            self._recurrence_repository.create_pending_occurrence_if_missing(
+        with timings.phase("occurrence_insert"):
+            (
+                occurrence,
+                created,
+            ) = await self._recurrence_repository.create_pending_occurrence_if_missing(
                 recurrence_rule_id=rule.id,
                 competence_month=competence_month,
                 scheduled_date=scheduled_date,
             )
-        )
 
+        # Events are buffered and written on commit, so the "event" phase
+        # covers both the append and the commit that persists it.
         if not created and occurrence.status == RecurrenceOccurrenceStatus.GENERATED:
-            self._recurrence_repository.add_event(
-                recurrence_rule_id=rule.id,
-                recurrence_occurrence_id=occurrence.id,
-                event_type=RecurrenceEventType.RECURRENCE_IGNORED,
-                actor_participant_id=requested_by_participant_id,
-                payload={
-                    "reason": "already_generated",
-                    "competence_month": competence_month.isoformat(),
-                },
-            )
-            self._session.commit()
+            with timings.phase("event"):
+                self._recurrence_repository.add_event(
+                    recurrence_rule_id=rule.id,
+                    recurrence_occurrence_id=occurrence.id,
+                    event_type=RecurrenceEventType.RECURRENCE_IGNORED,
+                    actor_participant_id=requested_by_participant_id,
+                    payload={
+                        "reason": "already_generated",
+                        "competence_month": competence_month.isoformat(),
+                    },
+                )
+                await self._session.commit()
             return "ignored", None
 
         blocked = self._build_blocked_item(rule)
         if blocked is not None:
             self._mark_occurrence_blocked(occurrence=occurrence, blocked=blocked)
-            self._recurrence_repository.add_event(
-                recurrence_rule_id=rule.id,
-                recurrence_occurrence_id=occurrence.id,
-                event_type=RecurrenceEventType.RECURRENCE_BLOCKED,
-                actor_participant_id=requested_by_participant_id,
-                payload={
-                    "code": blocked.code,
-                    "message": blocked.message,
-                    "competence_month": competence_month.isoformat(),
-                },
-            )
-            self._session.commit()
+            with timings.phase("event"):
+                self._recurrence_repository.add_event(
+                    recurrence_rule_id=rule.id,
+                    recurrence_occurrence_id=occurrence.id,
+                    event_type=RecurrenceEventType.RECURRENCE_BLOCKED,
+                    actor_participant_id=requested_by_participant_id,
+                    payload={
+                        "code": blocked.code,
+                        "message": blocked.message,
+                        "competence_month": competence_month.isoformat(),
+                    },
+                )
+                await self._session.commit()
             return "blocked", blocked
 
         external_id = (
             f"recurrence:{rule.id}:{competence_month.year:04d}-"
             f"{competence_month.month:02d}"
         )
-        movement = self._recurrence_repository.get_generated_movement_by_external_id(
-            competence_month=competence_month,
-            payer_participant_id=rule.payer_participant_id,
-            external_id=external_id,
-        )
-        if movement is None and not dry_run:
-            movement = self._recurrence_repository.add_generated_movement(
-                amount=rule.amount,
-                description=rule.description,
-                competence_month=competence_month,
-                scheduled_date=scheduled_date,
-                payer_participant_id=rule.payer_participant_id,
-                requested_by_participant_id=rule.requested_by_participant_id,
-                external_id=external_id,
+        with timings.phase("movement_insert"):
+            movement = (
+                await self._recurrence_repository.get_generated_movement_by_external_id(
+                    competence_month=competence_month,
+                    payer_participant_id=rule.payer_participant_id,
+                    external_id=external_id,
+                )
             )
+            if movement is None and not dry_run:
+                movement = await self._recurrence_repository.add_generated_movement(
+                    amount=rule.amount,
+                    description=rule.description,
+                    competence_month=competence_month,
+                    scheduled_date=scheduled_date,
+                    payer_participant_id=rule.payer_participant_id,
+                    requested_by_participant_id=rule.requested_by_participant_id,
+                    external_id=external_id,
+                )
 
         if dry_run:
-            self._recurrence_repository.add_event(
-                recurrence_rule_id=rule.id,
-                recurrence_occurrence_id=occurrence.id,
-                event_type=RecurrenceEventType.RECURRENCE_IGNORED,
-                actor_participant_id=requested_by_participant_id,
-                payload={
-                    "reason": "dry_run",
-                    "competence_month": competence_month.isoformat(),
-                },
-            )
-            self._session.commit()
+            with timings.phase("event"):
+                self._recurrence_repository.add_event(
+                    recurrence_rule_id=rule.id,
+                    recurrence_occurrence_id=occurrence.id,
+                    event_type=RecurrenceEventType.RECURRENCE_IGNORED,
+                    actor_participant_id=requested_by_participant_id,
+                    payload={
+                        "reason": "dry_run",
+                        "competence_month": competence_month.isoformat(),
+                    },
+                )
+                await self._session.commit()
             return "ignored", None
 
         if movement is None:
@@ -210,28 +532,39 @@ class RecurrenceGenerationService:
                 occurrence=occurrence,
                 reason="Failed to create movement for recurrence generation.",
             )
-            self._session.commit()
+            await self._session.commit()
             return "failed", None
 
         self._mark_occurrence_generated(occurrence=occurrence, movement_id=movement.id)
-        self._recurrence_repository.update_rule_generation_cursor(
-            recurrence_rule_id=rule.id,
-            processed_competence_month=competence_month,
-            next_competence_month=add_months(competence_month, 1),
-        )
-        self._recurrence_repository.add_event(
-            recurrence_rule_id=rule.id,
-            recurrence_occurrence_id=occurrence.id,
-            event_type=RecurrenceEventType.RECURRENCE_GENERATED,
-            actor_participant_id=requested_by_participant_id,
-            payload={
-                "movement_id": str(movement.id),
-                "competence_month": competence_month.isoformat(),
-            },
-        )
-        self._session.commit()
+        with timings.phase("cursor_update"):
+            await self._recurrence_repository.update_rule_generation_cursor(
+                recurrence_rule_id=rule.id,
+                processed_competence_month=competence_month,
+                next_competence_month=add_months(competence_month, 1),
+            )
+        with timings.phase("event"):
+            self._recurrence_repository.add_event(
+                recurrence_rule_id=rule.id,
+                recurrence_occurrence_id=occurrence.id,
+                event_type=RecurrenceEventType.RECURRENCE_GENERATED,
+                actor_participant_id=requested_by_participant_id,
+                payload={
+                    "movement_id": str(movement.id),
+                    "competence_month": competence_month.isoformat(),
+                },
+            )
+            await self._session.commit()
         return "generated", None
 
+    async def _reload_if_expired(self, instance: object) -> None:
+        """Reload an instance expired by the rollback of an earlier item.
+
+        Async sessions cannot lazy-load expired attributes on access.
+        """
+
+        if instance_state(instance).expired:
+            await self._session.refresh(instance)
+
     def _build_blocked_item(self, rule: RecurrenceRule) -> BlockedRecurrenceItem | None:
         if str(rule.split_config.get("mode", "")).strip() != "equal":
             return BlockedRecurrenceItem(
@@ -258,6 +591,7 @@ class RecurrenceGenerationService:
         occurrence.failure_reason = None
         occurrence.attempt_count += 1
         occurrence.processed_at = datetime.now(tz=UTC)
+        occurrence.next_attempt_at = None
 
     @staticmethod
     def _mark_occurrence_blocked(
@@ -272,15 +606,20 @@ class RecurrenceGenerationService:
         occurrence.failure_reason = None
         occurrence.attempt_count += 1
         occurrence.processed_at = datetime.now(tz=UTC)
+        occurrence.next_attempt_at = None
 
-    @staticmethod
     def _mark_occurrence_failed(
-        *, occurrence: RecurrenceOccurrence, reason: str
+        self, *, occurrence: RecurrenceOccurrence, reason: str
     ) -> None:
+        now = datetime.now(tz=UTC)
         occurrence.status = RecurrenceOccurrenceStatus.FAILED
         occurrence.movement_id = None
         occurrence.blocked_reason_code = None
         occurrence.blocked_reason_message = None
         occurrence.failure_reason = reason
         occurrence.attempt_count += 1
-        occurrence.processed_at = datetime.now(tz=UTC)
+        occurrence.processed_at = now
+        occurrence.next_attempt_at = self._retry_policy.next_attempt_at(
+            attempt_count=occurrence.attempt_count,
+            now=now,
+        )
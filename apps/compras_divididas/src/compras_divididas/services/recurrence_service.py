@@ -31,23 +31,23 @@ from compras_divididas.repositories.recurrence_repository import (
 class SessionProtocol(Protocol):
     """Subset of SQLAlchemy session APIs used by recurrence service."""
 
-    def commit(self) -> None: ...
+    async def commit(self) -> None: ...
 
-    def rollback(self) -> None: ...
+    async def rollback(self) -> None: ...
 
-    def refresh(self, instance: object) -> None: ...
+    async def refresh(self, instance: object) -> None: ...
 
 
 class ParticipantRepositoryProtocol(Protocol):
     """Participant repository contract consumed by recurrence service."""
 
-    def list_active_exactly_two(self) -> list[Participant]: ...
+    async def list_active_exactly_two(self) -> list[Participant]: ...
 
 
 class RecurrenceRepositoryProtocol(Protocol):
     """Recurrence repository contract consumed by service."""
 
-    def add_rule(
+    async def add_rule(
         self,
         *,
         description: str,
@@ -71,14 +71,16 @@ class RecurrenceRepositoryProtocol(Protocol):
         recurrence_occurrence_id: UUID | None = None,
     ) -> object: ...
 
-    def list_rules(
+    async def list_rules(
         self,
         filters: RecurrenceListFilters,
     ) -> tuple[list[RecurrenceRule], int]: ...
 
-    def get_rule_for_update(self, recurrence_id: UUID) -> RecurrenceRule | None: ...
+    async def get_rule_for_update(
+        self, recurrence_id: UUID
+    ) -> RecurrenceRule | None: ...
 
-    def update_rule(
+    async def update_rule(
         self,
         *,
         rule: RecurrenceRule,
@@ -93,19 +95,19 @@ class RecurrenceRepositoryProtocol(Protocol):
         clear_end_competence_month: bool,
     ) -> RecurrenceRule: ...
 
-    def pause_rule(
+    async def pause_rule(
         self,
         *,
         rule: RecurrenceRule,
     ) -> RecurrenceRule: ...
 
-    def reactivate_rule(
+    async def reactivate_rule(
         self,
         *,
         rule: RecurrenceRule,
     ) -> RecurrenceRule: ...
 
-    def end_rule(
+    async def end_rule(
         self,
         *,
         rule: RecurrenceRule,
@@ -193,10 +195,10 @@ class RecurrenceService:
         self._participant_repository = participant_repository
         self._session = session
 
-    def create_recurrence(self, payload: CreateRecurrenceInput) -> RecurrenceRule:
+    async def create_recurrence(self, payload: CreateRecurrenceInput) -> RecurrenceRule:
         """Create one active monthly recurrence after business validation."""
 
-        participants = self._participant_repository.list_active_exactly_two()
+        participants = await self._participant_repository.list_active_exactly_two()
         participant_ids = {str(participant.id) for participant in participants}
 
         if payload.requested_by_participant_id not in participant_ids:
@@ -255,7 +257,7 @@ class RecurrenceService:
 
         try:
             next_competence_month = start_month.isoformat()
-            recurrence = self._recurrence_repository.add_rule(
+            recurrence = await self._recurrence_repository.add_rule(
                 description=payload.description.strip(),
                 amount=amount,
                 payer_participant_id=payload.payer_participant_id,
@@ -275,20 +277,20 @@ class RecurrenceService:
                     "next_competence_month": next_competence_month,
                 },
             )
-            self._session.commit()
-            self._session.refresh(recurrence)
+            await self._session.commit()
+            await self._session.refresh(recurrence)
             return recurrence
         except Exception:
-            self._session.rollback()
+            await self._session.rollback()
             raise
 
-    def list_recurrences(
+    async def list_recurrences(
         self,
         payload: ListRecurrenceInput,
     ) -> tuple[list[RecurrenceRule], int]:
         """List recurrences with status and competence filters."""
 
-        return self._recurrence_repository.list_rules(
+        return await self._recurrence_repository.list_rules(
             RecurrenceListFilters(
                 status=payload.status,
                 competence_month=payload.competence_month,
@@ -297,10 +299,10 @@ class RecurrenceService:
             )
         )
 
-    def update_recurrence(self, payload: UpdateRecurrenceInput) -> RecurrenceRule:
+    async def update_recurrence(self, payload: UpdateRecurrenceInput) -> RecurrenceRule:
         """Update mutable recurrence fields following last-write-wins."""
 
-        participant_ids = self._active_participant_ids()
+        participant_ids = await self._active_participant_ids()
         self._ensure_requested_by_is_active(
             requested_by_participant_id=payload.requested_by_participant_id,
             participant_ids=participant_ids,
@@ -349,7 +351,7 @@ class RecurrenceService:
             else None
         )
 
-        rule = self._require_rule_for_update(payload.recurrence_id)
+        rule = await self._require_rule_for_update(payload.recurrence_id)
         if (
             start_month is not None
             and rule.first_generated_competence_month is not None
@@ -382,7 +384,7 @@ class RecurrenceService:
             )
 
         try:
-            updated_rule = self._recurrence_repository.update_rule(
+            updated_rule = await self._recurrence_repository.update_rule(
                 rule=rule,
                 description=payload.description,
                 amount=amount,
@@ -405,21 +407,21 @@ class RecurrenceService:
                     ),
                 },
             )
-            self._session.commit()
-            self._session.refresh(updated_rule)
+            await self._session.commit()
+            await self._session.refresh(updated_rule)
             return updated_rule
         except Exception:
-            self._session.rollback()
+            await self._session.rollback()
             raise
 
-    def pause_recurrence(self, payload: PauseRecurrenceInput) -> RecurrenceRule:
+    async def pause_recurrence(self, payload: PauseRecurrenceInput) -> RecurrenceRule:
         """Pause one active recurrence."""
 
         self._ensure_requested_by_is_active(
             requested_by_participant_id=payload.requested_by_participant_id,
-            participant_ids=self._active_participant_ids(),
+            participant_ids=await self._active_participant_ids(),
         )
-        rule = self._require_rule_for_update(payload.recurrence_id)
+        rule = await self._require_rule_for_update(payload.recurrence_id)
         if rule.status != RecurrenceStatus.ACTIVE:
             raise InvalidRecurrenceStateTransitionError(
                 details={
@@ -430,7 +432,7 @@ class RecurrenceService:
             )
 
         try:
-            paused_rule = self._recurrence_repository.pause_rule(rule=rule)
+            paused_rule = await self._recurrence_repository.pause_rule(rule=rule)
             event_payload: dict[str, object] = {"status": paused_rule.status.value}
             if payload.reason is not None:
                 event_payload["reason"] = payload.reason
@@ -440,14 +442,14 @@ class RecurrenceService:
                 actor_participant_id=payload.requested_by_participant_id,
                 payload=event_payload,
             )
-            self._session.commit()
-            self._session.refresh(paused_rule)
+            await self._session.commit()
+            await self._session.refresh(paused_rule)
             return paused_rule
         except Exception:
-            self._session.rollback()
+            await self._session.rollback()
             raise
 
-    def reactivate_recurrence(
+    async def reactivate_recurrence(
         self,
         payload: ReactivateRecurrenceInput,
     ) -> RecurrenceRule:
@@ -455,9 +457,9 @@ class RecurrenceService:
 
         self._ensure_requested_by_is_active(
             requested_by_participant_id=payload.requested_by_participant_id,
-            participant_ids=self._active_participant_ids(),
+            participant_ids=await self._active_participant_ids(),
         )
-        rule = self._require_rule_for_update(payload.recurrence_id)
+        rule = await self._require_rule_for_update(payload.recurrence_id)
         if rule.status != RecurrenceStatus.PAUSED:
             raise InvalidRecurrenceStateTransitionError(
                 details={
@@ -468,28 +470,28 @@ class RecurrenceService:
             )
 
         try:
-            active_rule = self._recurrence_repository.reactivate_rule(rule=rule)
+            active_rule = await self._recurrence_repository.reactivate_rule(rule=rule)
             self._recurrence_repository.add_event(
                 recurrence_rule_id=active_rule.id,
                 event_type=RecurrenceEventType.RECURRENCE_REACTIVATED,
                 actor_participant_id=payload.requested_by_participant_id,
                 payload={"status": active_rule.status.value},
             )
-            self._session.commit()
-            self._session.refresh(active_rule)
+            await self._session.commit()
+            await self._session.refresh(active_rule)
             return active_rule
         except Exception:
-            self._session.rollback()
+            await self._session.rollback()
             raise
 
-    def end_recurrence(self, payload: EndRecurrenceInput) -> RecurrenceRule:
+    async def end_recurrence(self, payload: EndRecurrenceInput) -> RecurrenceRule:
         """End one active or paused recurrence."""
 
         self._ensure_requested_by_is_active(
             requested_by_participant_id=payload.requested_by_participant_id,
-            participant_ids=self._active_participant_ids(),
+            participant_ids=await self._active_participant_ids(),
         )
-        rule = self._require_rule_for_update(payload.recurrence_id)
+        rule = await self._require_rule_for_update(payload.recurrence_id)
         if rule.status == RecurrenceStatus.ENDED:
             raise InvalidRecurrenceStateTransitionError(
                 details={
@@ -514,7 +516,7 @@ class RecurrenceService:
             )
 
         try:
-            ended_rule = self._recurrence_repository.end_rule(
+            ended_rule = await self._recurrence_repository.end_rule(
                 rule=rule,
                 end_competence_month=end_month,
             )
@@ -529,15 +531,15 @@ class RecurrenceService:
                 actor_participant_id=payload.requested_by_participant_id,
                 payload=payload_data,
             )
-            self._session.commit()
-            self._session.refresh(ended_rule)
+            await self._session.commit()
+            await self._session.refresh(ended_rule)
             return ended_rule
         except Exception:
-            self._session.rollback()
+            await self._session.rollback()
             raise
 
-    def _active_participant_ids(self) -> set[str]:
-        participants = self._participant_repository.list_active_exactly_two()
+    async def _active_participant_ids(self) -> set[str]:
+        participants = await self._participant_repository.list_active_exactly_two()
         return {str(participant.id) for participant in participants}
 
     @staticmethod
@@ -554,8 +556,8 @@ class RecurrenceService:
                 )
             )
 
-    def _require_rule_for_update(self, recurrence_id: UUID) -> RecurrenceRule:
-        rule = self._recurrence_repository.get_rule_for_update(recurrence_id)
+    async def _require_rule_for_update(self, recurrence_id: UUID) -> RecurrenceRule:
+        rule = await self._recurrence_repository.get_rule_for_update(recurrence_id)
         if rule is None:
             raise RecurrenceNotFoundError(details={"recurrence_id": str(recurrence_id)})
         return rule
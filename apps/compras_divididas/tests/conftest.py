@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 from compras_divididas.api.app import create_app
 from compras_divididas.db.base import Base, import_orm_models
@@ -15,13 +17,18 @@ from compras_divididas.db.session import get_db_session
 
 
 @pytest.fixture
-def sqlite_session_factory() -> Generator[sessionmaker[Session], None, None]:
+def sqlite_database_path(tmp_path: Path) -> Path:
+    return tmp_path / "compras_divididas.db"
+
+
+@pytest.fixture
+def sqlite_session_factory(
+    sqlite_database_path: Path,
+) -> Generator[sessionmaker[Session], None, None]:
+    """Sync sessions used by tests to seed and inspect the database."""
+
     import_orm_models()
-    engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
+    engine = create_engine(f"sqlite+pysqlite:///{sqlite_database_path}")
     Base.metadata.create_all(engine)
     factory = sessionmaker(
         bind=engine,
@@ -34,6 +41,28 @@ def sqlite_session_factory() -> Generator[sessionmaker[Session], None, None]:
         yield factory
     finally:
         Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+@pytest.fixture
+def async_session_factory(
+    sqlite_session_factory: sessionmaker[Session],
+    sqlite_database_path: Path,
+) -> async_sessionmaker[AsyncSession]:
+    """Async sessions on the same database, as used by the application."""
+
+    # NullPool keeps connections from leaking between the event loops of
+    # `asyncio.run` and the TestClient portal.
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{sqlite_database_path}",
+        poolclass=NullPool,
+    )
+    return async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
 
 
 def seed_two_participants(session: Session) -> tuple[str, str]:
@@ -46,12 +75,12 @@ def seed_two_participants(session: Session) -> tuple[str, str]:
 
 @pytest.fixture
 def client(
-    sqlite_session_factory: sessionmaker[Session],
+    async_session_factory: async_sessionmaker[AsyncSession],
 ) -> Generator[TestClient, None, None]:
     app = create_app()
 
-    def override_get_db_session() -> Generator[Session, None, None]:
-        with sqlite_session_factory() as session:
+    async def override_get_db_session() -> AsyncGenerator[AsyncSession, None]:
+        async with async_session_factory() as session:
             yield session
 
     app.dependency_overrides[get_db_session] = override_get_db_session
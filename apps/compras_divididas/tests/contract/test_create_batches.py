@@ -0,0 +1,144 @@
+"""Contract tests for movement and recurrence batch endpoints."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+
+def test_movement_batch_reports_outcome_per_item(
+    client: TestClient,
+    participants: tuple[str, str],
+) -> None:
+    participant_a, participant_b = participants
+    response = client.post(
+        "/v1/movements/batch",
+        json={
+            "items": [
+                {
+                    "type": "purchase",
+                    "amount": "10.00",
+                    "description": "Padaria",
+                    "occurred_at": "2026-02-10T12:00:00-03:00",
+                    "requested_by_participant_id": participant_a,
+                    "external_id": "msg-001",
+                },
+                {
+                    "type": "purchase",
+                    "amount": "12.00",
+                    "description": "Padaria repetida",
+                    "occurred_at": "2026-02-11T12:00:00-03:00",
+                    "requested_by_participant_id": participant_a,
+                    "external_id": "msg-001",
+                },
+                {
+                    "type": "refund",
+                    "amount": "4.00",
+                    "description": "Devolucao",
+                    "occurred_at": "2026-02-12T12:00:00-03:00",
+                    "requested_by_participant_id": participant_b,
+                    "payer_participant_id": participant_a,
+                    "original_purchase_external_id": "msg-001",
+                },
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created_count"] == 2
+    assert body["failed_count"] == 1
+    assert [item["status"] for item in body["items"]] == [
+        "created",
+        "failed",
+        "created",
+    ]
+    assert body["items"][1]["error"]["code"] == "DUPLICATE_EXTERNAL_ID"
+    assert (
+        body["items"][2]["movement"]["original_purchase_id"]
+        == (body["items"][0]["movement"]["id"])
+    )
+
+    listed = client.get("/v1/movements", params={"year": 2026, "month": 2})
+    assert listed.json()["total"] == 2
+
+
+def test_movement_batch_reports_malformed_item_as_its_own_failure(
+    client: TestClient,
+    participants: tuple[str, str],
+) -> None:
+    participant_a, _ = participants
+    valid_item = {
+        "type": "purchase",
+        "amount": "10.00",
+        "description": "Padaria",
+        "occurred_at": "2026-02-10T12:00:00-03:00",
+        "requested_by_participant_id": participant_a,
+    }
+    response = client.post(
+        "/v1/movements/batch",
+        json={
+            "items": [
+                {**valid_item, "external_id": "msg-001"},
+                {**valid_item, "type": "gift", "amount": "abc"},
+                {**valid_item, "external_id": "msg-002"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["status"] for item in body["items"]] == [
+        "created",
+        "failed",
+        "created",
+    ]
+    assert body["created_count"] == 2
+    error = body["items"][1]["error"]
+    assert error["code"] == "INVALID_REQUEST"
+    assert {tuple(entry["loc"]) for entry in error["details"]["errors"]} == {
+        ("type",),
+        ("amount",),
+    }
+
+
+def test_recurrence_batch_reports_outcome_per_item(
+    client: TestClient,
+    participants: tuple[str, str],
+) -> None:
+    participant_a, _ = participants
+    base_item = {
+        "amount": "120.00",
+        "payer_participant_id": participant_a,
+        "requested_by_participant_id": participant_a,
+        "split_config": {"mode": "equal"},
+        "reference_day": 10,
+        "start_competence_month": "2026-02",
+    }
+    response = client.post(
+        "/v1/recurrences/batch",
+        json={
+            "items": [
+                {**base_item, "description": "Internet"},
+                {**base_item, "description": "Luz", "split_config": {"mode": "x"}},
+                {**base_item, "description": "Agua", "reference_day": 40},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["status"] for item in body["items"]] == [
+        "created",
+        "failed",
+        "failed",
+    ]
+    assert body["items"][0]["recurrence"]["description"] == "Internet"
+    assert body["items"][1]["error"]["code"] == "DOMAIN_INVARIANT_VIOLATION"
+    assert body["items"][2]["error"]["code"] == "INVALID_REQUEST"
+
+
+def test_batch_rejects_empty_items(client: TestClient) -> None:
+    response = client.post("/v1/movements/batch", json={"items": []})
+
+    assert response.status_code == 400
+    assert response.json()["code"] == "INVALID_REQUEST"
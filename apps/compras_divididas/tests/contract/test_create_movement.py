@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
 
 from compras_divididas.api.app import create_app
@@ -22,12 +23,12 @@ def seed_two_participants(session: Session) -> tuple[str, str]:
 
 @pytest.fixture
 def client(
-    sqlite_session_factory: sessionmaker[Session],
+    async_session_factory: async_sessionmaker[AsyncSession],
 ) -> Generator[TestClient, None, None]:
     app = create_app()
 
-    def override_get_db_session() -> Generator[Session, None, None]:
-        with sqlite_session_factory() as session:
+    async def override_get_db_session() -> AsyncGenerator[AsyncSession, None]:
+        async with async_session_factory() as session:
             yield session
 
     app.dependency_overrides[get_db_session] = override_get_db_session
@@ -120,6 +121,9 @@ def test_create_movement_returns_409_for_duplicate_external_id(
     assert first_response.status_code == 201
     assert duplicate_response.status_code == 409
     assert duplicate_response.json()["code"] == "DUPLICATE_EXTERNAL_ID"
+    assert duplicate_response.json()["details"]["payer_participant_id"] == (
+        participant_a
+    )
 
 
 def test_create_movement_returns_422_for_refund_limit_exceeded(
@@ -0,0 +1,58 @@
+"""Contract tests for the `fields` projection query parameter."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+
+def test_list_movements_projects_item_fields(
+    client: TestClient,
+    participants: tuple[str, str],
+) -> None:
+    participant_a, _ = participants
+    created = client.post(
+        "/v1/movements",
+        json={
+            "type": "purchase",
+            "amount": "120.00",
+            "description": "Supermercado",
+            "occurred_at": "2026-02-10T12:00:00Z",
+            "requested_by_participant_id": participant_a,
+        },
+    )
+    assert created.status_code == 201
+
+    response = client.get(
+        "/v1/movements",
+        params={"year": 2026, "month": 2, "fields": "id, amount"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 1
+    assert body["items"] == [{"id": created.json()["id"], "amount": "120.00"}]
+
+
+def test_monthly_report_projects_top_level_fields(
+    client: TestClient,
+    participants: tuple[str, str],
+) -> None:
+    response = client.get(
+        "/v1/months/2026/2/report",
+        params={"fields": "competence_month,total_net,transfer"},
+    )
+
+    assert response.status_code == 200
+    assert set(response.json()) == {"competence_month", "total_net", "transfer"}
+
+
+def test_fields_rejects_unknown_names(client: TestClient) -> None:
+    response = client.get(
+        "/v1/recurrences",
+        params={"fields": "id,secret"},
+    )
+
+    assert response.status_code == 400
+    body = response.json()
+    assert body["code"] == "INVALID_REQUEST"
+    assert body["details"]["unknown_fields"] == ["secret"]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from compras_divididas.api.readiness import ReadinessMonitor
+
 
 def test_health_live_returns_alive(client: TestClient) -> None:
     response = client.get("/health/live")
@@ -14,4 +17,39 @@ def test_health_ready_returns_ready(client: TestClient) -> None:
     response = client.get("/health/ready")
 
     assert response.status_code == 200
-    assert response.json() == {"status": "ready"}
+    payload = response.json()
+    assert payload["status"] == "ready"
+    assert payload["consecutive_failures"] == 0
+    assert payload["last_success_age_seconds"] >= 0
+    assert payload["pool_capacity"] == 15
+
+
+def test_health_ready_returns_503_without_a_recent_ping(client: TestClient) -> None:
+    async def never_called() -> None:
+        raise AssertionError("the probe must not ping the database")
+
+    app = client.app
+    assert isinstance(app, FastAPI)
+    app.state.readiness = ReadinessMonitor(
+        never_called,
+        interval_seconds=60,
+        timeout_seconds=1,
+        max_age_seconds=15,
+    )
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+
+
+def test_health_pool_reports_pool_and_thread_limits(client: TestClient) -> None:
+    response = client.get("/health/pool")
+
+    assert response.status_code == 200
+    payload = response.json()
+    # Without API_THREAD_LIMIT the worker keeps AnyIO's default of 40 threads.
+    assert payload["pool_size"] == 5
+    assert payload["thread_limit"] == 40
+    assert {"checked_out", "overflow", "checkout_wait_p95_ms"} <= payload.keys()
+    assert payload["load_shedding"]["max_in_flight"] == 15
+    assert payload["load_shedding"]["shed_by_class"] == {}
@@ -0,0 +1,68 @@
+"""Contract tests for recurrence generation run ledger endpoint."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+
+def test_generation_runs_record_trigger_counters_and_phase_timings(
+    client: TestClient,
+    participants: tuple[str, str],
+) -> None:
+    participant_a, _ = participants
+    create_response = client.post(
+        "/v1/recurrences",
+        json={
+            "description": "Internet",
+            "amount": "120.00",
+            "payer_participant_id": participant_a,
+            "requested_by_participant_id": participant_a,
+            "split_config": {"mode": "equal"},
+            "reference_day": 31,
+            "start_competence_month": "2026-02",
+        },
+    )
+    assert create_response.status_code == 201
+    recurrence_id = create_response.json()["id"]
+
+    generation = client.post("/v1/months/2026/2/recurrences/generate")
+    assert generation.status_code == 200
+    summary = client.get("/v1/months/2026/3/summary?auto_generate=true")
+    assert summary.status_code == 200
+
+    response = client.get("/v1/recurrences/generation-runs")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["limit"] == 20
+    assert [item["trigger"] for item in body["items"]] == ["auto_generate", "api"]
+
+    api_run = body["items"][1]
+    assert api_run["competence_month"] == "2026-02"
+    assert api_run["dry_run"] is False
+    assert api_run["processed_rules"] == 1
+    assert api_run["generated_count"] == 1
+    assert api_run["duration_ms"] >= 0
+    assert set(api_run["phase_timings_ms"]) == {
+        "claim",
+        "occurrence_insert",
+        "movement_insert",
+        "cursor_update",
+        "event",
+    }
+    assert [item["recurrence_id"] for item in api_run["slowest_rules"]] == [
+        recurrence_id
+    ]
+
+    filtered = client.get(
+        "/v1/recurrences/generation-runs",
+        params={"year": 2026, "month": 2, "trigger": "api"},
+    )
+    assert filtered.status_code == 200
+    assert len(filtered.json()["items"]) == 1
+
+
+def test_generation_runs_rejects_partial_month_filter(client: TestClient) -> None:
+    response = client.get("/v1/recurrences/generation-runs", params={"year": 2026})
+
+    assert response.status_code == 400
+    assert response.json()["code"] == "INVALID_REQUEST"
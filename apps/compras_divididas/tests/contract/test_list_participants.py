@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
 
 from compras_divididas.api.app import create_app
@@ -13,12 +14,12 @@ from compras_divididas.db.session import get_db_session
 
 @pytest.fixture
 def client(
-    sqlite_session_factory: sessionmaker[Session],
+    async_session_factory: async_sessionmaker[AsyncSession],
 ) -> Generator[TestClient, None, None]:
     app = create_app()
 
-    def override_get_db_session() -> Generator[Session, None, None]:
-        with sqlite_session_factory() as session:
+    async def override_get_db_session() -> AsyncGenerator[AsyncSession, None]:
+        async with async_session_factory() as session:
             yield session
 
     app.dependency_overrides[get_db_session] = override_get_db_session
@@ -0,0 +1,81 @@
+"""Contract tests for recurrence event audit endpoint."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+
+def _create_recurrence(client: TestClient, participant_id: str) -> str:
+    response = client.post(
+        "/v1/recurrences",
+        json={
+            "description": "Internet",
+            "amount": "120.00",
+            "payer_participant_id": participant_id,
+            "requested_by_participant_id": participant_id,
+            "split_config": {"mode": "equal"},
+            "reference_day": 10,
+            "start_competence_month": "2026-02",
+        },
+    )
+    assert response.status_code == 201
+    return str(response.json()["id"])
+
+
+def test_list_events_filters_and_paginates_newest_first(
+    client: TestClient,
+    participants: tuple[str, str],
+) -> None:
+    participant_a, _ = participants
+    recurrence_id = _create_recurrence(client, participant_a)
+    other_recurrence_id = _create_recurrence(client, participant_a)
+    pause = client.post(
+        f"/v1/recurrences/{recurrence_id}/pause",
+        json={"requested_by_participant_id": participant_a},
+    )
+    assert pause.status_code == 200
+
+    first_page = client.get(
+        "/v1/recurrences/events",
+        params={"recurrence_id": recurrence_id, "limit": 1},
+    )
+    assert first_page.status_code == 200
+    body = first_page.json()
+    assert [item["event_type"] for item in body["items"]] == ["recurrence_paused"]
+    assert body["next_created_before"] is not None
+
+    second_page = client.get(
+        "/v1/recurrences/events",
+        params={
+            "recurrence_id": recurrence_id,
+            "limit": 1,
+            "created_before": body["next_created_before"],
+            "before_id": body["next_before_id"],
+        },
+    )
+    assert second_page.status_code == 200
+    second_items = second_page.json()["items"]
+    assert [item["event_type"] for item in second_items] == ["recurrence_created"]
+    assert second_items[0]["recurrence_id"] == recurrence_id
+
+    created_events = client.get(
+        "/v1/recurrences/events",
+        params={"event_type": "recurrence_created"},
+    )
+    assert created_events.status_code == 200
+    assert {item["recurrence_id"] for item in created_events.json()["items"]} == {
+        recurrence_id,
+        other_recurrence_id,
+    }
+
+
+def test_list_events_rejects_before_id_without_created_before(
+    client: TestClient,
+) -> None:
+    response = client.get(
+        "/v1/recurrences/events",
+        params={"before_id": "00000000-0000-0000-0000-000000000000"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["code"] == "INVALID_REQUEST"
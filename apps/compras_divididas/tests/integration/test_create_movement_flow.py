@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from decimal import Decimal
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
 
 from compras_divididas.db.models.financial_movement import (
@@ -30,17 +32,26 @@ def seed_two_participants(session: Session) -> tuple[str, str]:
 
 def test_create_purchase_then_refund_and_enforce_refund_limit(
     sqlite_session_factory: sessionmaker[Session],
+    async_session_factory: async_sessionmaker[AsyncSession],
 ) -> None:
-    with sqlite_session_factory() as session:
-        participant_a_id, _ = seed_two_participants(session)
+    with sqlite_session_factory() as seed_session:
+        participant_a_id, _ = seed_two_participants(seed_session)
 
+    asyncio.run(_purchase_then_refunds(async_session_factory, participant_a_id))
+
+
+async def _purchase_then_refunds(
+    session_factory: async_sessionmaker[AsyncSession],
+    participant_a_id: str,
+) -> None:
+    async with session_factory() as session:
         service = MovementService(
             movement_repository=MovementRepository(session),
             participant_repository=ParticipantRepository(session),
             session=session,
         )
 
-        purchase = service.create_movement(
+        purchase = await service.create_movement(
             CreateMovementInput(
                 movement_type=MovementType.PURCHASE,
                 amount=Decimal("100.00"),
@@ -50,7 +61,7 @@ def test_create_purchase_then_refund_and_enforce_refund_limit(
             )
         )
 
-        refund = service.create_movement(
+        refund = await service.create_movement(
             CreateMovementInput(
                 movement_type=MovementType.REFUND,
                 amount=Decimal("30.00"),
@@ -61,9 +72,9 @@ def test_create_purchase_then_refund_and_enforce_refund_limit(
         )
 
         movements = list(
-            session.scalars(
+            await session.scalars(
                 select(FinancialMovement).order_by(FinancialMovement.created_at.asc())
-            ).all()
+            )
         )
         assert len(movements) == 2
         assert refund.original_purchase_id == purchase.id
@@ -71,7 +82,7 @@ def test_create_purchase_then_refund_and_enforce_refund_limit(
         assert net_total == Decimal("70.00")
 
         with pytest.raises(RefundLimitExceededError):
-            service.create_movement(
+            await service.create_movement(
                 CreateMovementInput(
                     movement_type=MovementType.REFUND,
                     amount=Decimal("80.00"),
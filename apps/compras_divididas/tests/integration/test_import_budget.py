@@ -0,0 +1,83 @@
+"""Import-time and memory budgets for the API, CLI and MCP entry points."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# (module, import seconds, max RSS in MiB, modules that must stay unloaded)
+IMPORT_BUDGETS = (
+    (
+        "compras_divididas.api.app",
+        3.0,
+        120,
+        ("psycopg", "aiosqlite", "httpx"),
+    ),
+    (
+        "compras_divididas.cli",
+        0.5,
+        48,
+        ("sqlalchemy", "fastapi", "compras_divididas.db"),
+    ),
+    (
+        "compras_divididas.mcp.server",
+        4.0,
+        120,
+        ("sqlalchemy", "httpx", "compras_divididas.api"),
+    ),
+)
+
+# Peak RSS comes from VmHWM: unlike ru_maxrss it is not inherited from the
+# forked pytest process.
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+session = sys.modules.get("compras_divididas.db.session")
+with open("/proc/self/status") as status:
+    hwm_kib = next(int(line.split()[1]) for line in status if line.startswith("VmHWM"))
+print(json.dumps({{
+    "seconds": elapsed,
+    "rss_mib": hwm_kib / 1024,
+    "loaded": [name for name in {deferred!r} if name in sys.modules],
+    "engine_built": bool(session and session.get_database.cache_info().currsize),
+}}))
+"""
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"),
+    reason="peak RSS is read from /proc",
+)
+@pytest.mark.parametrize(
+    ("module", "max_seconds", "max_rss_mib", "deferred"),
+    IMPORT_BUDGETS,
+)
+def test_entry_point_import_stays_within_budget(
+    module: str,
+    max_seconds: float,
+    max_rss_mib: int,
+    deferred: tuple[str, ...],
+) -> None:
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, deferred=deferred)],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+    measured = json.loads(completed.stdout)
+
+    assert measured["loaded"] == []
+    assert measured["engine_built"] is False
+    assert measured["seconds"] <= max_seconds, (
+        f"importing {module} took {measured['seconds']:.2f}s"
+    )
+    assert measured["rss_mib"] <= max_rss_mib, (
+        f"importing {module} peaked at {measured['rss_mib']:.0f} MiB"
+    )
@@ -0,0 +1,51 @@
+"""Integration tests for the in-process MCP transport."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+from fastapi import FastAPI
+from fastmcp import Client
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from compras_divididas.api import app as app_module
+from compras_divididas.db.session import get_db_session, get_read_database
+from compras_divididas.mcp.server import create_mcp_server
+
+
+def test_in_process_mcp_calls_api_without_network(
+    monkeypatch: pytest.MonkeyPatch,
+    participants: tuple[str, str],
+    async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    original_create_app = app_module.create_app
+
+    def create_test_app() -> FastAPI:
+        app = original_create_app()
+
+        async def override_get_db_session() -> AsyncGenerator[AsyncSession, None]:
+            async with async_session_factory() as session:
+                yield session
+
+        app.dependency_overrides[get_db_session] = override_get_db_session
+        return app
+
+    monkeypatch.setattr(app_module, "create_app", create_test_app)
+
+    async def scenario() -> object:
+        server = create_mcp_server(
+            api_base_url="http://unreachable.invalid",
+            in_process=True,
+        )
+        async with Client(server) as client:
+            result = await client.call_tool("list_participants", {})
+        return result.data
+
+    payload = asyncio.run(scenario())
+
+    assert isinstance(payload, dict)
+    assert [item["id"] for item in payload["participants"]] == list(participants)
+    # Engines built by the in-process app are disposed at MCP shutdown.
+    assert get_read_database.cache_info().currsize == 0
@@ -0,0 +1,77 @@
+"""Cold-start budget for the stdio MCP server spawned by agent hosts."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+
+import pytest
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+
+# Import time and deferred modules of `compras_divididas.mcp.server` are
+# checked with the other entry points in test_import_budget.py.
+MCP_FIRST_TOOL_RESPONSE_SECONDS = 5.0
+
+
+class _ParticipantsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        body = json.dumps({"participants": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return None
+
+
+@pytest.fixture
+def stub_api_base_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ParticipantsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _subprocess_env() -> dict[str, str]:
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+
+def test_mcp_first_tool_response_within_budget(stub_api_base_url: str) -> None:
+    transport = StdioTransport(
+        command=sys.executable,
+        args=[
+            "-m",
+            "compras_divididas.cli",
+            "mcp",
+            "--api-base-url",
+            stub_api_base_url,
+        ],
+        env=_subprocess_env(),
+    )
+
+    async def scenario() -> tuple[float, object]:
+        started = perf_counter()
+        async with Client(transport) as client:
+            result = await client.call_tool("list_participants", {})
+            elapsed = perf_counter() - started
+        return elapsed, result.data
+
+    elapsed, payload = asyncio.run(scenario())
+
+    assert payload == {"participants": []}
+    assert elapsed <= MCP_FIRST_TOOL_RESPONSE_SECONDS, (
+        f"first MCP tool response took {elapsed:.2f}s"
+    )
@@ -0,0 +1,98 @@
+"""Integration tests for read replica routing and read-your-writes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from compras_divididas.api import read_routing
+from compras_divididas.db.base import Base
+from compras_divididas.db.pool import PoolMetrics
+from compras_divididas.db.session import Database
+
+
+@pytest.fixture
+def lagging_replica(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Route replica reads to an empty database, like a replica far behind."""
+
+    replica_path = tmp_path / "replica.db"
+    sync_engine = create_engine(f"sqlite+pysqlite:///{replica_path}")
+    Base.metadata.create_all(sync_engine)
+    sync_engine.dispose()
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{replica_path}",
+        poolclass=NullPool,
+    )
+    replica = Database(
+        engine=engine,
+        session_factory=async_sessionmaker(
+            bind=engine, class_=AsyncSession, expire_on_commit=False
+        ),
+        pool_metrics=PoolMetrics(),
+    )
+    monkeypatch.setattr(read_routing, "get_read_database", lambda: replica)
+
+
+def _list_february(client: TestClient, headers: dict[str, str] | None = None) -> int:
+    response = client.get(
+        "/v1/movements", params={"year": 2026, "month": 2}, headers=headers
+    )
+    assert response.status_code == 200
+    return int(response.json()["total"])
+
+
+def test_reads_follow_writes_then_move_to_the_replica(
+    client: TestClient,
+    participants: tuple[str, str],
+    lagging_replica: None,
+) -> None:
+    participant_a, _ = participants
+    created = client.post(
+        "/v1/movements",
+        json={
+            "type": "purchase",
+            "amount": "120.00",
+            "description": "Supermercado",
+            "occurred_at": "2026-02-10T12:00:00Z",
+            "requested_by_participant_id": participant_a,
+        },
+    )
+    assert created.status_code == 201
+    assert read_routing.RECENT_WRITE_COOKIE in created.cookies
+
+    # Inside the sticky window the client reads its own write from the primary.
+    assert _list_february(client) == 1
+
+    # Once the cookie is gone reads hit the replica, unless pinned by header.
+    client.cookies.clear()
+    assert _list_february(client) == 0
+    assert _list_february(client, headers={"X-Read-Consistency": "primary"}) == 1
+
+
+def test_failed_writes_do_not_pin_reads(
+    client: TestClient,
+    participants: tuple[str, str],
+    lagging_replica: None,
+) -> None:
+    participant_a, _ = participants
+    rejected = client.post(
+        "/v1/movements",
+        json={
+            "type": "purchase",
+            "amount": "-1.00",
+            "description": "Invalido",
+            "requested_by_participant_id": participant_a,
+        },
+    )
+
+    assert rejected.status_code >= 400
+    assert read_routing.RECENT_WRITE_COOKIE not in rejected.cookies
@@ -0,0 +1,129 @@
+"""Integration tests for buffered recurrence event writes."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from compras_divididas.db.models.recurrence_event import (
+    RecurrenceEvent,
+    RecurrenceEventType,
+)
+from compras_divididas.repositories.recurrence_repository import RecurrenceRepository
+
+
+async def _create_rule(repository: RecurrenceRepository, participant_id: str) -> Any:
+    return await repository.add_rule(
+        description="Internet",
+        amount=Decimal("120.00"),
+        payer_participant_id=participant_id,
+        requested_by_participant_id=participant_id,
+        split_config={"mode": "equal"},
+        reference_day=10,
+        start_competence_month=date(2026, 2, 1),
+        end_competence_month=None,
+        next_competence_month=date(2026, 2, 1),
+    )
+
+
+def test_events_are_written_in_one_insert_at_commit(
+    participants: tuple[str, str],
+    sqlite_session_factory: sessionmaker[Session],
+    async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    participant_a, _ = participants
+    event_inserts: list[str] = []
+    event_types = [
+        RecurrenceEventType.RECURRENCE_CREATED,
+        RecurrenceEventType.RECURRENCE_UPDATED,
+        RecurrenceEventType.RECURRENCE_PAUSED,
+    ]
+
+    async def scenario() -> None:
+        async with async_session_factory() as session:
+            repository = RecurrenceRepository(session)
+            rule = await _create_rule(repository, participant_a)
+            for index, event_type in enumerate(event_types):
+                repository.add_event(
+                    recurrence_rule_id=rule.id,
+                    event_type=event_type,
+                    actor_participant_id=participant_a,
+                    payload={"sequence": index},
+                )
+
+            pending_count = await session.scalar(
+                select(func.count()).select_from(RecurrenceEvent)
+            )
+            assert pending_count == 0
+
+            def record_insert(
+                _conn: object,
+                _cursor: object,
+                statement: str,
+                *_args: object,
+            ) -> None:
+                if statement.startswith("INSERT INTO recurrence_events"):
+                    event_inserts.append(statement)
+
+            engine = session.get_bind()
+            event.listen(engine, "before_cursor_execute", record_insert)
+            try:
+                await session.commit()
+            finally:
+                event.remove(engine, "before_cursor_execute", record_insert)
+
+    asyncio.run(scenario())
+
+    with sqlite_session_factory() as session:
+        stored = list(
+            session.scalars(
+                select(RecurrenceEvent).order_by(RecurrenceEvent.created_at.asc())
+            )
+        )
+
+    assert len(event_inserts) == 1
+    assert [item.event_type for item in stored] == event_types
+    assert [item.payload["sequence"] for item in stored] == [0, 1, 2]
+
+
+def test_rollback_discards_buffered_events(
+    participants: tuple[str, str],
+    sqlite_session_factory: sessionmaker[Session],
+    async_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    participant_a, _ = participants
+
+    async def scenario() -> None:
+        async with async_session_factory() as session:
+            repository = RecurrenceRepository(session)
+            rule = await _create_rule(repository, participant_a)
+            await session.commit()
+            # The rollback below expires `rule`; keep its id around.
+            rule_id = rule.id
+
+            repository.add_event(
+                recurrence_rule_id=rule_id,
+                event_type=RecurrenceEventType.RECURRENCE_PAUSED,
+                payload={"status": "paused"},
+            )
+            await session.rollback()
+
+            repository.add_event(
+                recurrence_rule_id=rule_id,
+                event_type=RecurrenceEventType.RECURRENCE_ENDED,
+                payload={"status": "ended"},
+            )
+            await session.commit()
+
+    asyncio.run(scenario())
+
+    with sqlite_session_factory() as session:
+        stored_types = list(session.scalars(select(RecurrenceEvent.event_type)))
+
+    assert stored_types == [RecurrenceEventType.RECURRENCE_ENDED]
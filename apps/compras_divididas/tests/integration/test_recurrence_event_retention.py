@@ -0,0 +1,88 @@
+"""Integration tests for recurrence event retention and archival."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from compras_divididas.db.models.recurrence_event import (
+    RecurrenceEvent,
+    RecurrenceEventType,
+)
+from compras_divididas.repositories.recurrence_repository import RecurrenceRepository
+from compras_divididas.services.recurrence_event_retention_service import (
+    ArchiveRecurrenceEventsResult,
+    RecurrenceEventRetentionService,
+)
+
+
+def test_archive_moves_expired_events_to_gzip_batches(
+    participants: tuple[str, str],
+    async_session_factory: async_sessionmaker[AsyncSession],
+    tmp_path: Path,
+) -> None:
+    participant_a, _ = participants
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+
+    async def scenario() -> tuple[ArchiveRecurrenceEventsResult, list[RecurrenceEvent]]:
+        async with async_session_factory() as session:
+            repository = RecurrenceRepository(session)
+            rule = await repository.add_rule(
+                description="Internet",
+                amount=Decimal("120.00"),
+                payer_participant_id=participant_a,
+                requested_by_participant_id=participant_a,
+                split_config={"mode": "equal"},
+                reference_day=10,
+                start_competence_month=date(2025, 1, 1),
+                end_competence_month=None,
+                next_competence_month=date(2025, 1, 1),
+            )
+            for days_ago in (400, 390, 380, 10):
+                session.add(
+                    RecurrenceEvent(
+                        recurrence_rule_id=rule.id,
+                        event_type=RecurrenceEventType.RECURRENCE_UPDATED,
+                        actor_participant_id=participant_a,
+                        payload={"days_ago": days_ago},
+                        created_at=now - timedelta(days=days_ago),
+                    )
+                )
+            await session.commit()
+
+            service = RecurrenceEventRetentionService(
+                recurrence_repository=repository,
+                session=session,
+                archive_dir=tmp_path,
+            )
+            result = await service.archive_events_older_than(
+                retention_days=365,
+                batch_size=2,
+                now=now,
+            )
+
+            remaining = list(await session.scalars(select(RecurrenceEvent)))
+            return result, remaining
+
+    result, remaining = asyncio.run(scenario())
+
+    assert result.archived_count == 3
+    assert result.batch_count == 2
+    assert [event.payload for event in remaining] == [{"days_ago": 10}]
+
+    archived_payloads: list[dict[str, int]] = []
+    for archive_path in result.archive_files:
+        with gzip.open(archive_path, "rt", encoding="utf-8") as archive:
+            archived_payloads.extend(json.loads(line)["payload"] for line in archive)
+    assert archived_payloads == [
+        {"days_ago": 400},
+        {"days_ago": 390},
+        {"days_ago": 380},
+    ]
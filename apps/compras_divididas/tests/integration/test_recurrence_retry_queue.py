@@ -0,0 +1,253 @@
+"""Integration tests for the failed recurrence occurrence retry queue."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, date, datetime, timedelta
+from uuid import UUID
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from compras_divididas.db.models.recurrence_event import (
+    RecurrenceEvent,
+    RecurrenceEventType,
+)
+from compras_divididas.db.models.recurrence_occurrence import (
+    RecurrenceOccurrence,
+    RecurrenceOccurrenceStatus,
+)
+from compras_divididas.repositories.recurrence_repository import RecurrenceRepository
+from compras_divididas.services.recurrence_generation_service import (
+    RecurrenceGenerationService,
+    RetryFailedOccurrencesResult,
+)
+
+
+def _load_occurrence(
+    session: Session,
+    recurrence_id: UUID,
+) -> RecurrenceOccurrence | None:
+    return session.scalar(
+        select(RecurrenceOccurrence).where(
+            RecurrenceOccurrence.recurrence_rule_id == recurrence_id,
+            RecurrenceOccurrence.competence_month == date(2026, 2, 1),
+        )
+    )
+
+
+def test_transient_failure_is_queued_and_healed_by_retry(
+    client: TestClient,
+    participants: tuple[str, str],
+    sqlite_session_factory: sessionmaker[Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    participant_a, _ = participants
+    create_response = client.post(
+        "/v1/recurrences",
+        json={
+            "description": "Internet",
+            "amount": "120.00",
+            "payer_participant_id": participant_a,
+            "requested_by_participant_id": participant_a,
+            "split_config": {"mode": "equal"},
+            "reference_day": 10,
+            "start_competence_month": "2026-02",
+        },
+    )
+    assert create_response.status_code == 201
+    recurrence_id = UUID(create_response.json()["id"])
+
+    original_add_movement = RecurrenceRepository.add_generated_movement
+
+    def failing_add_movement(*_args: object, **_kwargs: object) -> None:
+        raise OperationalError("INSERT", {}, Exception("connection reset"))
+
+    monkeypatch.setattr(
+        RecurrenceRepository, "add_generated_movement", failing_add_movement
+    )
+    failed_generation = client.post("/v1/months/2026/2/recurrences/generate")
+    assert failed_generation.status_code == 200
+    assert failed_generation.json()["failed_count"] == 1
+
+    with sqlite_session_factory() as session:
+        occurrence = _load_occurrence(session, recurrence_id)
+        assert occurrence is not None
+        assert occurrence.status == RecurrenceOccurrenceStatus.FAILED
+        assert occurrence.attempt_count == 1
+        assert occurrence.failure_reason is not None
+        assert "connection reset" in occurrence.failure_reason
+        assert occurrence.next_attempt_at is not None
+        failed_events = list(
+            session.scalars(
+                select(RecurrenceEvent).where(
+                    RecurrenceEvent.event_type == RecurrenceEventType.RECURRENCE_FAILED
+                )
+            )
+        )
+        assert len(failed_events) == 1
+
+    monkeypatch.setattr(
+        RecurrenceRepository, "add_generated_movement", original_add_movement
+    )
+
+    not_due = client.post("/v1/recurrences/failed-occurrences/retry")
+    assert not_due.status_code == 200
+    assert not_due.json()["due_count"] == 0
+
+    with sqlite_session_factory() as session:
+        occurrence = _load_occurrence(session, recurrence_id)
+        assert occurrence is not None
+        occurrence.next_attempt_at = datetime.now(tz=UTC) - timedelta(seconds=1)
+        session.commit()
+
+    retry = client.post("/v1/recurrences/failed-occurrences/retry")
+    assert retry.status_code == 200
+    assert retry.json()["due_count"] == 1
+    assert retry.json()["generated_count"] == 1
+
+    with sqlite_session_factory() as session:
+        occurrence = _load_occurrence(session, recurrence_id)
+        assert occurrence is not None
+        assert occurrence.status == RecurrenceOccurrenceStatus.GENERATED
+        assert occurrence.movement_id is not None
+        assert occurrence.next_attempt_at is None
+
+    runs = client.get(
+        "/v1/recurrences/generation-runs", params={"year": 2026, "month": 2}
+    ).json()["items"]
+    assert [(run["trigger"], run["generated_count"]) for run in runs] == [
+        ("api", 1),
+        ("api", 0),
+    ]
+
+
+def test_retry_skips_an_occurrence_retried_by_another_runner(
+    client: TestClient,
+    participants: tuple[str, str],
+    sqlite_session_factory: sessionmaker[Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    participant_a, _ = participants
+    create_response = client.post(
+        "/v1/recurrences",
+        json={
+            "description": "Academia",
+            "amount": "90.00",
+            "payer_participant_id": participant_a,
+            "requested_by_participant_id": participant_a,
+            "split_config": {"mode": "equal"},
+            "reference_day": 5,
+            "start_competence_month": "2026-02",
+        },
+    )
+    recurrence_id = UUID(create_response.json()["id"])
+
+    with monkeypatch.context() as patch:
+
+        def failing_add_movement(*_args: object, **_kwargs: object) -> None:
+            raise OperationalError("INSERT", {}, Exception("connection reset"))
+
+        patch.setattr(
+            RecurrenceRepository, "add_generated_movement", failing_add_movement
+        )
+        client.post("/v1/months/2026/2/recurrences/generate")
+
+    with sqlite_session_factory() as session:
+        occurrence = _load_occurrence(session, recurrence_id)
+        assert occurrence is not None
+        occurrence.next_attempt_at = datetime.now(tz=UTC) - timedelta(seconds=1)
+        session.commit()
+
+    original_list_ids = RecurrenceRepository.list_due_failed_occurrence_ids
+
+    async def list_then_lose_the_race(
+        self: RecurrenceRepository, **kwargs: datetime | int
+    ) -> list[UUID]:
+        occurrence_ids = await original_list_ids(self, **kwargs)  # type: ignore[arg-type]
+        # Another runner retries the occurrence, and fails again, before this
+        # one claims it: the row is no longer due.
+        with sqlite_session_factory() as session:
+            occurrence = _load_occurrence(session, recurrence_id)
+            assert occurrence is not None
+            occurrence.next_attempt_at = datetime.now(tz=UTC) + timedelta(hours=1)
+            session.commit()
+        return occurrence_ids
+
+    monkeypatch.setattr(
+        RecurrenceRepository,
+        "list_due_failed_occurrence_ids",
+        list_then_lose_the_race,
+    )
+
+    retry = client.post("/v1/recurrences/failed-occurrences/retry")
+
+    assert retry.status_code == 200
+    assert retry.json()["due_count"] == 1
+    assert retry.json()["generated_count"] == 0
+    assert retry.json()["ignored_count"] == 1
+
+
+def test_scheduled_retry_is_recorded_in_the_generation_ledger(
+    client: TestClient,
+    participants: tuple[str, str],
+    sqlite_session_factory: sessionmaker[Session],
+    async_session_factory: async_sessionmaker[AsyncSession],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    participant_a, _ = participants
+    create_response = client.post(
+        "/v1/recurrences",
+        json={
+            "description": "Condominio",
+            "amount": "300.00",
+            "payer_participant_id": participant_a,
+            "requested_by_participant_id": participant_a,
+            "split_config": {"mode": "equal"},
+            "reference_day": 8,
+            "start_competence_month": "2026-02",
+        },
+    )
+    recurrence_id = UUID(create_response.json()["id"])
+
+    with monkeypatch.context() as patch:
+
+        def failing_add_movement(*_args: object, **_kwargs: object) -> None:
+            raise OperationalError("INSERT", {}, Exception("connection reset"))
+
+        patch.setattr(
+            RecurrenceRepository, "add_generated_movement", failing_add_movement
+        )
+        client.post("/v1/months/2026/2/recurrences/generate")
+
+    with sqlite_session_factory() as session:
+        occurrence = _load_occurrence(session, recurrence_id)
+        assert occurrence is not None
+        occurrence.next_attempt_at = datetime.now(tz=UTC) - timedelta(seconds=1)
+        session.commit()
+
+    async def retry_as_scheduled_worker() -> RetryFailedOccurrencesResult:
+        async with async_session_factory() as session:
+            service = RecurrenceGenerationService(
+                recurrence_repository=RecurrenceRepository(session),
+                session=session,
+            )
+            return await service.retry_failed_occurrences()
+
+    result = asyncio.run(retry_as_scheduled_worker())
+
+    assert result.generated_count == 1
+    runs = client.get(
+        "/v1/recurrences/generation-runs", params={"trigger": "scheduler"}
+    ).json()["items"]
+    [scheduler_run] = runs
+    assert scheduler_run["competence_month"] == "2026-02"
+    assert scheduler_run["processed_rules"] == 1
+    assert scheduler_run["generated_count"] == 1
+    assert [rule["recurrence_id"] for rule in scheduler_run["slowest_rules"]] == [
+        str(recurrence_id)
+    ]
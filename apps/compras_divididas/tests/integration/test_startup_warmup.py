@@ -0,0 +1,43 @@
+"""Integration tests for the API startup warm-up phase."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from compras_divididas.api.warmup import warm_up_app
+from compras_divididas.db.session import get_db_session
+
+
+def test_warmup_runs_hot_read_paths_before_serving(
+    participants: tuple[str, str],
+    client: TestClient,
+) -> None:
+    response = client.get("/health/pool")
+
+    assert response.status_code == 200
+    assert set(response.json()["warmup_ms"]) == {
+        "pool",
+        "participants",
+        "summary",
+        "movements",
+        "recurrences",
+    }
+
+
+def test_warmup_failure_does_not_block_startup() -> None:
+    app = FastAPI()
+
+    async def unavailable_session() -> AsyncGenerator[AsyncSession, None]:
+        raise ConnectionRefusedError("database is down")
+        yield  # pragma: no cover
+
+    app.dependency_overrides[get_db_session] = unavailable_session
+
+    timings = asyncio.run(warm_up_app(app, connections=2, timeout_seconds=1.0))
+
+    assert "participants" not in timings
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+
+from starlette.types import Message, Receive, Scope, Send
+
+from compras_divididas.api.cancellation import CancelOnDisconnectMiddleware
+
+SCOPE: Scope = {"type": "http", "method": "GET", "path": "/slow"}
+
+
+def client_messages(*, disconnect: asyncio.Event) -> Receive:
+    sent_body = False
+
+    async def receive() -> Message:
+        nonlocal sent_body
+        if not sent_body:
+            sent_body = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    return receive
+
+
+def test_handler_is_cancelled_when_the_client_disconnects() -> None:
+    events: list[str] = []
+    sent: list[Message] = []
+
+    async def slow_app(scope: Scope, receive: Receive, send: Send) -> None:
+        await receive()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    async def scenario() -> None:
+        disconnect = asyncio.Event()
+        middleware = CancelOnDisconnectMiddleware(slow_app)
+
+        async def send(message: Message) -> None:
+            sent.append(message)
+
+        request = asyncio.create_task(
+            middleware(SCOPE, client_messages(disconnect=disconnect), send)
+        )
+        await asyncio.sleep(0.01)
+        disconnect.set()
+        await asyncio.wait_for(request, timeout=1)
+
+    asyncio.run(scenario())
+
+    assert events == ["cancelled"]
+    assert sent == []
+
+
+def test_completed_response_is_not_cancelled_by_the_final_disconnect() -> None:
+    events: list[str] = []
+    sent: list[Message] = []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        message = await receive()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": message["body"]})
+        # Servers report a disconnect once the response is complete.
+        disconnect.set()
+        await asyncio.sleep(0.01)
+        events.append("cleanup finished")
+
+    disconnect = asyncio.Event()
+
+    async def scenario() -> None:
+        async def send(message: Message) -> None:
+            sent.append(message)
+
+        await CancelOnDisconnectMiddleware(app)(
+            SCOPE, client_messages(disconnect=disconnect), send
+        )
+
+    asyncio.run(scenario())
+
+    assert events == ["cleanup finished"]
+    assert [message["type"] for message in sent] == [
+        "http.response.start",
+        "http.response.body",
+    ]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from compras_divididas.core.settings import Settings
+from compras_divididas.db.pool import (
+    PoolMetrics,
+    resolve_thread_limit,
+    timed_pool_class,
+)
+
+
+def test_timed_pool_records_checkouts_and_timeouts(tmp_path: Path) -> None:
+    metrics = PoolMetrics()
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=timed_pool_class(metrics),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+
+    async def scenario() -> dict[str, object]:
+        async with engine.connect() as held:
+            await held.execute(text("SELECT 1"))
+            busy = metrics.snapshot(engine.sync_engine.pool)
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+        await engine.dispose()
+        return busy
+
+    busy = asyncio.run(scenario())
+
+    assert busy["checked_out"] == 1
+    assert busy["pool_size"] == 1
+    snapshot = metrics.snapshot()
+    assert snapshot["checkouts"] == 1
+    assert snapshot["checkout_timeouts"] == 1
+
+
+def test_thread_limit_is_independent_of_the_pool() -> None:
+    pooled = Settings.model_validate({"DB_POOL_SIZE": 4, "DB_MAX_OVERFLOW": 2})
+    pinned = Settings.model_validate({"DB_POOL_SIZE": 4, "API_THREAD_LIMIT": 8})
+
+    assert resolve_thread_limit(pooled) is None
+    assert resolve_thread_limit(pinned) == 8
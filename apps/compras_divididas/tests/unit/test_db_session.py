@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from compras_divididas.api import gunicorn_conf
+from compras_divididas.db.session import (
+    built_databases,
+    get_database,
+    reset_databases_after_fork,
+)
+
+
+def test_database_is_built_on_first_use_only() -> None:
+    reset_databases_after_fork()
+    assert built_databases() == []
+
+    database = get_database()
+
+    assert get_database() is database
+    assert built_databases() == [database]
+    reset_databases_after_fork()
+
+
+def test_post_fork_hook_gives_the_worker_fresh_engines() -> None:
+    inherited = get_database()
+
+    gunicorn_conf.post_fork(SimpleNamespace(), SimpleNamespace())
+
+    assert built_databases() == []
+    assert get_database() is not inherited
+    reset_databases_after_fork()
+
+
+def test_gunicorn_config_preloads_with_uvicorn_workers() -> None:
+    assert gunicorn_conf.preload_app is True
+    assert gunicorn_conf.worker_class == "uvicorn_worker.UvicornWorker"
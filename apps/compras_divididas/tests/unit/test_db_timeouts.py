@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from compras_divididas.db.timeouts import (
+    QUERY_TIMEOUTS_INFO_KEY,
+    QueryTimeouts,
+    QueryTimeoutSession,
+    _apply_query_timeouts,
+    resolve_query_timeouts,
+    use_query_timeouts,
+)
+
+DEFAULTS = QueryTimeouts(statement_ms=5000, lock_ms=2000)
+
+
+class RecordingConnection:
+    def __init__(self, dialect_name: str) -> None:
+        self.dialect = SimpleNamespace(name=dialect_name)
+        self.executed: list[tuple[str, dict[str, Any]]] = []
+
+    def execute(self, statement: Any, parameters: dict[str, Any]) -> None:
+        self.executed.append((str(statement), parameters))
+
+
+def test_route_timeouts_reach_the_session_and_fall_back_to_defaults(
+    tmp_path: Path,
+) -> None:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'timeouts.db'}", poolclass=NullPool
+    )
+    session_factory = async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        sync_session_class=QueryTimeoutSession,
+        info={QUERY_TIMEOUTS_INFO_KEY: DEFAULTS},
+    )
+    long_timeouts = QueryTimeouts(statement_ms=30000, lock_ms=2000)
+
+    async def resolve(route_timeouts: QueryTimeouts | None) -> QueryTimeouts | None:
+        if route_timeouts is not None:
+            use_query_timeouts(route_timeouts)
+        async with session_factory() as session:
+            return await session.run_sync(resolve_query_timeouts)
+
+    assert asyncio.run(resolve(long_timeouts)) == long_timeouts
+    # Each request runs in its own context, so route limits never leak.
+    assert asyncio.run(resolve(None)) == DEFAULTS
+    asyncio.run(engine.dispose())
+
+
+def test_timeouts_are_set_locally_on_postgresql_only() -> None:
+    session = Session(info={QUERY_TIMEOUTS_INFO_KEY: DEFAULTS})
+    postgresql = RecordingConnection("postgresql")
+    sqlite = RecordingConnection("sqlite")
+
+    _apply_query_timeouts(session, None, postgresql)
+    _apply_query_timeouts(session, None, sqlite)
+
+    assert sqlite.executed == []
+    [(statement, parameters)] = postgresql.executed
+    assert "set_config('statement_timeout', :statement_timeout, true)" in statement
+    assert "set_config('lock_timeout', :lock_timeout, true)" in statement
+    assert parameters == {"statement_timeout": "5000", "lock_timeout": "2000"}
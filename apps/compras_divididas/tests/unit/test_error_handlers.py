@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
 
 from compras_divididas.api.error_handlers import register_error_handlers
 from compras_divididas.domain.errors import DuplicateExternalIDError
@@ -21,3 +22,32 @@ def test_domain_error_handler_returns_contract_shape() -> None:
         "code": "DUPLICATE_EXTERNAL_ID",
         "message": "Duplicated movement",
     }
+
+
+class FakeDriverError(Exception):
+    def __init__(self, sqlstate: str) -> None:
+        super().__init__(f"sqlstate {sqlstate}")
+        self.sqlstate = sqlstate
+
+
+def test_operational_error_handler_maps_database_timeouts() -> None:
+    app = FastAPI()
+    register_error_handlers(app)
+
+    @app.get("/locked")
+    def locked() -> None:
+        raise OperationalError("SELECT ... FOR UPDATE", {}, FakeDriverError("55P03"))
+
+    @app.get("/down")
+    def down() -> None:
+        raise OperationalError("SELECT 1", {}, FakeDriverError("08006"))
+
+    client = TestClient(app, raise_server_exceptions=False)
+    locked_response = client.get("/locked")
+    down_response = client.get("/down")
+
+    assert locked_response.status_code == 503
+    assert locked_response.json()["code"] == "QUERY_TIMEOUT"
+    assert locked_response.json()["details"] == {"timeout": "lock_timeout"}
+    assert down_response.status_code == 500
+    assert down_response.json()["code"] == "INTERNAL_SERVER_ERROR"
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from compras_divididas.api.error_handlers import register_error_handlers
+from compras_divididas.api.load_shedding import (
+    GENERATION,
+    LISTS,
+    MOVEMENT_WRITES,
+    SUMMARIES,
+    WRITES,
+    ConcurrencyLimits,
+    LoadShedder,
+    LoadSheddingMiddleware,
+    route_class,
+)
+from compras_divididas.core.settings import Settings
+
+
+def limits(**per_class: int) -> ConcurrencyLimits:
+    return ConcurrencyLimits(
+        max_in_flight=5,
+        priority_reserve=2,
+        per_class={WRITES: 3, GENERATION: 1, SUMMARIES: 3, LISTS: 3} | per_class,
+        retry_after_seconds=2,
+    )
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "expected"),
+    [
+        ("POST", "/v1/movements", MOVEMENT_WRITES),
+        ("POST", "/v1/movements/batch", MOVEMENT_WRITES),
+        ("POST", "/v1/months/2026/3/recurrences/generate", GENERATION),
+        ("POST", "/v1/recurrences/failed-occurrences/retry", GENERATION),
+        ("GET", "/v1/months/2026/3/summary", SUMMARIES),
+        ("GET", "/v1/months/2026/3/report", SUMMARIES),
+        ("GET", "/v1/movements", LISTS),
+        ("GET", "/v1/recurrences/events", LISTS),
+        ("PATCH", "/v1/recurrences/abc", WRITES),
+        ("POST", "/v1/recurrences", WRITES),
+        ("GET", "/health/ready", None),
+        ("GET", "/docs", None),
+    ],
+)
+def test_route_class(method: str, path: str, expected: str | None) -> None:
+    assert route_class(method, path) == expected
+
+
+def test_movement_writes_keep_the_reserve_when_other_classes_are_busy() -> None:
+    shedder = LoadShedder(limits())
+
+    assert shedder.try_acquire(SUMMARIES)
+    assert shedder.try_acquire(GENERATION)
+    assert not shedder.try_acquire(GENERATION)  # class limit
+    assert shedder.try_acquire(LISTS)
+    assert not shedder.try_acquire(LISTS)  # only the reserve is left
+    assert shedder.try_acquire(MOVEMENT_WRITES)
+    assert shedder.try_acquire(MOVEMENT_WRITES)
+    assert not shedder.try_acquire(MOVEMENT_WRITES)  # max_in_flight
+
+    shedder.release(SUMMARIES)
+    assert not shedder.try_acquire(SUMMARIES)
+    shedder.release(MOVEMENT_WRITES)
+    shedder.release(MOVEMENT_WRITES)
+
+    assert shedder.try_acquire(SUMMARIES)
+    assert shedder.snapshot() == {
+        "in_flight": 3,
+        "max_in_flight": 5,
+        "in_flight_by_class": {
+            SUMMARIES: 1,
+            GENERATION: 1,
+            LISTS: 1,
+            MOVEMENT_WRITES: 0,
+        },
+        "shed_by_class": {
+            GENERATION: 1,
+            LISTS: 1,
+            MOVEMENT_WRITES: 1,
+            SUMMARIES: 1,
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"API_MAX_IN_FLIGHT": 3, "API_PRIORITY_RESERVE": 3},
+        {"DB_POOL_SIZE": 2, "DB_MAX_OVERFLOW": 0, "API_PRIORITY_RESERVE": 2},
+    ],
+)
+def test_settings_reject_a_reserve_covering_every_slot(
+    overrides: dict[str, int],
+) -> None:
+    with pytest.raises(ValidationError, match="API_PRIORITY_RESERVE"):
+        Settings.model_validate(overrides)
+
+
+def test_middleware_sheds_with_retry_after_and_releases_admitted_requests() -> None:
+    app = FastAPI()
+    register_error_handlers(app)
+    app.add_middleware(LoadSheddingMiddleware)
+    shedder = LoadShedder(limits(**{SUMMARIES: 0}))
+    app.state.load_shedder = shedder
+
+    @app.get("/v1/months/{year}/{month}/summary")
+    def summary(year: int, month: int) -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.post("/v1/movements")
+    def create_movement() -> dict[str, str]:
+        return {"status": "created"}
+
+    client = TestClient(app)
+    shed = client.get("/v1/months/2026/3/summary")
+    created = client.post("/v1/movements")
+
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "2"
+    assert shed.json()["code"] == "SERVICE_OVERLOADED"
+    assert shed.json()["details"] == {"route_class": SUMMARIES}
+    assert created.status_code == 200
+    assert shedder.snapshot()["in_flight"] == 0
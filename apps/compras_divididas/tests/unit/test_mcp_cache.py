@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from compras_divididas.mcp.cache import ReadThroughCache, build_cache_key, month_tag
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_build_cache_key_ignores_param_order_and_none_values() -> None:
+    assert build_cache_key("/v1/movements", {"year": 2026, "month": 2}) == (
+        build_cache_key("/v1/movements", {"month": 2, "year": 2026, "type": None})
+    )
+
+
+def test_cache_serves_fresh_values_and_reloads_after_ttl() -> None:
+    clock = FakeClock()
+    cache = ReadThroughCache(ttl_seconds=10, clock=clock)
+    loads: list[int] = []
+
+    async def loader() -> object:
+        loads.append(1)
+        return {"call": len(loads)}
+
+    async def load() -> object:
+        return await cache.get_or_load(
+            ("/v1/participants", ()),
+            tags=frozenset({"participants"}),
+            loader=loader,
+        )
+
+    assert asyncio.run(load()) == {"call": 1}
+    clock.now = 9.9
+    assert asyncio.run(load()) == {"call": 1}
+    clock.now = 10.0
+    assert asyncio.run(load()) == {"call": 2}
+
+
+def test_invalidate_drops_only_entries_with_matching_tags() -> None:
+    cache = ReadThroughCache(ttl_seconds=60)
+
+    async def fill() -> None:
+        for month in (2, 3):
+            await cache.get_or_load(
+                build_cache_key(f"/v1/months/2026/{month}/summary", None),
+                tags=frozenset({"months", month_tag(2026, month)}),
+                loader=lambda: asyncio.sleep(0, result={}),
+            )
+
+    asyncio.run(fill())
+
+    assert cache.invalidate(month_tag(2026, 2)) == 1
+    assert len(cache) == 1
+    assert cache.invalidate("months") == 1
+    assert len(cache) == 0
+
+
+def test_load_overlapping_an_invalidation_is_not_stored() -> None:
+    cache = ReadThroughCache(ttl_seconds=60)
+    key = build_cache_key("/v1/months/2026/2/summary", None)
+    tags = frozenset({"months", month_tag(2026, 2)})
+
+    async def scenario() -> object:
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_loader() -> object:
+            started.set()
+            await release.wait()
+            return {"version": "before write"}
+
+        load = asyncio.create_task(
+            cache.get_or_load(key, tags=tags, loader=slow_loader)
+        )
+        await started.wait()
+        cache.invalidate(month_tag(2026, 2))
+        release.set()
+        assert await load == {"version": "before write"}
+        return await cache.get_or_load(
+            key,
+            tags=tags,
+            loader=lambda: asyncio.sleep(0, result={"version": "after write"}),
+        )
+
+    assert asyncio.run(scenario()) == {"version": "after write"}
+
+
+def test_invalidate_months_from_keeps_earlier_months() -> None:
+    cache = ReadThroughCache(ttl_seconds=60)
+
+    async def fill() -> None:
+        for year, month in ((2025, 12), (2026, 1), (2026, 2), (2026, 11)):
+            await cache.get_or_load(
+                build_cache_key(f"/v1/months/{year}/{month}/summary", None),
+                tags=frozenset({"months", month_tag(year, month)}),
+                loader=lambda: asyncio.sleep(0, result={}),
+            )
+
+    asyncio.run(fill())
+
+    assert cache.invalidate_months_from(2026, 2) == 2
+    assert len(cache) == 2
+
+
+def test_cache_evicts_oldest_entry_when_full() -> None:
+    cache = ReadThroughCache(ttl_seconds=60, max_entries=2)
+
+    async def fill() -> None:
+        for index in range(3):
+            await cache.get_or_load(
+                (f"/path/{index}", ()),
+                tags=frozenset(),
+                loader=lambda: asyncio.sleep(0, result={}),
+            )
+
+    asyncio.run(fill())
+
+    assert len(cache) == 2
+    assert not cache.has_fresh(("/path/0", ()))
+
+
+def test_cache_rejects_negative_ttl() -> None:
+    with pytest.raises(ValueError, match="greater than or equal to zero"):
+        ReadThroughCache(ttl_seconds=-1)
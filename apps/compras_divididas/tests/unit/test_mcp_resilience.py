@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from compras_divididas.core.settings import Settings
+from compras_divididas.domain.retry_policy import RetryPolicy
+from compras_divididas.mcp.http_requester import HTTPAPIRequester
+from compras_divididas.mcp.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+
+FAST_RETRIES = RetryPolicy(
+    base_delay_seconds=0.001,
+    max_delay_seconds=0.001,
+    max_attempts=3,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _state(breaker: CircuitBreaker) -> CircuitState:
+    return breaker.state
+
+
+def _requester(
+    transport: httpx.MockTransport,
+    *,
+    retry_policy: RetryPolicy | None = None,
+    hedge_delay_seconds: float | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+) -> HTTPAPIRequester:
+    return HTTPAPIRequester(
+        base_url="http://example.test",
+        timeout_seconds=1,
+        transport=transport,
+        retry_policy=retry_policy,
+        hedge_delay_seconds=hedge_delay_seconds,
+        circuit_breaker=circuit_breaker,
+    )
+
+
+def test_get_is_retried_on_unavailable_responses() -> None:
+    statuses = [503, 502, 200]
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), json={"ok": True})
+
+    requester = _requester(httpx.MockTransport(handler), retry_policy=FAST_RETRIES)
+
+    assert asyncio.run(requester.request("GET", "/v1/participants")) == {"ok": True}
+    assert statuses == []
+
+
+def test_post_without_external_id_is_not_retried() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(503, json={"code": "UNAVAILABLE", "message": "down"})
+
+    requester = _requester(httpx.MockTransport(handler), retry_policy=FAST_RETRIES)
+
+    with pytest.raises(RuntimeError, match="UNAVAILABLE"):
+        asyncio.run(
+            requester.request("POST", "/v1/movements", json_body={"amount": "1.00"})
+        )
+    assert calls == ["POST"]
+
+
+def test_post_with_external_id_is_retried_on_transport_errors() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(201, json={"id": "123"})
+
+    requester = _requester(httpx.MockTransport(handler), retry_policy=FAST_RETRIES)
+
+    result = asyncio.run(
+        requester.request("POST", "/v1/movements", json_body={"external_id": "m-1"})
+    )
+
+    assert result == {"id": "123"}
+    assert calls == ["POST", "POST"]
+
+
+def test_post_with_external_id_is_not_resent_after_a_read_timeout() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        raise httpx.ReadTimeout("no response", request=request)
+
+    requester = _requester(httpx.MockTransport(handler), retry_policy=FAST_RETRIES)
+
+    with pytest.raises(RuntimeError, match="ReadTimeout"):
+        asyncio.run(
+            requester.request("POST", "/v1/movements", json_body={"external_id": "m-1"})
+        )
+    assert calls == ["POST"]
+
+
+def test_resent_movement_returns_the_one_created_by_the_first_attempt() -> None:
+    calls: list[str] = []
+    movement = {"id": "123", "external_id": "m-1"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if request.method == "GET":
+            assert request.headers["x-read-consistency"] == "primary"
+            assert dict(request.url.params) == {
+                "year": "2026",
+                "month": "3",
+                "participant_id": "ana",
+                "external_id": "m-1",
+            }
+            return httpx.Response(200, json={"items": [movement], "total": 1})
+        if len(calls) == 1:
+            # The proxy gave up, but the API committed the movement.
+            return httpx.Response(504, json={"code": "GATEWAY_TIMEOUT"})
+        return httpx.Response(
+            409,
+            json={
+                "code": "DUPLICATE_EXTERNAL_ID",
+                "message": "duplicate",
+                "details": {
+                    "competence_month": "2026-03-01",
+                    "payer_participant_id": "ana",
+                },
+            },
+        )
+
+    requester = _requester(httpx.MockTransport(handler), retry_policy=FAST_RETRIES)
+
+    result = asyncio.run(
+        requester.request("POST", "/v1/movements", json_body={"external_id": "m-1"})
+    )
+
+    assert result == movement
+    assert calls == ["POST", "POST", "GET"]
+
+
+def test_first_attempt_duplicate_is_still_reported() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            409,
+            json={
+                "code": "DUPLICATE_EXTERNAL_ID",
+                "message": "duplicate",
+                "details": {
+                    "competence_month": "2026-03-01",
+                    "payer_participant_id": "ana",
+                },
+            },
+        )
+
+    requester = _requester(httpx.MockTransport(handler), retry_policy=FAST_RETRIES)
+
+    with pytest.raises(RuntimeError, match="DUPLICATE_EXTERNAL_ID"):
+        asyncio.run(
+            requester.request("POST", "/v1/movements", json_body={"external_id": "m-1"})
+        )
+
+
+@pytest.mark.parametrize(
+    ("details", "lookup"),
+    [
+        ({"competence_month": "2026-03-01"}, httpx.Response(200, json={})),
+        (
+            {"competence_month": "march", "payer_participant_id": "ana"},
+            httpx.Response(200, json={}),
+        ),
+        (
+            {"competence_month": "2026-03-01", "payer_participant_id": "ana"},
+            httpx.Response(200, text="<html>"),
+        ),
+        (
+            {"competence_month": "2026-03-01", "payer_participant_id": "ana"},
+            httpx.Response(200, json=[{"id": "123"}]),
+        ),
+    ],
+)
+def test_unresolved_duplicate_after_resend_is_reported_as_api_error(
+    details: dict[str, str],
+    lookup: httpx.Response,
+) -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if request.method == "GET":
+            return lookup
+        if len(calls) == 1:
+            return httpx.Response(504, json={"code": "GATEWAY_TIMEOUT"})
+        return httpx.Response(
+            409,
+            json={
+                "code": "DUPLICATE_EXTERNAL_ID",
+                "message": "duplicate",
+                "details": details,
+            },
+        )
+
+    requester = _requester(httpx.MockTransport(handler), retry_policy=FAST_RETRIES)
+
+    with pytest.raises(RuntimeError, match="DUPLICATE_EXTERNAL_ID"):
+        asyncio.run(
+            requester.request("POST", "/v1/movements", json_body={"external_id": "m-1"})
+        )
+
+
+def test_hedged_get_returns_the_faster_response_and_awaits_the_loser() -> None:
+    calls: list[int] = []
+    events: list[str] = []
+
+    async def handler(_: httpx.Request) -> httpx.Response:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                events.append("primary cancelled")
+                raise
+            return httpx.Response(200, json={"from": "primary"})
+        return httpx.Response(200, json={"from": "hedge"})
+
+    requester = _requester(httpx.MockTransport(handler), hedge_delay_seconds=0.01)
+
+    async def scenario() -> object:
+        result = await requester.request("GET", "/v1/participants")
+        assert events == ["primary cancelled"]
+        return result
+
+    assert asyncio.run(scenario()) == {"from": "hedge"}
+
+
+def test_settings_reject_a_retry_base_delay_above_the_max_delay() -> None:
+    with pytest.raises(ValidationError, match="MCP_API_RETRY_MAX_DELAY_SECONDS"):
+        Settings(
+            MCP_API_RETRY_BASE_DELAY_SECONDS=5,
+            MCP_API_RETRY_MAX_DELAY_SECONDS=1,
+        )
+
+
+def test_circuit_opens_after_failures_and_fails_fast() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10, clock=clock)
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(
+            500, json={"code": "INTERNAL_SERVER_ERROR", "message": "x"}
+        )
+
+    requester = _requester(httpx.MockTransport(handler), circuit_breaker=breaker)
+
+    async def scenario() -> None:
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="INTERNAL_SERVER_ERROR"):
+                await requester.request("GET", "/v1/participants")
+        with pytest.raises(CircuitOpenError):
+            await requester.request("GET", "/v1/participants")
+
+    asyncio.run(scenario())
+
+    assert breaker.state is CircuitState.OPEN
+    assert len(calls) == 2
+
+
+def test_circuit_half_opens_after_reset_timeout() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=10, clock=clock)
+    breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    clock.now = 10
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert _state(breaker) is CircuitState.CLOSED
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from collections.abc import Mapping
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 import httpx
 import pytest
 from fastmcp import Client
 
-from compras_divididas.mcp.server import _build_api_error, create_mcp_server
+from compras_divididas.mcp.http_requester import HTTPAPIRequester, _build_api_error
+from compras_divididas.mcp.server import COMPACT_MOVEMENT_FIELDS, create_mcp_server
 
 
 @dataclass
@@ -56,11 +59,15 @@ def test_create_mcp_server_registers_expected_tools() -> None:
 
     assert tool_names == [
         "create_movement",
+        "create_movements_batch",
         "create_recurrence",
+        "create_recurrences_batch",
         "edit_recurrence",
         "end_recurrence",
+        "get_monthly_projections",
         "get_monthly_report",
         "get_monthly_summary",
+        "get_server_stats",
         "list_movements",
         "list_participants",
         "list_recurrences",
@@ -368,3 +375,393 @@ def test_get_monthly_report_tool_forwards_auto_generate() -> None:
         "params": {"auto_generate": True},
         "json_body": None,
     }
+
+
+def test_http_requester_reuses_one_pooled_client() -> None:
+    seen_paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_paths.append(request.url.path)
+        return httpx.Response(200, json={"ok": True})
+
+    async def scenario() -> tuple[bool, bool]:
+        requester = HTTPAPIRequester(
+            base_url="http://example.test",
+            timeout_seconds=1,
+            transport=httpx.MockTransport(handler),
+        )
+        await requester.request("GET", "/v1/participants")
+        first_client = requester._client
+        await requester.request("GET", "/v1/movements", params={"year": 2026})
+        reused = requester._client is first_client
+        await requester.aclose()
+        return reused, first_client is not None and first_client.is_closed
+
+    reused, closed = asyncio.run(scenario())
+
+    assert reused is True
+    assert closed is True
+    assert seen_paths == ["/v1/participants", "/v1/movements"]
+
+
+def test_mcp_server_closes_http_requester_on_shutdown(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    closed: list[bool] = []
+
+    async def record_close(self: HTTPAPIRequester) -> None:
+        closed.append(True)
+
+    monkeypatch.setattr(HTTPAPIRequester, "aclose", record_close)
+
+    async def scenario() -> None:
+        server = create_mcp_server(api_base_url="http://example.test")
+        async with Client(server) as client:
+            await client.list_tools()
+
+    asyncio.run(scenario())
+
+    assert closed == [True]
+
+
+def test_read_tools_are_cached_until_a_write_touches_the_month() -> None:
+    async def scenario() -> list[str]:
+        fake_requester = FakeRequester(
+            responses={
+                ("GET", "/v1/months/2026/2/summary"): {"ok": True},
+                ("GET", "/v1/months/2026/3/summary"): {"ok": True},
+                ("POST", "/v1/movements"): {"id": "123"},
+            }
+        )
+        server = create_mcp_server(
+            api_base_url="http://example.test",
+            timeout_seconds=1,
+            requester=fake_requester,
+            cache_ttl_seconds=60,
+        )
+        async with Client(server) as client:
+            for month in (2, 2, 3):
+                await client.call_tool(
+                    "get_monthly_summary",
+                    {"year": 2026, "month": month},
+                )
+            await client.call_tool(
+                "create_movement",
+                {
+                    "type": "purchase",
+                    "amount": "10.00",
+                    "description": "Padaria",
+                    "requested_by_participant_id": "ana",
+                    "occurred_at": "2026-02-10T12:00:00-03:00",
+                },
+            )
+            for month in (2, 3):
+                await client.call_tool(
+                    "get_monthly_summary",
+                    {"year": 2026, "month": month},
+                )
+        return [f"{call['method']} {call['path']}" for call in fake_requester.calls]
+
+    recorded_calls = asyncio.run(scenario())
+
+    assert recorded_calls == [
+        "GET /v1/months/2026/2/summary",
+        "GET /v1/months/2026/3/summary",
+        "POST /v1/movements",
+        "GET /v1/months/2026/2/summary",
+    ]
+
+
+def test_recurrence_write_invalidates_only_months_it_can_generate_into() -> None:
+    async def scenario() -> list[str]:
+        fake_requester = FakeRequester(
+            responses={
+                ("GET", "/v1/months/2026/2/summary"): {"ok": True},
+                ("GET", "/v1/months/2026/3/summary"): {"ok": True},
+                ("POST", "/v1/recurrences"): {
+                    "id": "rec-123",
+                    "next_competence_month": "2026-03",
+                },
+            }
+        )
+        server = create_mcp_server(
+            api_base_url="http://example.test",
+            timeout_seconds=1,
+            requester=fake_requester,
+            cache_ttl_seconds=60,
+        )
+        async with Client(server) as client:
+            for month in (2, 3):
+                await client.call_tool(
+                    "get_monthly_summary",
+                    {"year": 2026, "month": month},
+                )
+            await client.call_tool(
+                "create_recurrence",
+                {
+                    "description": "Internet",
+                    "amount": "120.00",
+                    "payer_participant_id": "ana",
+                    "requested_by_participant_id": "ana",
+                    "split_config": {"mode": "equal"},
+                    "reference_day": 10,
+                    "start_competence_month": "2026-03",
+                },
+            )
+            for month in (2, 3):
+                await client.call_tool(
+                    "get_monthly_summary",
+                    {"year": 2026, "month": month},
+                )
+        return [f"{call['method']} {call['path']}" for call in fake_requester.calls]
+
+    recorded_calls = asyncio.run(scenario())
+
+    assert recorded_calls == [
+        "GET /v1/months/2026/2/summary",
+        "GET /v1/months/2026/3/summary",
+        "POST /v1/recurrences",
+        "GET /v1/months/2026/3/summary",
+    ]
+
+
+def test_create_movements_batch_tool_sends_items_in_one_request() -> None:
+    async def scenario() -> list[dict[str, object]]:
+        fake_requester = FakeRequester(
+            responses={
+                ("POST", "/v1/movements/batch"): {
+                    "items": [],
+                    "created_count": 2,
+                    "failed_count": 0,
+                }
+            }
+        )
+        server = create_mcp_server(
+            api_base_url="http://example.test",
+            timeout_seconds=1,
+            requester=fake_requester,
+        )
+        async with Client(server) as client:
+            await client.call_tool(
+                "create_movements_batch",
+                {
+                    "items": [
+                        {
+                            "type": "purchase",
+                            "amount": "10.00",
+                            "description": "Padaria",
+                            "requested_by_participant_id": "ana",
+                        },
+                        {
+                            "type": "purchase",
+                            "amount": "25.50",
+                            "description": "Feira",
+                            "requested_by_participant_id": "bia",
+                            "occurred_at": "2026-02-10T12:00:00-03:00",
+                        },
+                    ]
+                },
+            )
+        return fake_requester.calls
+
+    recorded_calls = asyncio.run(scenario())
+
+    assert len(recorded_calls) == 1
+    assert recorded_calls[0]["path"] == "/v1/movements/batch"
+    json_body = recorded_calls[0]["json_body"]
+    assert isinstance(json_body, dict)
+    assert [item["description"] for item in json_body["items"]] == [
+        "Padaria",
+        "Feira",
+    ]
+
+
+def test_get_monthly_projections_fetches_months_concurrently() -> None:
+    @dataclass
+    class SlowRequester:
+        in_flight: int = 0
+        max_in_flight: int = 0
+
+        async def request(
+            self,
+            method: str,
+            path: str,
+            *,
+            params: Mapping[str, str | int | float | bool | None] | None = None,
+            json_body: Mapping[str, object] | None = None,
+        ) -> object:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            if path == "/v1/months/2026/1/summary":
+                raise RuntimeError("API error INVALID_REQUEST: boom")
+            return {"path": path}
+
+    async def scenario() -> tuple[object, int]:
+        requester = SlowRequester()
+        server = create_mcp_server(
+            api_base_url="http://example.test",
+            timeout_seconds=1,
+            requester=requester,
+        )
+        async with Client(server) as client:
+            result = await client.call_tool(
+                "get_monthly_projections",
+                {"months": ["2026-03", "2026-02", "2026-01", "2026-03"]},
+            )
+        return result.data, requester.max_in_flight
+
+    payload, max_in_flight = asyncio.run(scenario())
+
+    assert max_in_flight > 1
+    assert payload == {
+        "projection": "summary",
+        "items": [
+            {
+                "competence_month": "2026-03",
+                "data": {"path": "/v1/months/2026/3/summary"},
+            },
+            {
+                "competence_month": "2026-02",
+                "data": {"path": "/v1/months/2026/2/summary"},
+            },
+            {
+                "competence_month": "2026-01",
+                "error": "API error INVALID_REQUEST: boom",
+            },
+        ],
+    }
+
+
+def test_list_movements_all_pages_merges_and_caps_items() -> None:
+    @dataclass
+    class PagedRequester:
+        total: int
+        calls: list[dict[str, int]] = field(default_factory=list)
+
+        async def request(
+            self,
+            method: str,
+            path: str,
+            *,
+            params: Mapping[str, str | int | float | bool | None] | None = None,
+            json_body: Mapping[str, object] | None = None,
+        ) -> object:
+            assert params is not None
+            limit = int(params["limit"] or 0)
+            offset = int(params["offset"] or 0)
+            self.calls.append({"limit": limit, "offset": offset})
+            # Overlap one item between pages, as a concurrent insert would.
+            start = max(offset - 1, 0)
+            end = min(offset + limit, self.total)
+            return {
+                "items": [{"id": f"mov-{index}"} for index in range(start, end)],
+                "total": self.total,
+                "limit": limit,
+                "offset": offset,
+            }
+
+    async def scenario() -> tuple[object, list[dict[str, int]]]:
+        requester = PagedRequester(total=450)
+        server = create_mcp_server(
+            api_base_url="http://example.test",
+            timeout_seconds=1,
+            requester=requester,
+        )
+        async with Client(server) as client:
+            result = await client.call_tool(
+                "list_movements",
+                {"year": 2026, "month": 2, "all_pages": True, "max_items": 420},
+            )
+        return result.data, requester.calls
+
+    payload, calls = asyncio.run(scenario())
+
+    assert isinstance(payload, dict)
+    assert [item["id"] for item in payload["items"]] == [
+        f"mov-{index}" for index in range(420)
+    ]
+    assert payload["total"] == 450
+    assert payload["returned_count"] == 420
+    assert payload["truncated"] is True
+    assert sorted(call["offset"] for call in calls) == [0, 200, 400]
+    assert {call["limit"] for call in calls} == {200}
+
+
+def test_compact_list_movements_requests_template_fields() -> None:
+    async def scenario() -> dict[str, object]:
+        fake_requester = FakeRequester(
+            responses={("GET", "/v1/movements"): {"items": [], "total": 0}}
+        )
+        server = create_mcp_server(
+            api_base_url="http://example.test",
+            timeout_seconds=1,
+            requester=fake_requester,
+        )
+        async with Client(server) as client:
+            await client.call_tool(
+                "list_movements",
+                {"year": 2026, "month": 2, "compact": True},
+            )
+        return fake_requester.calls[0]
+
+    recorded_call = asyncio.run(scenario())
+
+    params = recorded_call["params"]
+    assert isinstance(params, dict)
+    assert params["fields"] == COMPACT_MOVEMENT_FIELDS
+
+
+def test_get_server_stats_reports_tool_timing_and_cache_hits(tmp_path: Path) -> None:
+    trace_file = tmp_path / "mcp-trace.jsonl"
+
+    async def scenario() -> Any:
+        fake_requester = FakeRequester(
+            responses={
+                ("GET", "/v1/participants"): {"participants": []},
+                ("POST", "/v1/movements"): RuntimeError("API error"),
+            }
+        )
+        server = create_mcp_server(
+            api_base_url="http://example.test",
+            timeout_seconds=1,
+            requester=fake_requester,
+            trace_file=trace_file,
+        )
+        async with Client(server) as client:
+            await client.call_tool("list_participants", {})
+            await client.call_tool("list_participants", {})
+            await client.call_tool(
+                "create_movement",
+                {
+                    "type": "purchase",
+                    "amount": "10.00",
+                    "description": "Mercado",
+                    "payer_participant_id": "ana",
+                    "requested_by_participant_id": "ana",
+                },
+                raise_on_error=False,
+            )
+            result = await client.call_tool("get_server_stats", {})
+        return result.data
+
+    stats = asyncio.run(scenario())
+
+    participants = stats["tools"]["list_participants"]
+    assert participants["calls"] == 2
+    assert participants["errors"] == 0
+    assert participants["api_calls"] == 1
+    assert participants["cache_hits"] == 1
+    assert participants["cache_misses"] == 1
+    assert participants["payload_bytes_max"] > 0
+    assert stats["tools"]["create_movement"]["errors"] == 1
+    assert stats["cache_entries"] == 1
+
+    records = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    assert [(record["tool"], record["status"]) for record in records] == [
+        ("list_participants", "ok"),
+        ("list_participants", "ok"),
+        ("create_movement", "error"),
+        ("get_server_stats", "ok"),
+    ]
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+from compras_divididas.mcp.stats import ServerStats
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_server_stats_splits_api_time_from_mcp_overhead() -> None:
+    clock = FakeClock()
+    stats = ServerStats(clock=clock)
+
+    for duration, api_seconds in ((0.100, 0.080), (0.300, 0.250)):
+        trace, started_at = stats.start_call("get_monthly_summary")
+        trace.api_calls += 1
+        trace.api_seconds += api_seconds
+        clock.now += duration
+        asyncio.run(
+            stats.finish_call(trace, started_at=started_at, ok=True, payload_bytes=120)
+        )
+
+    tool = stats.snapshot()["tools"]
+    assert isinstance(tool, dict)
+    summary = tool["get_monthly_summary"]
+    assert summary["calls"] == 2
+    assert summary["api_calls"] == 2
+    assert summary["api_ms_total"] == 330.0
+    assert summary["mcp_overhead_ms_total"] == 70.0
+    assert summary["max_ms"] == 300.0
+    assert summary["p95_ms"] == 300.0
+    assert summary["payload_bytes_total"] == 240
+
+
+def test_server_stats_appends_one_trace_record_per_call(tmp_path: Path) -> None:
+    trace_path = tmp_path / "traces" / "mcp.jsonl"
+    clock = FakeClock()
+    stats = ServerStats(trace_path=trace_path, clock=clock)
+
+    trace, started_at = stats.start_call("list_movements")
+    trace.retries += 2
+    clock.now += 0.5
+    asyncio.run(
+        stats.finish_call(trace, started_at=started_at, ok=False, payload_bytes=0)
+    )
+
+    [record] = [json.loads(line) for line in trace_path.read_text().splitlines()]
+    assert record["tool"] == "list_movements"
+    assert record["status"] == "error"
+    assert record["duration_ms"] == 500.0
+    assert record["retries"] == 2
+
+
+def test_server_stats_keeps_counting_when_the_trace_cannot_be_written(
+    tmp_path: Path,
+) -> None:
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    stats = ServerStats(trace_path=blocker / "mcp.jsonl", clock=FakeClock())
+
+    trace, started_at = stats.start_call("list_movements")
+    asyncio.run(
+        stats.finish_call(trace, started_at=started_at, ok=True, payload_bytes=10)
+    )
+
+    tools = stats.snapshot()["tools"]
+    assert isinstance(tools, dict)
+    assert tools["list_movements"]["calls"] == 1
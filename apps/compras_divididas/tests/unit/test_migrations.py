@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+from compras_divididas.db.migrations import (
+    HEAD_REVISIONS,
+    run_migrations,
+    script_heads,
+)
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+def _stamp(database_url: str, revision: str | None) -> None:
+    engine = create_engine(database_url)
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)")
+        )
+        if revision is not None:
+            connection.execute(
+                text("INSERT INTO alembic_version VALUES (:revision)"),
+                {"revision": revision},
+            )
+    engine.dispose()
+
+
+def test_head_revisions_match_the_migration_scripts() -> None:
+    assert script_heads(ALEMBIC_INI) == HEAD_REVISIONS
+
+
+def test_run_migrations_skips_upgrade_when_at_head(tmp_path: Path) -> None:
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'head.db'}"
+    [head] = HEAD_REVISIONS
+    _stamp(database_url, head)
+    upgrades: list[Path] = []
+
+    result = run_migrations(
+        database_url=database_url,
+        alembic_ini=ALEMBIC_INI,
+        upgrade=upgrades.append,
+    )
+
+    assert result.status == "up_to_date"
+    assert result.from_revisions == (head,)
+    assert upgrades == []
+
+
+def test_run_migrations_upgrades_behind_or_empty_database(tmp_path: Path) -> None:
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'empty.db'}"
+    upgrades: list[Path] = []
+
+    result = run_migrations(
+        database_url=database_url,
+        alembic_ini=ALEMBIC_INI,
+        upgrade=upgrades.append,
+    )
+
+    assert result.status == "upgraded"
+    assert result.from_revisions == ()
+    assert result.to_revisions == HEAD_REVISIONS
+    assert upgrades == [ALEMBIC_INI]
+
+
+def test_run_migrations_upgrades_database_stamped_behind(tmp_path: Path) -> None:
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'behind.db'}"
+    _stamp(database_url, "007_add_recurrence_eligibility_indexes")
+    upgrades: list[Path] = []
+
+    result = run_migrations(
+        database_url=database_url,
+        alembic_ini=ALEMBIC_INI,
+        upgrade=upgrades.append,
+    )
+
+    assert result.status == "upgraded"
+    assert result.from_revisions == ("007_add_recurrence_eligibility_indexes",)
+    assert upgrades == [ALEMBIC_INI]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
@@ -25,13 +26,13 @@ class FakeSession:
         self.committed = False
         self.rolled_back = False
 
-    def commit(self) -> None:
+    async def commit(self) -> None:
         self.committed = True
 
-    def rollback(self) -> None:
+    async def rollback(self) -> None:
         self.rolled_back = True
 
-    def refresh(self, instance: object) -> None:
+    async def refresh(self, instance: object) -> None:
         _ = instance
 
 
@@ -39,7 +40,7 @@ class FakeParticipantRepository:
     def __init__(self, participant_ids: tuple[str, str]) -> None:
         self._participant_ids = participant_ids
 
-    def list_active_exactly_two(self) -> list[Participant]:
+    async def list_active_exactly_two(self) -> list[Participant]:
         participant_a = Participant(
             id="ana",
             display_name="Ana",
@@ -58,7 +59,7 @@ class FakeMovementRepository:
     duplicate_external_ids: set[tuple[date, str, str]]
     movements: list[FinancialMovement] = field(default_factory=list)
 
-    def has_duplicate_external_id(
+    async def has_duplicate_external_id(
         self,
         *,
         competence_month: date,
@@ -71,7 +72,9 @@ class FakeMovementRepository:
             external_id,
         ) in self.duplicate_external_ids
 
-    def get_purchase_for_update(self, purchase_id: UUID) -> FinancialMovement | None:
+    async def get_purchase_for_update(
+        self, purchase_id: UUID
+    ) -> FinancialMovement | None:
         for movement in self.movements:
             if (
                 movement.id == purchase_id
@@ -80,7 +83,7 @@ class FakeMovementRepository:
                 return movement
         return None
 
-    def get_purchase_by_external_id_for_update(
+    async def get_purchase_by_external_id_for_update(
         self,
         *,
         competence_month: date,
@@ -97,7 +100,7 @@ class FakeMovementRepository:
                 return movement
         return None
 
-    def get_total_refunded_amount(self, original_purchase_id: UUID) -> Decimal:
+    async def get_total_refunded_amount(self, original_purchase_id: UUID) -> Decimal:
         refunded_total = Decimal("0.00")
         for movement in self.movements:
             if (
@@ -107,7 +110,7 @@ class FakeMovementRepository:
                 refunded_total += movement.amount
         return refunded_total
 
-    def add(self, movement: FinancialMovement) -> FinancialMovement:
+    async def add(self, movement: FinancialMovement) -> FinancialMovement:
         self.movements.append(movement)
         return movement
 
@@ -122,12 +125,14 @@ def test_create_movement_rounds_amount_with_half_up() -> None:
         session=session,
     )
 
-    movement = service.create_movement(
-        CreateMovementInput(
-            movement_type=MovementType.PURCHASE,
-            amount=Decimal("10.005"),
-            description="Compra",
-            requested_by_participant_id=participant_ids[0],
+    movement = asyncio.run(
+        service.create_movement(
+            CreateMovementInput(
+                movement_type=MovementType.PURCHASE,
+                amount=Decimal("10.005"),
+                description="Compra",
+                requested_by_participant_id=participant_ids[0],
+            )
         )
     )
 
@@ -144,14 +149,16 @@ def test_create_movement_applies_default_payer_and_occurred_at() -> None:
         session=FakeSession(),
     )
 
-    movement = service.create_movement(
-        CreateMovementInput(
-            movement_type=MovementType.PURCHASE,
-            amount=Decimal("25.00"),
-            description="Compra",
-            requested_by_participant_id=participant_ids[0],
-            payer_participant_id=None,
-            occurred_at=None,
+    movement = asyncio.run(
+        service.create_movement(
+            CreateMovementInput(
+                movement_type=MovementType.PURCHASE,
+                amount=Decimal("25.00"),
+                description="Compra",
+                requested_by_participant_id=participant_ids[0],
+                payer_participant_id=None,
+                occurred_at=None,
+            )
         )
     )
 
@@ -172,13 +179,15 @@ def test_create_movement_rejects_duplicate_external_id() -> None:
     repository.duplicate_external_ids.add((expected_month, participant_ids[0], "dup-1"))
 
     with pytest.raises(DuplicateExternalIDError):
-        service.create_movement(
-            CreateMovementInput(
-                movement_type=MovementType.PURCHASE,
-                amount=Decimal("10.00"),
-                description="Compra",
-                requested_by_participant_id=participant_ids[0],
-                external_id="dup-1",
-                occurred_at=datetime(2026, 2, 2, 10, 0, tzinfo=ZoneInfo("UTC")),
+        asyncio.run(
+            service.create_movement(
+                CreateMovementInput(
+                    movement_type=MovementType.PURCHASE,
+                    amount=Decimal("10.00"),
+                    description="Compra",
+                    requested_by_participant_id=participant_ids[0],
+                    external_id="dup-1",
+                    occurred_at=datetime(2026, 2, 2, 10, 0, tzinfo=ZoneInfo("UTC")),
+                )
             )
         )
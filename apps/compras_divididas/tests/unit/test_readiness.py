@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+
+from compras_divididas.api.readiness import ReadinessMonitor
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FlakyPing:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failing = False
+
+    async def __call__(self) -> None:
+        self.calls += 1
+        if self.failing:
+            raise ConnectionResetError("connection reset")
+
+
+def test_readiness_tolerates_failures_until_last_success_is_stale() -> None:
+    clock = FakeClock()
+    ping = FlakyPing()
+    monitor = ReadinessMonitor(
+        ping,
+        interval_seconds=5,
+        timeout_seconds=1,
+        max_age_seconds=15,
+        clock=clock,
+    )
+    assert monitor.is_ready() is False
+
+    asyncio.run(monitor.check_once())
+    assert monitor.is_ready() is True
+
+    ping.failing = True
+    clock.now += 10
+    asyncio.run(monitor.check_once())
+    assert monitor.is_ready() is True
+    assert monitor.snapshot()["consecutive_failures"] == 1
+    assert monitor.snapshot()["last_error"] == "ConnectionResetError"
+
+    clock.now += 10
+    assert monitor.is_ready() is False
+    assert ping.calls == 2
+
+
+def test_readiness_pinger_runs_in_background() -> None:
+    ping = FlakyPing()
+    monitor = ReadinessMonitor(
+        ping,
+        interval_seconds=0.01,
+        timeout_seconds=1,
+        max_age_seconds=15,
+    )
+
+    async def scenario() -> None:
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+    asyncio.run(scenario())
+
+    assert ping.calls >= 2
+    assert monitor.is_ready() is True
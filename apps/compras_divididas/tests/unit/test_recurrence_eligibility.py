@@ -0,0 +1,94 @@
+"""Unit tests for recurrence eligibility queries and indexes."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+from typing import Any, cast
+
+from sqlalchemy import Table, create_mock_engine
+from sqlalchemy.engine import Dialect
+from sqlalchemy.engine.mock import MockConnection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement
+
+from compras_divididas.db.models.recurrence_rule import RecurrenceRule
+from compras_divididas.repositories.recurrence_repository import (
+    EligibleRecurrenceRuleFilters,
+    RecurrenceRepository,
+)
+
+
+class RecordingSession:
+    def __init__(self, dialect: Dialect) -> None:
+        self.bind = SimpleNamespace(dialect=dialect)
+        self.sync_session = Session()
+        self.statements: list[ClauseElement] = []
+
+    def get_bind(self) -> SimpleNamespace:
+        return self.bind
+
+    async def scalars(self, statement: ClauseElement) -> list[Any]:
+        self.statements.append(statement)
+        return []
+
+
+def _mock_engine(dialect_name: str, statements: list[str]) -> MockConnection:
+    def record(sql: ClauseElement, *_: object, **__: object) -> None:
+        statements.append(str(sql.compile(dialect=engine.dialect)))
+
+    engine = create_mock_engine(f"{dialect_name}://", record)
+    return engine
+
+
+def _eligible_rules_sql(dialect_name: str) -> str:
+    dialect = _mock_engine(dialect_name, []).dialect
+    session = RecordingSession(dialect)
+    repository = RecurrenceRepository(cast(AsyncSession, session))
+
+    asyncio.run(
+        repository.list_eligible_rules_for_generation(
+            EligibleRecurrenceRuleFilters(competence_month=date(2026, 4, 1))
+        )
+    )
+
+    [statement] = session.statements
+    return str(statement.compile(dialect=dialect))
+
+
+def _recurrence_rule_ddl(dialect_name: str) -> str:
+    statements: list[str] = []
+    table = RecurrenceRule.__table__
+    assert isinstance(table, Table)
+    table.create(_mock_engine(dialect_name, statements))
+    return "\n".join(statements)
+
+
+def test_postgres_eligibility_uses_daterange_containment() -> None:
+    compiled = _eligible_rules_sql("postgresql")
+
+    assert (
+        "daterange(recurrence_rules.start_competence_month, "
+        "recurrence_rules.end_competence_month, '[]') @> CAST("
+    ) in compiled
+    assert "FOR UPDATE SKIP LOCKED" in compiled
+
+
+def test_sqlite_eligibility_falls_back_to_bound_comparisons() -> None:
+    compiled = _eligible_rules_sql("sqlite")
+
+    assert "daterange" not in compiled
+    assert "recurrence_rules.start_competence_month <=" in compiled
+    assert "recurrence_rules.end_competence_month IS NULL" in compiled
+
+
+def test_eligibility_indexes_are_declared_for_postgres() -> None:
+    postgres_ddl = _recurrence_rule_ddl("postgresql")
+    sqlite_ddl = _recurrence_rule_ddl("sqlite")
+
+    assert "ix_recurrence_rules_active_period" in postgres_ddl
+    assert "USING gist (daterange(" in postgres_ddl
+    assert "WHERE status = 'active'" in postgres_ddl
+    assert "ix_recurrence_rules_active_period" not in sqlite_ddl
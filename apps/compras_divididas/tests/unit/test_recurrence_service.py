@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
@@ -37,18 +38,18 @@ class FakeSession:
         self.committed = False
         self.rolled_back = False
 
-    def commit(self) -> None:
+    async def commit(self) -> None:
         self.committed = True
 
-    def rollback(self) -> None:
+    async def rollback(self) -> None:
         self.rolled_back = True
 
-    def refresh(self, instance: object) -> None:
+    async def refresh(self, instance: object) -> None:
         _ = instance
 
 
 class FakeParticipantRepository:
-    def list_active_exactly_two(self) -> list[Participant]:
+    async def list_active_exactly_two(self) -> list[Participant]:
         return [
             Participant(id="ana", display_name="Ana", is_active=True),
             Participant(id="bia", display_name="Bia", is_active=True),
@@ -84,7 +85,7 @@ class FakeRecurrenceRepository:
             version=1,
         )
 
-    def add_rule(
+    async def add_rule(
         self,
         *,
         description: str,
@@ -133,20 +134,20 @@ class FakeRecurrenceRepository:
         self.event_types.append(event_type)
         return object()
 
-    def list_rules(
+    async def list_rules(
         self,
         filters: RecurrenceListFilters,
     ) -> tuple[list[RecurrenceRule], int]:
         _ = filters
         return [], 0
 
-    def get_rule_for_update(self, recurrence_id: UUID) -> RecurrenceRule | None:
+    async def get_rule_for_update(self, recurrence_id: UUID) -> RecurrenceRule | None:
         _ = recurrence_id
         if self.created_rule is None:
             self.created_rule = self._rule_fixture()
         return self.created_rule
 
-    def update_rule(
+    async def update_rule(
         self,
         *,
         rule: RecurrenceRule,
@@ -179,15 +180,15 @@ class FakeRecurrenceRepository:
         rule.requested_by_participant_id = requested_by_participant_id
         return rule
 
-    def pause_rule(self, *, rule: RecurrenceRule) -> RecurrenceRule:
+    async def pause_rule(self, *, rule: RecurrenceRule) -> RecurrenceRule:
         rule.status = RecurrenceStatus.PAUSED
         return rule
 
-    def reactivate_rule(self, *, rule: RecurrenceRule) -> RecurrenceRule:
+    async def reactivate_rule(self, *, rule: RecurrenceRule) -> RecurrenceRule:
         rule.status = RecurrenceStatus.ACTIVE
         return rule
 
-    def end_rule(
+    async def end_rule(
         self,
         *,
         rule: RecurrenceRule,
@@ -208,15 +209,17 @@ def test_create_recurrence_sets_next_competence_to_start_month() -> None:
         session=session,
     )
 
-    recurrence = service.create_recurrence(
-        CreateRecurrenceInput(
-            description="Internet",
-            amount="120.00",
-            payer_participant_id="ana",
-            requested_by_participant_id="ana",
-            split_config={"mode": "equal"},
-            reference_day=31,
-            start_competence_month=date(2026, 2, 1),
+    recurrence = asyncio.run(
+        service.create_recurrence(
+            CreateRecurrenceInput(
+                description="Internet",
+                amount="120.00",
+                payer_participant_id="ana",
+                requested_by_participant_id="ana",
+                split_config={"mode": "equal"},
+                reference_day=31,
+                start_competence_month=date(2026, 2, 1),
+            )
         )
     )
 
@@ -233,16 +236,18 @@ def test_create_recurrence_rejects_end_month_before_start_month() -> None:
     )
 
     with pytest.raises(DomainInvariantError):
-        service.create_recurrence(
-            CreateRecurrenceInput(
-                description="Internet",
-                amount="120.00",
-                payer_participant_id="ana",
-                requested_by_participant_id="ana",
-                split_config={"mode": "equal"},
-                reference_day=31,
-                start_competence_month=date(2026, 2, 1),
-                end_competence_month=date(2026, 1, 1),
+        asyncio.run(
+            service.create_recurrence(
+                CreateRecurrenceInput(
+                    description="Internet",
+                    amount="120.00",
+                    payer_participant_id="ana",
+                    requested_by_participant_id="ana",
+                    split_config={"mode": "equal"},
+                    reference_day=31,
+                    start_competence_month=date(2026, 2, 1),
+                    end_competence_month=date(2026, 1, 1),
+                )
             )
         )
 
@@ -255,15 +260,17 @@ def test_create_recurrence_rejects_unsupported_split_mode() -> None:
     )
 
     with pytest.raises(DomainInvariantError):
-        service.create_recurrence(
-            CreateRecurrenceInput(
-                description="Internet",
-                amount="120.00",
-                payer_participant_id="ana",
-                requested_by_participant_id="ana",
-                split_config={"mode": "weighted"},
-                reference_day=31,
-                start_competence_month=date(2026, 2, 1),
+        asyncio.run(
+            service.create_recurrence(
+                CreateRecurrenceInput(
+                    description="Internet",
+                    amount="120.00",
+                    payer_participant_id="ana",
+                    requested_by_participant_id="ana",
+                    split_config={"mode": "weighted"},
+                    reference_day=31,
+                    start_competence_month=date(2026, 2, 1),
+                )
             )
         )
 
@@ -276,23 +283,27 @@ def test_update_recurrence_applies_last_write_wins() -> None:
         session=FakeSession(),
     )
 
-    recurrence = repository.get_rule_for_update(uuid4())
+    recurrence = asyncio.run(repository.get_rule_for_update(uuid4()))
     assert recurrence is not None
 
-    first_update = service.update_recurrence(
-        UpdateRecurrenceInput(
-            recurrence_id=recurrence.id,
-            requested_by_participant_id="ana",
-            description="Internet fibra",
-            amount="139.90",
+    first_update = asyncio.run(
+        service.update_recurrence(
+            UpdateRecurrenceInput(
+                recurrence_id=recurrence.id,
+                requested_by_participant_id="ana",
+                description="Internet fibra",
+                amount="139.90",
+            )
         )
     )
-    second_update = service.update_recurrence(
-        UpdateRecurrenceInput(
-            recurrence_id=recurrence.id,
-            requested_by_participant_id="ana",
-            description="Internet ultra",
-            amount="149.90",
+    second_update = asyncio.run(
+        service.update_recurrence(
+            UpdateRecurrenceInput(
+                recurrence_id=recurrence.id,
+                requested_by_participant_id="ana",
+                description="Internet ultra",
+                amount="149.90",
+            )
         )
     )
 
@@ -303,7 +314,7 @@ def test_update_recurrence_applies_last_write_wins() -> None:
 
 def test_update_recurrence_locks_start_month_after_first_generation() -> None:
     repository = FakeRecurrenceRepository()
-    recurrence = repository.get_rule_for_update(uuid4())
+    recurrence = asyncio.run(repository.get_rule_for_update(uuid4()))
     assert recurrence is not None
     recurrence.first_generated_competence_month = date(2026, 2, 1)
 
@@ -314,18 +325,20 @@ def test_update_recurrence_locks_start_month_after_first_generation() -> None:
     )
 
     with pytest.raises(StartCompetenceLockedError):
-        service.update_recurrence(
-            UpdateRecurrenceInput(
-                recurrence_id=recurrence.id,
-                requested_by_participant_id="ana",
-                start_competence_month=date(2026, 1, 1),
+        asyncio.run(
+            service.update_recurrence(
+                UpdateRecurrenceInput(
+                    recurrence_id=recurrence.id,
+                    requested_by_participant_id="ana",
+                    start_competence_month=date(2026, 1, 1),
+                )
             )
         )
 
 
 def test_pause_and_reactivate_follow_state_transitions() -> None:
     repository = FakeRecurrenceRepository()
-    recurrence = repository.get_rule_for_update(uuid4())
+    recurrence = asyncio.run(repository.get_rule_for_update(uuid4()))
     assert recurrence is not None
 
     service = RecurrenceService(
@@ -334,19 +347,23 @@ def test_pause_and_reactivate_follow_state_transitions() -> None:
         session=FakeSession(),
     )
 
-    paused = service.pause_recurrence(
-        PauseRecurrenceInput(
-            recurrence_id=recurrence.id,
-            requested_by_participant_id="ana",
-            reason="Temporary stop",
+    paused = asyncio.run(
+        service.pause_recurrence(
+            PauseRecurrenceInput(
+                recurrence_id=recurrence.id,
+                requested_by_participant_id="ana",
+                reason="Temporary stop",
+            )
         )
     )
     assert paused.status == RecurrenceStatus.PAUSED
 
-    reactivated = service.reactivate_recurrence(
-        ReactivateRecurrenceInput(
-            recurrence_id=recurrence.id,
-            requested_by_participant_id="ana",
+    reactivated = asyncio.run(
+        service.reactivate_recurrence(
+            ReactivateRecurrenceInput(
+                recurrence_id=recurrence.id,
+                requested_by_participant_id="ana",
+            )
         )
     )
     assert reactivated.status == RecurrenceStatus.ACTIVE
@@ -354,7 +371,7 @@ def test_pause_and_reactivate_follow_state_transitions() -> None:
 
 def test_end_recurrence_rejects_terminal_transition() -> None:
     repository = FakeRecurrenceRepository()
-    recurrence = repository.get_rule_for_update(uuid4())
+    recurrence = asyncio.run(repository.get_rule_for_update(uuid4()))
     assert recurrence is not None
 
     service = RecurrenceService(
@@ -363,19 +380,23 @@ def test_end_recurrence_rejects_terminal_transition() -> None:
         session=FakeSession(),
     )
 
-    ended = service.end_recurrence(
-        EndRecurrenceInput(
-            recurrence_id=recurrence.id,
-            requested_by_participant_id="ana",
-            end_competence_month=date(2026, 12, 1),
+    ended = asyncio.run(
+        service.end_recurrence(
+            EndRecurrenceInput(
+                recurrence_id=recurrence.id,
+                requested_by_participant_id="ana",
+                end_competence_month=date(2026, 12, 1),
+            )
         )
     )
     assert ended.status == RecurrenceStatus.ENDED
 
     with pytest.raises(InvalidRecurrenceStateTransitionError):
-        service.end_recurrence(
-            EndRecurrenceInput(
-                recurrence_id=recurrence.id,
-                requested_by_participant_id="ana",
+        asyncio.run(
+            service.end_recurrence(
+                EndRecurrenceInput(
+                    recurrence_id=recurrence.id,
+                    requested_by_participant_id="ana",
+                )
             )
         )
@@ -0,0 +1,52 @@
+"""Unit tests for failed occurrence retry backoff policy."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from compras_divididas.domain.retry_policy import RetryPolicy
+
+NOW = datetime(2026, 3, 1, 0, 0, tzinfo=UTC)
+
+
+def test_delay_doubles_per_attempt_and_is_capped() -> None:
+    policy = RetryPolicy(base_delay_seconds=60, max_delay_seconds=300)
+
+    assert [policy.delay_seconds(attempt) for attempt in range(1, 6)] == [
+        60,
+        120,
+        240,
+        300,
+        300,
+    ]
+
+
+def test_next_attempt_at_applies_symmetric_jitter() -> None:
+    policy = RetryPolicy(base_delay_seconds=100, jitter_ratio=0.2)
+
+    earliest = policy.next_attempt_at(attempt_count=1, now=NOW, random_value=0.0)
+    middle = policy.next_attempt_at(attempt_count=1, now=NOW, random_value=0.5)
+
+    assert earliest == NOW + timedelta(seconds=80)
+    assert middle == NOW + timedelta(seconds=100)
+
+
+def test_next_attempt_at_returns_none_when_attempts_are_exhausted() -> None:
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.next_attempt_at(attempt_count=2, now=NOW) is not None
+    assert policy.next_attempt_at(attempt_count=3, now=NOW) is None
+
+
+def test_retry_policy_rejects_invalid_configuration() -> None:
+    with pytest.raises(ValueError, match="max_attempts"):
+        RetryPolicy(max_attempts=0)
+
+
+def test_jittered_delay_spreads_around_the_backoff_delay() -> None:
+    policy = RetryPolicy(base_delay_seconds=1, max_delay_seconds=8, jitter_ratio=0.5)
+
+    assert policy.jittered_delay_seconds(3, random_value=0.0) == 2
+    assert policy.jittered_delay_seconds(3, random_value=0.5) == 4